@@ -2,7 +2,9 @@
 Jobsekr — Main ATS Job Scraper
 
 Reads verified companies from Supabase, hits their ATS APIs concurrently,
-parses responses, and batch-inserts jobs with deduplication.
+parses responses, and batch-inserts jobs with deduplication. Results are
+ingested as they arrive: parsed jobs are flushed to the DB in batches while
+the remaining fetches are still in flight.
 
 Usage:
     python ats_scraper.py
@@ -11,16 +13,33 @@ Usage:
     python ats_scraper.py --dry-run
     python ats_scraper.py --limit 10
     python ats_scraper.py --fresh
+    python ats_scraper.py --no-cache   # ignore ETags and content hashes
+    python ats_scraper.py --no-content # skip fetching Greenhouse descriptions for new jobs
+    python ats_scraper.py --no-details # skip the detail-fetch stage (SmartRecruiters/Workable/Rippling)
+    python ats_scraper.py --parse-workers 4
+    python ats_scraper.py --schedule --budget 500   # only companies due per scheduler.py
+    python ats_scraper.py --shard 0/4 --run-group 123   # one of 4 parallel runners
+    python ats_scraper.py --resume <run_id>   # finish a killed run from its checkpoint
+    python ats_scraper.py --deadline 12       # stop launching fetches in time to finish within 12 min
+    python ats_scraper.py --record ./rec      # save every ATS response under ./rec (implies --no-cache)
+    python ats_scraper.py --replay ./rec --dry-run --no-content   # re-parse the recording offline (implies --no-cache)
+    python ats_scraper.py --metrics-file run.json   # also write per-stage metrics to a file
+    python ats_scraper.py --dry-run --profile --profile-memory   # cProfile/slow callbacks/allocations
 """
 
 from __future__ import annotations
 
 import argparse
 import asyncio
+import contextlib
+import hashlib
 import logging
+import signal
 import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, Mapping
 
 import aiohttp
 
@@ -34,10 +53,40 @@ from config import (
     LOG_FORMAT,
     LOG_LEVEL,
     SCRAPE_CONCURRENCY,
+    SCRAPE_CONTENT_PER_JOB_MAX,
+    SCRAPE_DEADLINE_RESERVE,
+    SCRAPE_DETAIL_CANCEL_GRACE,
+    SCRAPE_DETAIL_FETCH,
+    SCRAPE_FLUSH_JOBS,
+    SCRAPE_FRESHNESS_SLO_HOURS,
+    SCRAPE_GREENHOUSE_CONTENT,
+    SCRAPE_MAX_PAGES,
+    SCRAPE_PARSE_WORKERS,
+    SCRAPE_PIPELINE_QUEUE_SIZE,
     SCRAPE_TIMEOUT,
 )
 import db
+import json_codec
+from checkpoint import Checkpoint
+from circuit_breaker import CircuitBreaker, CircuitBreakers, CircuitOpenError
+from detail_fetcher import DetailFetcher
+from metrics import RunMetrics, percentile
+import profiling
+from response_store import ResponseStore
+import scheduler
+import sharding
 from parsers import ParsedJob
+from parsers.enrich import Enricher
+from pagination import (
+    PAGINATED_ATS,
+    cursor_next_url,
+    first_page_url,
+    merge_pages,
+    offset_page_urls,
+    paging_fields,
+)
+from rate_limiter import HostRateLimiter, TokenBucket
+from retry import RETRYABLE_STATUSES, RetryBudget, parse_retry_after
 from parsers import greenhouse as greenhouse_parser
 from parsers import lever as lever_parser
 from parsers import ashby as ashby_parser
@@ -74,49 +123,420 @@ PARSERS: dict[str, Any] = {
 }
 
 
-async def scrape_company(
-    session: aiohttp.ClientSession,
-    company: dict[str, Any],
-    semaphore: asyncio.Semaphore,
-) -> tuple[str, str, list[ParsedJob], str | None]:
+@dataclass
+class ScrapeResult:
+    """Outcome of fetching and parsing one company's job board."""
+    company_id: str
+    slug: str
+    jobs: list[ParsedJob] = field(default_factory=list)
+    error: str | None = None
+    unchanged: str | None = None  # "not_modified" (HTTP 304) or "same_hash"
+    etag: str | None = None
+    last_modified: str | None = None
+    content_hash: str | None = None
+    retryable: bool = False  # transient failure (429, 5xx, timeout, dropped connection)
+    retry_after: float | None = None  # seconds, from the Retry-After header
+    attempts: int = 1
+    pages: int = 1
+    deferred: bool = False  # not fetched: the run's deadline arrived first
+    content_requests: int = 0  # phase-two Greenhouse description fetches
+    elapsed: float = 0.0  # seconds from first attempt to result, retries included
+
+
+@dataclass
+class RunStats:
+    """Counters accumulated while a scrape run streams results into the DB."""
+    jobs_parsed: int = 0
+    new_count: int = 0
+    existing_count: int = 0
+    touched_count: int = 0  # jobs kept alive on unchanged boards
+    removed_count: int = 0  # postings gone from boards since their last scrape
+    error_count: int = 0
+    deferred: int = 0  # companies left for the next run by --deadline
+    companies_with_jobs: int = 0
+    fetched: int = 0  # companies answered without error
+    not_modified: int = 0
+    same_hash: int = 0
+    recovered: int = 0  # companies that succeeded after a retry
+    extra_pages: int = 0  # pages beyond the first on paginated boards
+    content_requests: int = 0  # Greenhouse description fetches for new jobs
+    flushes: int = 0
+    write_time: float = 0.0
+    latencies: list[float] = field(default_factory=list)  # per-company ScrapeResult.elapsed
+    metrics: RunMetrics = field(default_factory=RunMetrics)
+    enricher: Enricher = field(default_factory=Enricher)  # memoizes inferred fields across the run
+
+    @property
+    def unchanged(self) -> int:
+        return self.not_modified + self.same_hash
+
+    @property
+    def skip_rate(self) -> float:
+        return self.unchanged / self.fetched * 100 if self.fetched else 0.0
+
+    def latency_percentile(self, pct: float) -> float:
+        return percentile(self.latencies, pct)
+
+
+@dataclass
+class IngestBatch:
+    """DB work buffered between flushes: job rows plus the company updates that
+    must only be written once those jobs are persisted."""
+    jobs: list[dict[str, Any]] = field(default_factory=list)
+    # Parsed boards not yet enriched / turned into rows: (jobs, fields shared by their rows)
+    boards: list[tuple[list[ParsedJob], dict[str, Any]]] = field(default_factory=list)
+    board_jobs: int = 0
+    touches: list[tuple[str, str | None]] = field(default_factory=list)  # (company_id, seen_since)
+    company_updates: list[tuple[str, dict[str, Any]]] = field(default_factory=list)
+    # Changed boards whose post_rate needs the new-job count: company_id -> (company row, job count)
+    rate_inputs: dict[str, tuple[dict[str, Any], int]] = field(default_factory=dict)
+    scraped_at: datetime | None = None
+    done: list[str] = field(default_factory=list)  # companies fetched without error, for the checkpoint
+    errors: int = 0  # companies that failed since the last flush, for the checkpoint
+
+    def __len__(self) -> int:
+        return len(self.jobs) + self.board_jobs
+
+    def __bool__(self) -> bool:
+        return bool(self.jobs or self.boards or self.touches or self.company_updates or self.done or self.errors)
+
+
+def _conditional_headers(company: dict[str, Any]) -> dict[str, str]:
+    """Build If-None-Match / If-Modified-Since headers from a company's stored validators."""
+    headers: dict[str, str] = {}
+    if company.get("http_etag"):
+        headers["If-None-Match"] = company["http_etag"]
+    if company.get("http_last_modified"):
+        headers["If-Modified-Since"] = company["http_last_modified"]
+    return headers
+
+
+@dataclass
+class ScrapeContext:
+    """Per-run state shared by every company's fetch."""
+    session: aiohttp.ClientSession
+    semaphore: asyncio.Semaphore
+    limiter: HostRateLimiter
+    retry_budget: RetryBudget
+    breakers: CircuitBreakers
+    use_cache: bool = True
+    parse_executor: Executor | None = None  # process pool for --parse-workers
+    launch_deadline: float | None = None  # time.monotonic() after which no new fetch starts
+    fetch_content: bool = SCRAPE_GREENHOUSE_CONTENT  # two-phase Greenhouse fetch
+    store: ResponseStore | None = None  # --record / --replay
+    metrics: RunMetrics = field(default_factory=RunMetrics)
+    admission: asyncio.Semaphore | None = None  # pipeline slots; held from launch until the result is ingested
+
+
+@dataclass
+class PageResponse:
+    """Status, headers and (for 200s) body of one ATS request."""
+    status: int
+    headers: Mapping[str, str]
+    body: bytes | None = None
+
+
+def parse_payload(ats: str, bodies: list[bytes], slug: str) -> tuple[list[ParsedJob], float, float]:
+    """
+    Decode a board's raw page payloads, merge them and run the ATS parser.
+    Top-level so it can be shipped to a parse worker process; raises ValueError
+    on undecodable payloads. Returns (jobs, decode seconds, parse seconds) —
+    timed here, since in a worker the caller only sees the round trip.
+    """
+    start = time.perf_counter()
+    pages = [json_codec.loads(body) for body in bodies]
+    decoded = time.perf_counter()
+    jobs = PARSERS[ats].parse_jobs(merge_pages(ats, pages), slug)
+    return jobs, decoded - start, time.perf_counter() - decoded
+
+
+async def _get(
+    ctx: ScrapeContext,
+    bucket: TokenBucket,
+    breaker: CircuitBreaker,
+    url: str,
+    headers: dict[str, str],
+    key: tuple[str, str],
+) -> PageResponse:
+    """
+    One rate-limited request. Timeouts and client errors propagate to the caller;
+    CircuitOpenError is raised without a request while the host's circuit is open.
+    `key` is (ats, name) under which --record / --replay store the response.
+    """
+    if ctx.store and ctx.store.replay:
+        return PageResponse(*ctx.store.load(*key))
+    if not breaker.allow():
+        raise CircuitOpenError(breaker.host)
+    # Wait for the host's token before taking a concurrency slot, so a throttled
+    # host never holds slots that other hosts could use
+    await bucket.acquire()
+    async with ctx.semaphore:
+        if breaker.tripped():
+            raise CircuitOpenError(breaker.host)
+        try:
+            sent = time.perf_counter()
+            async with ctx.session.get(
+                url,
+                timeout=aiohttp.ClientTimeout(total=SCRAPE_TIMEOUT),
+                headers=headers,
+            ) as resp:
+                if resp.status == 429 or resp.status >= 500:
+                    bucket.on_throttle()
+                elif resp.status < 400 or resp.status == 404:
+                    bucket.on_success()
+                if resp.status >= 500:
+                    breaker.on_failure()
+                else:
+                    breaker.on_success()
+                body = await resp.read() if resp.status == 200 else None
+                ctx.metrics.observe_request(breaker.host, time.perf_counter() - sent, len(body or b""))
+                if ctx.store:
+                    ctx.store.save(*key, url, resp.status, resp.headers, body)
+                return PageResponse(resp.status, resp.headers, body)
+        except asyncio.TimeoutError:
+            bucket.on_throttle()
+            breaker.on_failure()
+            raise
+        except aiohttp.ClientError:
+            breaker.on_failure()
+            raise
+
+
+async def _fetch_remaining_pages(
+    ctx: ScrapeContext,
+    bucket: TokenBucket,
+    breaker: CircuitBreaker,
+    ats: str,
+    slug: str,
+    first_url: str,
+    first_body: bytes,
+) -> list[PageResponse]:
+    """
+    Fetch pages 2..n of a paginated board. Offset pages are requested concurrently
+    (each still waits for the host's token); cursor pages are followed in order.
+    Only each page's paging fields are read here; parse_payload decodes the pages.
+    """
+    first_page = paging_fields(ats, first_body)
+    headers = {"Accept": "application/json"}
+
+    offset_urls = offset_page_urls(ats, first_url, first_page, SCRAPE_MAX_PAGES)
+    if offset_urls:
+        return list(await asyncio.gather(*(
+            _get(ctx, bucket, breaker, u, headers, key=(ats, f"{slug}.page{n}"))
+            for n, u in enumerate(offset_urls, start=2)
+        )))
+
+    pages: list[PageResponse] = []
+    page, url = first_page, first_url
+    while len(pages) + 1 < SCRAPE_MAX_PAGES:
+        url = cursor_next_url(ats, url, page)
+        if not url:
+            break
+        response = await _get(ctx, bucket, breaker, url, headers, key=(ats, f"{slug}.page{len(pages) + 2}"))
+        pages.append(response)
+        if response.body is None:
+            break
+        page = paging_fields(ats, response.body)
+    return pages
+
+
+def _set_http_error(result: ScrapeResult, response: PageResponse) -> None:
+    result.error = "rate limited (429)" if response.status == 429 else f"HTTP {response.status}"
+    if response.status in RETRYABLE_STATUSES:
+        result.retryable = True
+        result.retry_after = parse_retry_after(response.headers.get("Retry-After"))
+
+
+async def scrape_company(ctx: ScrapeContext, company: dict[str, Any]) -> ScrapeResult:
     company_id: str = company["id"]
     slug: str = company["slug"]
     ats: str = company["ats"]
     api_url: str = company.get("api_url", "")
+    result = ScrapeResult(company_id=company_id, slug=slug)
 
     if not api_url:
-        return company_id, slug, [], "no api_url"
+        result.error = "no api_url"
+        return result
+
+    if ats not in PARSERS:
+        result.error = f"no parser for {ats}"
+        return result
+
+    headers = {"Accept": "application/json"}
+    # Validators and hashes are only trusted once the company has a completed scrape on record
+    use_cache = ctx.use_cache and bool(company.get("last_scraped_at"))
+    # Page one's validators say nothing about later pages, so paginated boards rely on
+    # the content hash over every page instead of conditional GETs
+    paginated = ats in PAGINATED_ATS
+    if use_cache and not paginated:
+        headers.update(_conditional_headers(company))
+
+    bucket = ctx.limiter.get(ats, api_url)
+    breaker = ctx.breakers.get(ats, api_url)
+    bodies: list[bytes] = []
+    try:
+        url = first_page_url(ats, api_url)
+        response = await _get(ctx, bucket, breaker, url, headers, key=(ats, slug))
+
+        if response.status == 200:
+            bodies.append(response.body or b"")
+            if paginated:
+                for page in await _fetch_remaining_pages(ctx, bucket, breaker, ats, slug, url, bodies[0]):
+                    if page.body is None:
+                        # A missing page would store a truncated board and its hash
+                        _set_http_error(result, page)
+                        return result
+                    bodies.append(page.body)
+            else:
+                result.etag = response.headers.get("ETag")
+                result.last_modified = response.headers.get("Last-Modified")
+        elif response.status == 304:
+            result.unchanged = "not_modified"
+            result.etag = response.headers.get("ETag") or company.get("http_etag")
+            result.last_modified = (
+                response.headers.get("Last-Modified") or company.get("http_last_modified")
+            )
+            result.content_hash = company.get("content_hash")
+        elif response.status == 404:
+            pass
+        else:
+            _set_http_error(result, response)
+    except CircuitOpenError as e:
+        # Fast fail: not retried, the host gets its probe from whichever company comes next
+        result.error = str(e)
+    except asyncio.TimeoutError:
+        result.error = "timeout"
+        result.retryable = True
+    except aiohttp.ClientError as e:
+        result.error = f"connection error: {e}"
+        result.retryable = True
+    except ValueError as e:
+        result.error = f"json decode error: {e}"
+    except Exception as e:
+        result.error = f"unexpected error: {e}"
+
+    if not bodies or result.error:
+        return result
+    result.pages = len(bodies)
+
+    # Hash and parse after releasing the slot — parsing is CPU work, not I/O
+    digest = hashlib.sha256()
+    for body in bodies:
+        digest.update(body)
+    result.content_hash = digest.hexdigest()
+    # Most ATSes send no validators — an identical payload is just as good as a 304
+    if use_cache and result.content_hash == company.get("content_hash"):
+        result.unchanged = "same_hash"
+        return result
 
-    parser = PARSERS.get(ats)
-    if not parser:
-        return company_id, slug, [], f"no parser for {ats}"
+    try:
+        result.jobs = await _parse(ctx, ats, bodies, slug)
+    except ValueError as e:
+        result.error = f"json decode error: {e}"
+    except Exception as e:
+        result.error = f"unexpected error: {e}"
 
-    async with semaphore:
+    if ats == "greenhouse" and ctx.fetch_content and result.jobs:
         try:
-            async with session.get(
-                api_url,
-                timeout=aiohttp.ClientTimeout(total=SCRAPE_TIMEOUT),
-                headers={"Accept": "application/json"},
-            ) as resp:
-                if resp.status == 200:
-                    try:
-                        data = await resp.json(content_type=None)
-                    except Exception as e:
-                        return company_id, slug, [], f"json decode error: {e}"
-                    jobs = parser.parse_jobs(data, slug)
-                    return company_id, slug, jobs, None
-                elif resp.status == 404:
-                    return company_id, slug, [], None
-                elif resp.status == 429:
-                    return company_id, slug, [], "rate limited (429)"
-                else:
-                    return company_id, slug, [], f"HTTP {resp.status}"
-        except asyncio.TimeoutError:
-            return company_id, slug, [], "timeout"
-        except aiohttp.ClientError as e:
-            return company_id, slug, [], f"connection error: {e}"
-        except Exception as e:
-            return company_id, slug, [], f"unexpected error: {e}"
+            result.content_requests = await _fetch_new_job_content(ctx, bucket, breaker, api_url, slug, result.jobs)
+        except (asyncio.TimeoutError, aiohttp.ClientError, CircuitOpenError, ValueError) as e:
+            # The listing is still good — these jobs just go in without descriptions
+            logger.debug("Content fetch failed for %s: %s", slug, e)
+
+    return result
+
+
+async def _parse(ctx: ScrapeContext, ats: str, bodies: list[bytes], slug: str) -> list[ParsedJob]:
+    if ctx.parse_executor is not None:
+        loop = asyncio.get_running_loop()
+        jobs, decode_time, parse_time = await loop.run_in_executor(ctx.parse_executor, parse_payload, ats, bodies, slug)
+    else:
+        jobs, decode_time, parse_time = parse_payload(ats, bodies, slug)
+    ctx.metrics.add("decode", decode_time, len(bodies), sum(len(body) for body in bodies))
+    ctx.metrics.add("parse", parse_time, len(jobs))
+    return jobs
+
+
+async def _fetch_new_job_content(
+    ctx: ScrapeContext,
+    bucket: TokenBucket,
+    breaker: CircuitBreaker,
+    api_url: str,
+    slug: str,
+    jobs: list[ParsedJob],
+) -> int:
+    """
+    Phase two of a Greenhouse fetch: replace listing-only jobs that aren't in the
+    DB yet with their full-content versions. Existing jobs only get last_seen
+    bumped on insert, so their descriptions are never needed again.
+    Returns the number of requests made.
+    """
+    index = {db.hash_url(job.url): i for i, job in enumerate(jobs)}
+    try:
+        known = await asyncio.to_thread(db.existing_url_hashes, list(index))
+    except Exception:
+        known = set()  # fetch content for all of them; ingest sorts out which are new
+    new = [i for url_hash, i in index.items() if url_hash not in known]
+    if not new:
+        return 0
+
+    headers = {"Accept": "application/json"}
+    base = api_url.split("?")[0].rstrip("/")
+    if len(new) > SCRAPE_CONTENT_PER_JOB_MAX:
+        # Many new jobs (or a new board): one full-content request beats N small ones
+        response = await _get(ctx, bucket, breaker, f"{base}?content=true", headers, key=("greenhouse", f"{slug}.content"))
+        if response.body is not None:
+            by_url = {job.url: job for job in await _parse(ctx, "greenhouse", [response.body], slug)}
+            for i in new:
+                jobs[i] = by_url.get(jobs[i].url, jobs[i])
+        return 1
+
+    targets = [i for i in new if jobs[i].raw_data.get("id")]
+    responses = await asyncio.gather(
+        *(
+            _get(ctx, bucket, breaker, f"{base}/{job_id}", headers, key=("greenhouse", f"{slug}.job{job_id}"))
+            for job_id in (jobs[i].raw_data["id"] for i in targets)
+        ),
+        return_exceptions=True,
+    )
+    for i, response in zip(targets, responses):
+        if isinstance(response, PageResponse) and response.body is not None:
+            detailed = greenhouse_parser.parse_jobs([json_codec.loads(response.body)], slug)
+            if detailed:
+                jobs[i] = detailed[0]
+    return len(targets)
+
+
+async def scrape_with_retry(ctx: ScrapeContext, company: dict[str, Any]) -> ScrapeResult:
+    """
+    Scrape a company, re-queueing it after a backoff on transient failures.
+    The wait happens outside the semaphore and without the company's admission
+    slot, so a retrying company holds neither a connection nor a pipeline slot.
+    """
+    started = time.monotonic()
+    attempt = 0
+    while True:
+        result = await scrape_company(ctx, company)
+        if not result.retryable:
+            break
+        reason = (result.error or "unknown").split(":")[0]
+        delay = ctx.retry_budget.next_delay(attempt, reason, result.retry_after)
+        if delay is None:
+            break
+        if ctx.launch_deadline and time.monotonic() + delay >= ctx.launch_deadline:
+            break
+        logger.debug("Retrying %s in %.1fs after %s (attempt %d)", result.slug, delay, reason, attempt + 1)
+        if ctx.admission:
+            ctx.admission.release()
+            await asyncio.sleep(delay)
+            await ctx.admission.acquire()
+        else:
+            await asyncio.sleep(delay)
+        attempt += 1
+
+    result.attempts = attempt + 1
+    result.elapsed = time.monotonic() - started
+    return result
 
 
 async def run_scraper(
@@ -125,16 +545,77 @@ async def run_scraper(
     limit: int | None = None,
     dry_run: bool = False,
     fresh: bool = True,
-) -> None:
-    companies = db.get_verified_companies(ats=ats_filter)
+    use_cache: bool = True,
+    parse_workers: int = SCRAPE_PARSE_WORKERS,
+    fetch_content: bool = SCRAPE_GREENHOUSE_CONTENT,
+    fetch_details: bool = SCRAPE_DETAIL_FETCH,
+    schedule: bool = False,
+    budget: int | None = None,
+    slo_hours: float = SCRAPE_FRESHNESS_SLO_HOURS,
+    shard: tuple[int, int] | None = None,
+    run_group: str | None = None,
+    resume: str | None = None,
+    deadline: float | None = None,
+    record_dir: str | None = None,
+    replay_dir: str | None = None,
+    metrics_file: str | None = None,
+    company_rows: list[dict[str, Any]] | None = None,
+) -> RunStats | None:
+    """
+    Scrape, parse and ingest. `company_rows` replaces the DB company lookup
+    (load tests). Per-stage metrics go to scrape_runs.metrics and, if given,
+    `metrics_file`. Returns the run's stats, or None if there was nothing to scrape.
+    """
+    run_start = time.monotonic()
+    launch_deadline = run_start + deadline * 60 - SCRAPE_DEADLINE_RESERVE if deadline else None
+    store: ResponseStore | None = None
+    if replay_dir:
+        store = ResponseStore(replay_dir, replay=True)
+    elif record_dir:
+        store = ResponseStore(record_dir)
+    if store:
+        # A recording needs full bodies and a replay has to reach the parsers, so no
+        # conditional GETs and no same-hash skips: every board is fetched and parsed
+        use_cache = False
+
+    checkpoint = Checkpoint.load(resume) if resume else None
+    if checkpoint:
+        # A resumed shard must not pick up the other shards' companies under its own run row
+        ats_filter, company_filter, shard = checkpoint.filters(ats_filter, company_filter, shard)
+
+    companies = company_rows
+    if companies is None and store and store.replay:
+        companies = store.load_companies()
+    if companies is None:
+        companies = db.get_verified_companies(ats=ats_filter)
+    elif ats_filter:
+        companies = [c for c in companies if c["ats"] == ats_filter]
 
     if company_filter:
         companies = [c for c in companies if c["slug"] == company_filter.lower()]
+    if checkpoint:
+        companies = [c for c in companies if c["id"] not in checkpoint.done]
+    if shard:
+        total = len(companies)
+        companies = sharding.filter_shard(companies, *shard)
+        logger.info("Shard %d/%d: %d of %d companies", shard[0], shard[1], len(companies), total)
+    if schedule:
+        companies = scheduler.select_due_companies(companies, slo_hours=slo_hours, budget=budget)
+    elif deadline:
+        # Most valuable companies first, so whatever the budget cuts off matters least
+        companies = scheduler.prioritize(companies, slo_hours=slo_hours)
     if limit:
         companies = companies[:limit]
     if not companies:
+        if checkpoint and not dry_run:
+            logger.info("Every company of run %s is already done", checkpoint.run_id)
+            _finish_resumed_run(checkpoint)
+            return None
         logger.warning("No companies to scrape")
-        return
+        return None
+    if store and not store.replay:
+        store.save_companies(companies)
+    profiling.mark("companies")
 
     ats_counts: dict[str, int] = {}
     for c in companies:
@@ -144,102 +625,442 @@ async def run_scraper(
     for ats, count in sorted(ats_counts.items(), key=lambda x: -x[1]):
         logger.info("  %s: %d companies", ats, count)
 
-    run_id: str | None = None
-    if not dry_run:
+    run_id: str | None = checkpoint.run_id if checkpoint else None
+    if not dry_run and not checkpoint:
         run_id = db.start_scrape_run(
             source="ats_scraper",
-            config={"ats_filter": ats_filter, "company_count": len(companies)},
+            config={
+                "ats_filter": ats_filter,
+                "company_count": len(companies),
+                "schedule": schedule,
+                "slo_hours": slo_hours if schedule else None,
+                "deadline_minutes": deadline,
+            },
+            run_group=run_group,
+            shard=shard,
         )
 
-    # Fetch all jobs concurrently
+    # Fetch concurrently and ingest as results arrive
     start_time = time.monotonic()
-    semaphore = asyncio.Semaphore(SCRAPE_CONCURRENCY)
-    connector = aiohttp.TCPConnector(limit=SCRAPE_CONCURRENCY, limit_per_host=3)
+    # Recorded as last_scraped_at: every job seen by this run has last_seen >= this
+    scrape_started = datetime.now(timezone.utc)
+    if checkpoint and checkpoint.started_at:
+        scrape_started = datetime.fromisoformat(checkpoint.started_at)
+    scrape_started_at = scrape_started.isoformat()
+    if run_id and not checkpoint and not dry_run:
+        checkpoint = Checkpoint.create(run_id, scrape_started_at, config={
+            "ats_filter": ats_filter,
+            "company_filter": company_filter,
+            "shard": list(shard) if shard else None,
+        })
+    limiter = HostRateLimiter()
+    retry_budget = RetryBudget.for_run(len(companies))
+    breakers = CircuitBreakers()
+    parse_executor = ProcessPoolExecutor(max_workers=parse_workers) if parse_workers > 0 else None
+    if parse_executor:
+        logger.info("Parsing in %d worker processes", parse_workers)
+    logger.info("Decoding JSON with %s", json_codec.DECODER_NAME)
+    # Bounds fetched-but-not-ingested results, so memory doesn't grow with company count
+    admission = asyncio.Semaphore(SCRAPE_PIPELINE_QUEUE_SIZE)
+    company_map = {c["id"]: c for c in companies}
+    stats = RunStats()
+    if checkpoint:
+        for name, value in checkpoint.totals.items():
+            setattr(stats, name, value)
+    batch = IngestBatch(scraped_at=scrape_started)
+    flushing: asyncio.Task[None] | None = None
 
-    async with aiohttp.ClientSession(connector=connector) as session:
-        tasks = [scrape_company(session, c, semaphore) for c in companies]
-        results = await asyncio.gather(*tasks)
+    async def fetch(ctx: ScrapeContext, company: dict[str, Any]) -> ScrapeResult:
+        await admission.acquire()
+        if ctx.launch_deadline and time.monotonic() >= ctx.launch_deadline:
+            return ScrapeResult(company_id=company["id"], slug=company["slug"], deferred=True)
+        return await scrape_with_retry(ctx, company)
 
-    fetch_time = time.monotonic() - start_time
-    logger.info("API fetching done in %.1fs", fetch_time)
+    # Per-host pacing is done by the limiter; the connector only caps total sockets
+    connector = aiohttp.TCPConnector(limit=SCRAPE_CONCURRENCY)
 
-    # Collect all jobs into a flat list for batch insert
-    all_jobs: list[dict[str, Any]] = []
-    error_count = 0
-    companies_with_jobs = 0
-    company_map = {c["id"]: c for c in companies}
+    # Treat SIGTERM (runner timeout/cancel) like Ctrl-C: flush what we have, then exit
+    with contextlib.suppress(NotImplementedError, RuntimeError):
+        current = asyncio.current_task()
+        if current:
+            asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, current.cancel)
 
-    for company_id, slug, parsed_jobs, error in results:
-        if error:
-            error_count += 1
-            if error not in ("no api_url",) and "404" not in str(error):
-                logger.warning("Error scraping %s: %s", slug, error)
-            continue
+    # New SmartRecruiters/Workable/Rippling jobs get descriptions in a separate, slower stage
+    details = DetailFetcher() if fetch_details and not dry_run else None
+    if details:
+        await details.start()
 
-        if not parsed_jobs:
-            continue
+    try:
+        async with aiohttp.ClientSession(connector=connector) as session:
+            ctx = ScrapeContext(
+                session=session,
+                semaphore=asyncio.Semaphore(SCRAPE_CONCURRENCY),
+                limiter=limiter,
+                retry_budget=retry_budget,
+                breakers=breakers,
+                use_cache=use_cache,
+                parse_executor=parse_executor,
+                launch_deadline=launch_deadline,
+                fetch_content=fetch_content,
+                store=store,
+                metrics=stats.metrics,
+                admission=admission,
+            )
+            # Tasks are created in priority order; admission then starts them in that order.
+            # Only unfinished tasks are referenced: a finished one holds its ScrapeResult
+            # (and every job's raw_data), so it must be freed once the result is collected
+            pending: set[asyncio.Task[ScrapeResult]] = set()
+            finished: asyncio.Queue[asyncio.Task[ScrapeResult]] = asyncio.Queue()
 
-        companies_with_jobs += 1
-        company_info = company_map.get(company_id, {})
-        company_name = company_info.get("name")
-        ats_source = company_info.get("ats") or "unknown"
-
-        for job in parsed_jobs:
-            all_jobs.append({
-                "url": job.url,
-                "title": job.title,
-                "ats_source": ats_source,
-                "company_name": company_name,
-                "company_id": company_id,
-                "location": job.location,
-                "description": job.description,
-                "salary_min": job.salary_min,
-                "salary_max": job.salary_max,
-                "remote_type": job.remote_type,
-                "seniority": job.seniority,
-                "category": job.category,
-                "tags": job.tags,
-                "posted_at": job.posted_at,
-                "raw_data": job.raw_data,
-            })
-
-    logger.info("Total jobs parsed: %d from %d companies", len(all_jobs), companies_with_jobs)
+            def on_done(task: asyncio.Task[ScrapeResult]) -> None:
+                pending.discard(task)
+                finished.put_nowait(task)
 
-    if dry_run:
-        logger.info("[DRY RUN] Would insert/update %d jobs", len(all_jobs))
-        return
+            for c in companies:
+                task = asyncio.create_task(fetch(ctx, c))
+                pending.add(task)
+                task.add_done_callback(on_done)
+            for _ in range(len(companies)):
+                result = (await finished.get()).result()
+                _collect_result(result, company_map, scrape_started_at, stats, batch)
+                admission.release()
+                if len(batch) >= SCRAPE_FLUSH_JOBS:
+                    # Shielded, and the batch handed off before the await: a cancel landing
+                    # mid-write must neither abandon the write nor start a second one
+                    flushing = asyncio.create_task(_flush(batch, stats, dry_run, checkpoint, details))
+                    batch = IngestBatch(scraped_at=scrape_started)
+                    await asyncio.shield(flushing)
+    except asyncio.CancelledError:
+        if flushing:
+            await flushing
+        if batch:
+            await _flush(batch, stats, dry_run, checkpoint, details)
+        if details:
+            # Brief grace: the companies just flushed count as done, so a resume won't
+            # see their new jobs as new and queue their descriptions again
+            await details.close(timeout=SCRAPE_DETAIL_CANCEL_GRACE)
+        stats.metrics.wall_seconds["run"] = time.monotonic() - run_start
+        if run_id:
+            logger.warning("Interrupted — progress checkpointed; finish with --resume %s", run_id)
+            _finish_run(run_id, stats, "partial", checkpoint)
+        if checkpoint:
+            checkpoint.record_finish("partial", stats.metrics.to_dict())
+        if metrics_file:
+            stats.metrics.write_json(metrics_file, {"run_id": run_id, "status": "partial"})
+        raise
+    except Exception:
+        if details:
+            await details.close(timeout=0)
+        raise
+    finally:
+        if parse_executor:
+            parse_executor.shutdown(cancel_futures=True)
 
-    # Batch insert
-    insert_start = time.monotonic()
-    new_count, existing_count = db.batch_insert_jobs(all_jobs)
-    insert_time = time.monotonic() - insert_start
-
-    # Update company metadata in batch
-    now = datetime.now(timezone.utc).isoformat()
-    for company_id, slug, parsed_jobs, error in results:
-        if parsed_jobs:
-            db.update_company(company_id, {
-                "last_scraped_at": now,
-                "job_count": len(parsed_jobs),
-                "verified": True,
-            })
+    fetch_time = time.monotonic() - start_time
+    profiling.mark("fetch")
+    if batch:
+        await _flush(batch, stats, dry_run, checkpoint, details)
+    if details:
+        # Under --deadline the detail stage only gets what is left before the launch cutoff
+        await details.close(timeout=max(0.0, launch_deadline - time.monotonic()) if launch_deadline else None)
+    profiling.mark("ingest")
+
+    logger.info("API fetching done in %.1fs", fetch_time)
+    logger.info("Per-host rates at end of run:")
+    limiter.log_summary()
+    retry_budget.log_summary()
+    breakers.log_summary()
+    logger.info("Companies recovered by retry: %d", stats.recovered)
+    logger.info("Company latency: p50 %.2fs, p95 %.2fs, p99 %.2fs",
+                stats.latency_percentile(50), stats.latency_percentile(95), stats.latency_percentile(99))
+    if stats.deferred:
+        logger.warning("Deadline reached: %d companies deferred to the next run", stats.deferred)
+    logger.info("Total jobs parsed: %d from %d companies (%d extra pages on paginated boards)",
+                stats.jobs_parsed, stats.companies_with_jobs, stats.extra_pages)
+    if stats.content_requests:
+        logger.info("Greenhouse content requests for new jobs: %d", stats.content_requests)
+    if details:
+        details.log_summary()
+    if store:
+        store.log_summary()
+    logger.info(
+        "Unchanged boards: %d (304: %d, same hash: %d) — skip rate %.0f%%",
+        stats.unchanged, stats.not_modified, stats.same_hash, stats.skip_rate,
+    )
+    stats.metrics.wall_seconds["fetch_phase"] = fetch_time
+    stats.metrics.wall_seconds["run"] = time.monotonic() - run_start
+    stats.metrics.log_summary()
+    stats.enricher.log_summary()
+
+    if dry_run:
+        logger.info("[DRY RUN] Would insert/update %d jobs", stats.jobs_parsed)
+        if metrics_file:
+            stats.metrics.write_json(metrics_file, {"run_id": None, "status": "dry_run"})
+        return stats
 
     elapsed = time.monotonic() - start_time
 
     logger.info("=== SCRAPE COMPLETE ===")
-    logger.info("Total time: %.1fs (fetch: %.1fs, insert: %.1fs)", elapsed, fetch_time, insert_time)
-    logger.info("Companies: %d scraped / %d total", companies_with_jobs, len(companies))
-    logger.info("Jobs: %d new, %d existing, %d errors", new_count, existing_count, error_count)
+    logger.info("Total time: %.1fs (fetch: %.1fs, db writes: %.1fs in %d flushes, overlapped)",
+                elapsed, fetch_time, stats.write_time, stats.flushes)
+    logger.info("Companies: %d scraped, %d unchanged / %d total (skip rate %.0f%%)",
+                stats.companies_with_jobs, stats.unchanged, len(companies), stats.skip_rate)
+    logger.info("Jobs: %d new, %d existing, %d unchanged, %d removed, %d errors",
+                stats.new_count, stats.existing_count, stats.touched_count,
+                stats.removed_count, stats.error_count)
     logger.info("Total jobs in DB: %d", db.get_job_count(active_only=False))
 
+    status = "partial" if stats.deferred else "completed"
     if run_id:
-        db.finish_scrape_run(
-            run_id=run_id,
-            total_found=len(all_jobs),
-            new_found=new_count,
-            errors=error_count,
-            status="completed",
-        )
+        _finish_run(run_id, stats, status, checkpoint)
+    if metrics_file:
+        stats.metrics.write_json(metrics_file, {"run_id": run_id, "status": status})
+    if checkpoint:
+        checkpoint.record_finish(status)
+    if run_group:
+        group = db.get_run_group_totals(run_group)
+        if group:
+            logger.info(
+                "Run group %s: %d/%s shards finished — total=%d new=%d errors=%d status=%s",
+                run_group, group["shards_finished"], group["shard_count"],
+                group["total_found"], group["new_found"], group["errors"], group["status"],
+            )
+    return stats
+
+
+def _finish_run(run_id: str, stats: RunStats, status: str, checkpoint: Checkpoint | None = None) -> None:
+    db.finish_scrape_run(
+        run_id=run_id,
+        total_found=stats.jobs_parsed + stats.touched_count,
+        new_found=stats.new_count,
+        errors=stats.error_count,
+        status=status,
+        metrics=_run_metrics(stats.metrics, checkpoint),
+    )
+
+
+def _finish_resumed_run(checkpoint: Checkpoint) -> None:
+    """Close the scrape_runs row of a resumed run whose companies were all done already."""
+    totals = checkpoint.totals
+    db.finish_scrape_run(
+        run_id=checkpoint.run_id,
+        total_found=totals["jobs_parsed"] + totals["touched_count"],
+        new_found=totals["new_count"],
+        errors=totals["error_count"],
+        status="completed",
+        metrics=_run_metrics(RunMetrics(), checkpoint),
+    )
+    checkpoint.record_finish("completed")
+
+
+def _run_metrics(metrics: RunMetrics, checkpoint: Checkpoint | None) -> dict[str, Any]:
+    """This process's metrics, plus those of the processes a resumed run was interrupted in."""
+    data = metrics.to_dict()
+    if checkpoint and checkpoint.earlier_metrics:
+        data["earlier_processes"] = checkpoint.earlier_metrics
+    return data
+
+
+def _collect_result(
+    result: ScrapeResult,
+    company_map: dict[str, dict[str, Any]],
+    scraped_at: str,
+    stats: RunStats,
+    batch: IngestBatch,
+) -> None:
+    """Fold one company's result into the run stats and the pending ingest batch."""
+    if result.deferred:
+        stats.deferred += 1
+        return
+    stats.latencies.append(result.elapsed)
+
+    if result.attempts > 1 and not result.error:
+        stats.recovered += 1
+
+    if result.error:
+        stats.error_count += 1
+        batch.errors += 1
+        # Fast-failed companies are reported per host by the breaker summary
+        quiet = result.error == "no api_url" or result.error.startswith("circuit open")
+        if not quiet and "404" not in result.error:
+            logger.warning("Error scraping %s: %s", result.slug, result.error)
+        return
+
+    stats.fetched += 1
+    stats.extra_pages += result.pages - 1
+    stats.content_requests += result.content_requests
+    batch.done.append(result.company_id)
+    company_info = company_map.get(result.company_id, {})
+    validators = {
+        "last_scraped_at": scraped_at,
+        "http_etag": result.etag,
+        "http_last_modified": result.last_modified,
+        "content_hash": result.content_hash,
+    }
+
+    if result.unchanged:
+        if result.unchanged == "not_modified":
+            stats.not_modified += 1
+        else:
+            stats.same_hash += 1
+        # Keep the board's jobs alive without re-parsing or re-hashing
+        batch.touches.append((result.company_id, company_info.get("last_scraped_at")))
+        batch.company_updates.append((result.company_id, {
+            **validators,
+            "post_rate": scheduler.next_post_rate(company_info, 0, 0, batch.scraped_at),
+        }))
+        return
+
+    if not result.jobs:
+        return
+
+    stats.companies_with_jobs += 1
+    stats.jobs_parsed += len(result.jobs)
+    # Enriched and turned into rows per batch at flush time, off the event loop
+    batch.boards.append((result.jobs, {
+        "ats_source": company_info.get("ats") or "unknown",
+        "company_name": company_info.get("name"),
+        "company_id": result.company_id,
+        "company_slug": result.slug,
+    }))
+    batch.board_jobs += len(result.jobs)
+
+    batch.company_updates.append((result.company_id, {
+        **validators,
+        "job_count": len(result.jobs),
+        "verified": True,
+    }))
+    batch.rate_inputs[result.company_id] = (company_info, len(result.jobs))
+
+
+async def _flush(
+    batch: IngestBatch,
+    stats: RunStats,
+    dry_run: bool,
+    checkpoint: Checkpoint | None = None,
+    details: DetailFetcher | None = None,
+) -> None:
+    """Write a batch in a worker thread so fetches keep running during the DB round-trips."""
+    if batch.boards:
+        # Enrichment is CPU work: keep it off the event loop, like parsing
+        await asyncio.to_thread(_build_rows, batch, stats.enricher, stats.metrics)
+    if dry_run:
+        return
+    flush_start = time.monotonic()
+    new_count, existing_count, touched_count, removed_count, failed = await asyncio.to_thread(
+        _write_batch, batch, stats.metrics
+    )
+    if failed:
+        logger.warning("DB writes failed for %d companies; their boards are re-ingested next run", len(failed))
+    stats.error_count += len(failed)
+    stats.new_count += new_count
+    stats.removed_count += removed_count
+    stats.existing_count += existing_count
+    stats.touched_count += touched_count
+    stats.flushes += 1
+    stats.write_time += time.monotonic() - flush_start
+    if checkpoint:
+        # Only after the writes above are committed, so "done" never runs ahead of the DB
+        checkpoint.record_flush([c for c in batch.done if c not in failed], {
+            "jobs_parsed": len(batch.jobs),
+            "new_count": new_count,
+            "existing_count": existing_count,
+            "touched_count": touched_count,
+            "removed_count": removed_count,
+            "error_count": batch.errors + len(failed),
+        })
+    if details:
+        # batch_insert_jobs has flagged which jobs are new
+        for job in batch.jobs:
+            if not job.get("write_failed"):
+                details.submit(job)
+
+
+def _build_rows(batch: IngestBatch, enricher: Enricher, metrics: RunMetrics) -> None:
+    """Enrich the batch's parsed jobs in one column-wise pass and turn them into job rows."""
+    jobs = [job for board_jobs, _ in batch.boards for job in board_jobs]
+    with metrics.stage("enrich", items=len(jobs)):
+        enricher.enrich(jobs)
+    with metrics.stage("transform", items=len(jobs)):
+        for board_jobs, shared in batch.boards:
+            batch.jobs.extend(
+                {
+                    "url": job.url,
+                    "title": job.title,
+                    **shared,
+                    "location": job.location,
+                    "description": job.description,
+                    "salary_min": job.salary_min,
+                    "salary_max": job.salary_max,
+                    "salary_currency": job.salary_currency,
+                    "salary_interval": job.salary_interval,
+                    "remote_type": job.remote_type,
+                    "seniority": job.seniority,
+                    "category": job.category,
+                    "tags": job.tags,
+                    "posted_at": job.posted_at,
+                    "raw_data": job.raw_data,
+                }
+                for job in board_jobs
+            )
+    batch.boards = []
+    batch.board_jobs = 0
+
+
+def _write_batch(batch: IngestBatch, metrics: RunMetrics) -> tuple[int, int, int, int, set[str]]:
+    """
+    Blocking DB writes for one batch. Returns (new, existing, touched, removed)
+    job counts and the ids of companies whose job writes failed.
+    """
+    new_count = existing_count = 0
+    if batch.jobs:
+        with metrics.stage("dedup_check", items=len(batch.jobs)):
+            for job in batch.jobs:
+                job["url_hash"] = db.hash_url(job["url"])
+            try:
+                existing = db.existing_url_hashes([job["url_hash"] for job in batch.jobs])
+            except Exception:
+                existing = None
+        if existing is None:
+            for job in batch.jobs:
+                job["write_failed"] = True
+        else:
+            with metrics.stage("insert", items=len(batch.jobs)):
+                new_count, existing_count = db.batch_insert_jobs(batch.jobs, existing=existing)
+    failed = {job["company_id"] for job in batch.jobs if job.get("write_failed")}
+    touched_count = 0
+    if batch.touches:
+        with metrics.stage("touch", items=len(batch.touches)):
+            for company_id, seen_since in batch.touches:
+                touched = db.touch_company_jobs(company_id, seen_since=seen_since)
+                if touched is None:
+                    failed.add(company_id)
+                else:
+                    touched_count += touched
+
+    # Per-company change counts feed the scheduler's post-rate estimate
+    new_by_company: dict[str, int] = {}
+    for job in batch.jobs:
+        if job.get("is_new"):
+            new_by_company[job["company_id"]] = new_by_company.get(job["company_id"], 0) + 1
+    removed_count = 0
+    for company_id, updates in batch.company_updates:
+        if company_id not in batch.rate_inputs or company_id in failed:
+            continue
+        company_info, job_count = batch.rate_inputs[company_id]
+        new = new_by_company.get(company_id, 0)
+        removed = max(0, (company_info.get("job_count") or 0) - (job_count - new))
+        removed_count += removed
+        updates["post_rate"] = scheduler.next_post_rate(company_info, new, removed, batch.scraped_at)
+
+    # Company rows last, so last_scraped_at/content_hash never get ahead of the jobs;
+    # a company whose jobs didn't make it keeps its old validators and is re-ingested
+    company_updates = [(company_id, updates) for company_id, updates in batch.company_updates if company_id not in failed]
+    if company_updates:
+        with metrics.stage("company_update", items=len(company_updates)):
+            for company_id, updates in company_updates:
+                db.update_company(company_id, updates)
+    return new_count, existing_count, touched_count, removed_count, failed
 
 
 def main() -> None:
@@ -249,16 +1070,62 @@ def main() -> None:
     parser.add_argument("--limit", type=int, default=None)
     parser.add_argument("--dry-run", action="store_true")
     parser.add_argument("--fresh", action="store_true")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="Ignore stored ETag/Last-Modified/content hash and re-ingest every board")
+    parser.add_argument("--no-content", action="store_true",
+                        help="Skip the second Greenhouse phase that fetches descriptions for new jobs")
+    parser.add_argument("--no-details", action="store_true",
+                        help="Skip the detail-fetch stage for new SmartRecruiters/Workable/Rippling jobs")
+    parser.add_argument("--parse-workers", type=int, default=SCRAPE_PARSE_WORKERS, metavar="N",
+                        help="Decode and parse payloads in N worker processes (0 = on the event loop)")
+    parser.add_argument("--schedule", action="store_true",
+                        help="Only scrape companies due by estimated change rate / freshness SLO")
+    parser.add_argument("--budget", type=int, default=None, metavar="N",
+                        help="With --schedule, scrape at most N due companies (most changes expected first)")
+    parser.add_argument("--shard", type=sharding.parse_shard, default=None, metavar="I/N",
+                        help="Scrape only shard I (0-based) of N, split by consistent hash of (ats, slug)")
+    parser.add_argument("--run-group", type=str, default=None,
+                        help="Id shared by the shards of one parallel run, for merged totals")
+    parser.add_argument("--resume", type=str, default=None, metavar="RUN_ID",
+                        help="Resume a killed run from its checkpoint, skipping companies already done "
+                             "(its --ats / --company / --shard are reused)")
+    parser.add_argument("--deadline", type=float, default=None, metavar="MINUTES",
+                        help="Time budget: highest-priority companies first, stop launching fetches "
+                             "in time to flush, finish the run as 'partial' if any were left")
+    parser.add_argument("--record", type=str, default=None, metavar="DIR",
+                        help="Save every ATS response (gzipped body + status/headers) under DIR")
+    parser.add_argument("--replay", type=str, default=None, metavar="DIR",
+                        help="Serve ATS responses from a --record directory instead of the network")
+    parser.add_argument("--slo-hours", type=float, default=SCRAPE_FRESHNESS_SLO_HOURS,
+                        help="With --schedule, max hours any board may go unscraped")
+    parser.add_argument("--metrics-file", type=str, default=None, metavar="PATH",
+                        help="Also write the run's per-stage metrics (as stored in scrape_runs.metrics) to PATH")
+    profiling.add_profile_args(parser)
 
     args = parser.parse_args()
 
-    asyncio.run(run_scraper(
-        ats_filter=args.ats,
-        company_filter=args.company,
-        limit=args.limit,
-        dry_run=args.dry_run,
-        fresh=args.fresh,
-    ))
+    with profiling.session("ats_scraper", args) as profile:
+        asyncio.run(profile.watch(run_scraper(
+            ats_filter=args.ats,
+            company_filter=args.company,
+            limit=args.limit,
+            dry_run=args.dry_run,
+            fresh=args.fresh,
+            use_cache=not args.no_cache,
+            parse_workers=args.parse_workers,
+            fetch_content=SCRAPE_GREENHOUSE_CONTENT and not args.no_content,
+            fetch_details=SCRAPE_DETAIL_FETCH and not args.no_details,
+            schedule=args.schedule,
+            budget=args.budget,
+            slo_hours=args.slo_hours,
+            shard=args.shard,
+            run_group=args.run_group,
+            resume=args.resume,
+            deadline=args.deadline,
+            record_dir=args.record,
+            replay_dir=args.replay,
+            metrics_file=args.metrics_file,
+        )))
 
 
 if __name__ == "__main__":
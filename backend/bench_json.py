@@ -0,0 +1,107 @@
+"""
+Jobsekr — JSON Decoder Benchmark
+
+Compares the decoders available in json_codec on ATS board payloads.
+Payloads are read from a directory of *.json / *.json.gz files (e.g. an
+`ats_scraper.py --record` directory); without one, synthetic Greenhouse-shaped
+boards are used.
+
+Usage:
+    python bench_json.py
+    python bench_json.py --payload-dir ./payloads
+    python bench_json.py --repeat 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import gzip
+import json
+import logging
+import time
+from pathlib import Path
+
+from config import LOG_FORMAT, LOG_LEVEL
+from json_codec import DECODERS
+from response_store import COMPANIES_FILE
+
+logging.basicConfig(format=LOG_FORMAT, level=LOG_LEVEL)
+logger = logging.getLogger(__name__)
+
+
+def load_payloads(payload_dir: Path) -> dict[str, bytes]:
+    """Read every *.json / *.json.gz payload under a directory (recursively), minus a recording's metadata."""
+    payloads: dict[str, bytes] = {}
+    for path in sorted(payload_dir.rglob("*.json*")):
+        if path.name.endswith(".meta.json") or path.name == COMPANIES_FILE:
+            continue
+        if path.suffix == ".gz":
+            payloads[str(path.relative_to(payload_dir))] = gzip.decompress(path.read_bytes())
+        elif path.suffix == ".json":
+            payloads[str(path.relative_to(payload_dir))] = path.read_bytes()
+    return payloads
+
+
+def synthetic_payloads() -> dict[str, bytes]:
+    """Greenhouse-style boards (content=true) at small / median / large sizes."""
+    description = "<p>We are hiring a builder who cares about reliability &amp; scale.</p>" * 40
+    payloads: dict[str, bytes] = {}
+    for label, size in (("small", 10), ("median", 150), ("large", 5000)):
+        board = {
+            "jobs": [
+                {
+                    "id": 4000000 + i,
+                    "title": f"Senior Software Engineer {i}",
+                    "absolute_url": f"https://boards.greenhouse.io/acme/jobs/{4000000 + i}",
+                    "location": {"name": "San Francisco, CA"},
+                    "updated_at": "2026-02-20T10:00:00-05:00",
+                    "metadata": [{"id": 1, "name": "Salary Range", "value": "$120,000 - $180,000"}],
+                    "departments": [{"id": 7, "name": "Engineering"}],
+                    "content": description,
+                }
+                for i in range(size)
+            ],
+            "meta": {"total": size},
+        }
+        payloads[f"synthetic/{label}"] = json.dumps(board).encode()
+    return payloads
+
+
+def bench(payloads: dict[str, bytes], repeat: int) -> None:
+    total_bytes = sum(len(b) for b in payloads.values())
+    logger.info("%d payloads, %.1f MB total, %d repeats", len(payloads), total_bytes / 1e6, repeat)
+
+    results: dict[str, float] = {}
+    for name, decode in DECODERS.items():
+        start = time.perf_counter()
+        for _ in range(repeat):
+            for body in payloads.values():
+                decode(body)
+        results[name] = time.perf_counter() - start
+
+    baseline = results["stdlib"]
+    logger.info("=== RESULTS ===")
+    for name, elapsed in sorted(results.items(), key=lambda x: x[1]):
+        mb_per_s = total_bytes * repeat / elapsed / 1e6
+        logger.info("  %-8s %8.1f ms  %7.1f MB/s  %5.2fx vs stdlib",
+                    name, elapsed * 1000, mb_per_s, baseline / elapsed)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark JSON decoders on ATS payloads")
+    parser.add_argument("--payload-dir", type=Path, default=None,
+                        help="Directory of *.json / *.json.gz payloads (default: synthetic)")
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    payloads = load_payloads(args.payload_dir) if args.payload_dir else {}
+    if not payloads:
+        if args.payload_dir:
+            logger.warning("No payloads found in %s — using synthetic boards", args.payload_dir)
+        payloads = synthetic_payloads()
+
+    bench(payloads, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
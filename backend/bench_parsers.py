@@ -0,0 +1,574 @@
+"""
+Jobsekr — Parser Micro-Benchmarks
+
+Times parse_jobs for all 14 ATS parsers on small / median / 5k-job boards, plus
+the shared helpers they lean on (detect_remote_type, detect_seniority and the
+parsers.text HTML cleaner, next to the per-parser regex cleaner it replaced)
+and the enrichment stage (column-wise vs one job at a time), and reports
+throughput and peak allocations. --check-remote instead compares
+detect_remote_type with the str(raw)-scanning detector it replaced and
+explains every disagreement, then checks parse + enrich against labeled
+workplace fixtures: hand-written edge cases and mock boards whose workplace
+fields are known.
+
+Boards are generated in each ATS's response shape by mock_ats_server, or read
+from an `ats_scraper.py --record` directory. Results can be saved as a baseline
+JSON and later runs compared against it: anything slower (or allocating more)
+than the threshold is reported as a regression and the exit code is 1.
+
+Usage:
+    python bench_parsers.py
+    python bench_parsers.py --ats greenhouse,lever --repeat 10
+    python bench_parsers.py --payload-dir ./rec
+    python bench_parsers.py --save-baseline bench_parsers_baseline.json
+    python bench_parsers.py --baseline bench_parsers_baseline.json --threshold 0.15
+    python bench_parsers.py --check-remote --payload-dir ./rec
+"""
+
+from __future__ import annotations
+
+import argparse
+import copy
+import gc
+import html
+import importlib
+import json
+import logging
+import platform
+import re
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable
+
+from bench_json import load_payloads
+from config import ATS_API_TEMPLATES, LOG_FORMAT, LOG_LEVEL
+import json_codec
+from mock_ats_server import BOARDS, board_payload, workplace_label
+from parsers import (
+    ParsedJob,
+    _classify_title,
+    classify_titles,
+    detect_remote_type,
+    detect_seniority,
+)
+from parsers.enrich import Enricher, enrich_jobs
+from parsers.salary import parse_salary, parse_salary_uncached
+from parsers.text import description_text, html_to_text
+
+logging.basicConfig(format=LOG_FORMAT, level=LOG_LEVEL)
+logger = logging.getLogger(__name__)
+
+BOARD_SIZES: dict[str, int] = {"small": 10, "median": 150, "large": 5000}
+HELPER_SAMPLE = 2000    # inputs per helper benchmark, spread evenly over all boards
+LONG_TEXT = 200         # --check-remote: longer string values count as free text
+_ATTRIBUTE_PARSERS = {"pinpoint", "teamtailor"}  # JSON:API items; the old detector got their attributes
+REMOTE_LABEL_JOBS = 50  # --check-remote: labeled jobs per mock board
+SALARY_SAMPLES = [
+    "$120K – $180K", "$120,000 - $180,000 USD", "€45.000 - €55.000 per year", "$50-60/hr",
+    "£40k - £50k", "CA$90,000–110,000", "$120K-$180K + 401k", "4.500 EUR monthly", "Competitive",
+    "CHF 120 000 - 140 000", "$35 an hour", "Up to $200k", "401k match, $120,000", "80 000 € - 95 000 €",
+]
+
+
+
+def _mock_item(ats: str, **fields: Any) -> dict[str, Any]:
+    return {**BOARDS[ats][0]("acme", 1), **fields}
+
+
+# --check-remote: (ats, raw item, remote_type parse + enrich should give it)
+REMOTE_FIXTURES: list[tuple[str, dict[str, Any], str]] = [
+    ("greenhouse", _mock_item("greenhouse", location={"name": "Remote - US"}), "remote"),
+    ("greenhouse", _mock_item("greenhouse", location={"name": "Berlin, Germany"},
+                              metadata=[{"name": "Workplace Type", "value": "Hybrid"}]), "hybrid"),
+    ("greenhouse", _mock_item("greenhouse", location={"name": "Berlin, Germany"},
+                              metadata=[{"name": "Remote?", "value": "No"}]), "unknown"),
+    ("greenhouse", _mock_item("greenhouse", title="Backend Engineer (Remote)",
+                              location={"name": "United States"}), "remote"),
+    ("greenhouse", _mock_item("greenhouse", location={"name": "London, UK"},
+                              content="&lt;p&gt;We are remote-friendly.&lt;/p&gt;"), "unknown"),
+    ("lever", _mock_item("lever", workplaceType="remote"), "remote"),
+    ("lever", _mock_item("lever", workplaceType="", categories={"location": "Austin, TX",
+                         "allLocations": ["Austin, TX", "Remote"]}), "remote"),
+    ("ashby", _mock_item("ashby", location="Paris, France", isRemote=False, workplaceType="OnSite"), "onsite"),
+    ("ashby", _mock_item("ashby", location="Paris, France", isRemote=False, workplaceType="Hybrid"), "hybrid"),
+    ("workable", _mock_item("workable", workplace="hybrid"), "hybrid"),
+    ("workable", _mock_item("workable", workplace="", location={"city": "Boston", "country": "United States",
+                                                                "telecommuting": True}), "remote"),
+    ("dover", _mock_item("dover", location="Hybrid - London, UK", is_remote=False), "hybrid"),
+    ("personio", _mock_item("personio", office="Remote, Germany"), "remote"),
+    ("teamtailor", _mock_item("teamtailor", attributes={"title": "Software Engineer", "body": "",
+                                                        "status": "open", "remote-status": "fully"}), "remote"),
+]
+
+
+@dataclass
+class BenchResult:
+    """Best-of-repeat throughput and peak allocation for one case."""
+    items: int          # jobs parsed / helper calls per run
+    seconds: float      # best run
+    peak_kb: float      # tracemalloc peak of one run (0 if not measured)
+
+    @property
+    def per_sec(self) -> float:
+        return self.items / self.seconds if self.seconds else 0.0
+
+
+def _parser_modules(ats_list: list[str]) -> dict[str, ModuleType]:
+    return {ats: importlib.import_module(f"parsers.{ats}") for ats in ats_list}
+
+
+def synthetic_boards(ats_list: list[str], sizes: list[str]) -> dict[str, tuple[str, list[Any]]]:
+    """case name → (ats, decoded pages) for generated boards."""
+    return {
+        f"parse/{ats}/{size}": (ats, [board_payload(ats, "acme", BOARD_SIZES[size], content=True)])
+        for ats in ats_list
+        for size in sizes
+    }
+
+
+def recorded_boards(payload_dir: Path, ats_list: list[str]) -> dict[str, tuple[str, list[Any]]]:
+    """case name → (ats, decoded pages) for every ATS in a --record directory."""
+    pages: dict[str, list[Any]] = {}
+    for name, body in load_payloads(payload_dir).items():
+        ats = Path(name).parts[0]
+        if ats in ats_list:
+            pages.setdefault(ats, []).append(json_codec.loads(body))
+    return {f"parse/{ats}/recorded": (ats, ats_pages) for ats, ats_pages in sorted(pages.items())}
+
+
+def _time(fn: Callable[[], int], repeat: int, measure_alloc: bool) -> BenchResult:
+    """Run fn (which returns the number of items it processed) repeat times."""
+    best = float("inf")
+    items = 0
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        items = fn()
+        best = min(best, time.perf_counter() - start)
+    peak_kb = 0.0
+    if measure_alloc:
+        gc.collect()
+        tracemalloc.start()
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        peak_kb = peak / 1024
+    return BenchResult(items=items, seconds=best, peak_kb=peak_kb)
+
+
+def _helper_corpus(boards: dict[str, tuple[str, list[Any]]], modules: dict[str, ModuleType]) -> dict[str, list[Any]]:
+    """
+    Parsed jobs, titles, remote-type inputs and description HTML taken from
+    the boards. Remote-type inputs are the jobs the ATS gave no workplace
+    answer for, as (title, location, workplace_hints) plus the dict the old
+    detector was handed (the raw item, or its JSON:API attributes).
+    """
+    corpus: dict[str, list[Any]] = {"jobs": [], "titles": [], "remote": [], "html": []}
+    for ats, pages in boards.values():
+        for page in pages:
+            for job in modules[ats].parse_jobs(page, "acme"):
+                corpus["jobs"].append(job)
+                corpus["titles"].append(job.title)
+                if job.remote_type is None:
+                    raw = job.raw_data.get("attributes", job.raw_data) if ats in _ATTRIBUTE_PARSERS else job.raw_data
+                    corpus["remote"].append((job.title, job.location, job.workplace_hints, raw))
+                for value in job.raw_data.values():
+                    if isinstance(value, str) and ("<" in value or "&lt;" in value):
+                        corpus["html"].append(html.unescape(value))
+    return corpus
+
+
+def _sample(items: list[Any], n: int) -> list[Any]:
+    """Up to n items spread evenly over the list, so every ATS is represented."""
+    if len(items) <= n:
+        return items
+    step = len(items) / n
+    return [items[int(i * step)] for i in range(n)]
+
+
+def _legacy_clean_html(doc: str) -> str:
+    """The _clean_html each HTML parser used to carry, kept as the yardstick for parsers.text."""
+    text = re.sub(r"<[^>]+>", " ", doc)
+    return re.sub(r"\s+", " ", text).strip()
+
+
+def _legacy_parse_salary_string(s: str) -> tuple[int | None, int | None, str]:
+    """Greenhouse's _parse_salary_string (Ashby and Dover had copies), the yardstick for parsers.salary."""
+    currency = "USD"
+    if "€" in s or "eur" in s.lower():
+        currency = "EUR"
+    elif "£" in s or "gbp" in s.lower():
+        currency = "GBP"
+
+    amounts = re.findall(r"[\d,]+\.?\d*[kK]?", s)
+    parsed: list[int] = []
+    for amt in amounts:
+        amt = amt.replace(",", "")
+        if not amt.rstrip("kK"):
+            continue
+        if amt.lower().endswith("k"):
+            parsed.append(int(float(amt[:-1]) * 1000))
+        else:
+            val = float(amt)
+            if val > 0:
+                parsed.append(int(val))
+
+    if len(parsed) >= 2:
+        return min(parsed), max(parsed), currency
+    elif len(parsed) == 1:
+        return parsed[0], None, currency
+    return None, None, currency
+
+
+def _enrich_one(job: ParsedJob) -> None:
+    """Enrichment the way parsers used to do it inline: every helper called once per job."""
+    if job.remote_type is None:
+        job.remote_type = detect_remote_type(job.title, job.location, job.workplace_hints)
+    if job.seniority is None:
+        job.seniority = detect_seniority(job.title)
+    if job.salary_text:
+        salary = parse_salary_uncached(job.salary_text)
+        job.salary_min, job.salary_max, job.salary_currency = salary.min, salary.max, salary.currency
+    if isinstance(job.category, str):
+        job.category = " ".join(job.category.split()) or None
+
+
+def _legacy_detect_seniority(title: str) -> str | None:
+    """The substring-chain detect_seniority, kept as the yardstick for the compiled classifier."""
+    t = title.lower()
+    if any(k in t for k in ("intern ", "internship")):
+        return "intern"
+    if any(k in t for k in ("junior", "jr.", "jr ", "entry level", "entry-level", "new grad")):
+        return "junior"
+    if any(k in t for k in ("senior", "sr.", "sr ", "lead", "principal", "staff")):
+        return "senior"
+    if any(k in t for k in ("director", "vp ", "vice president", "head of", "chief")):
+        return "director"
+    if any(k in t for k in ("manager", "engineering manager")):
+        return "manager"
+    return "mid"
+
+
+def _legacy_detect_remote_type(title: str, location: str | None = None, metadata: dict[str, Any] | None = None) -> str:
+    """The detect_remote_type that scanned str(raw item), kept as the yardstick for the targeted one."""
+    text = f"{title} {location or ''}".lower()
+    meta_str = str(metadata or {}).lower()
+
+    if "hybrid" in text or "hybrid" in meta_str:
+        return "hybrid"
+    if "remote" in text or "remote" in meta_str:
+        return "remote"
+    if "on-site" in text or "onsite" in text or "in-office" in text:
+        return "onsite"
+    if "on-site" in meta_str or "onsite" in meta_str:
+        return "onsite"
+    return "unknown"
+
+
+def _string_values(value: Any, max_len: int | None = None) -> list[str]:
+    """Every string value in a decoded JSON item (no keys), optionally only the short ones."""
+    if isinstance(value, str):
+        return [value] if max_len is None or len(value) <= max_len else []
+    if isinstance(value, dict):
+        value = list(value.values())
+    if isinstance(value, list):
+        return [s for item in value for s in _string_values(item, max_len)]
+    return []
+
+
+def check_remote_agreement(remote: list[Any]) -> dict[str, list[str]]:
+    """
+    Compare the targeted detector with the legacy one on every recorded
+    fallback call. Disagreements are bucketed by what the legacy detector
+    keyed on:
+
+      key_names     a key like "isRemote" / "remote" in str(raw), not a value
+      long_text     a description or other free text (> LONG_TEXT chars)
+      other_fields  a short value in a field the parser does not pass
+      unexplained   none of the above — a regression in the new detector
+    """
+    buckets: dict[str, list[str]] = {"agree": [], "key_names": [], "long_text": [], "other_fields": [], "unexplained": []}
+    for title, location, fields, raw in remote:
+        new = detect_remote_type(title, location, fields)
+        old = _legacy_detect_remote_type(title, location, raw)
+        example = f"{title!r} @ {location!r}: legacy={old} new={new}"
+        if new == old:
+            buckets["agree"].append(example)
+        elif _legacy_detect_remote_type(title, location, " ".join(_string_values(raw))) == new:
+            buckets["key_names"].append(example)
+        elif _legacy_detect_remote_type(title, location, " ".join(_string_values(raw, LONG_TEXT))) == new:
+            buckets["long_text"].append(example)
+        elif detect_remote_type(title, location, [fields, _string_values(raw, LONG_TEXT)]) == old:
+            buckets["other_fields"].append(example)
+        else:
+            buckets["unexplained"].append(example)
+    return buckets
+
+
+def report_remote_agreement(buckets: dict[str, list[str]]) -> int:
+    """Log the buckets; returns the number of unexplained disagreements."""
+    total = sum(len(examples) for examples in buckets.values())
+    if not total:
+        logger.warning("No remote-type fallback calls in these boards")
+        return 0
+    logger.info("=== REMOTE TYPE: targeted vs legacy, %d fallback calls ===", total)
+    for name, examples in buckets.items():
+        logger.info("  %-14s %7d  %5.1f%%", name, len(examples), len(examples) / total * 100)
+        if name != "agree":
+            for example in examples[:3]:
+                logger.info("      %s", example)
+    if buckets["unexplained"]:
+        logger.error("%d unexplained disagreements", len(buckets["unexplained"]))
+    return len(buckets["unexplained"])
+
+
+def remote_label_cases(ats_list: list[str], mock_jobs: int = REMOTE_LABEL_JOBS) -> list[tuple[str, str, Any]]:
+    """
+    (ats, expected remote_type, one-job page) for the REMOTE_FIXTURES and the
+    first mock_jobs jobs of each mock board. Jobs go one per page so a parser
+    skipping an item can't shift the labels.
+    """
+    cases = [(ats, expected, BOARDS[ats][1]([item])) for ats, item, expected in REMOTE_FIXTURES if ats in ats_list]
+    for ats in ats_list:
+        build, envelope = BOARDS[ats]
+        cases.extend((ats, workplace_label(ats, "acme", i), envelope([build("acme", i)]))
+                     for i in range(1, mock_jobs + 1))
+    return cases
+
+
+def check_remote_labels(cases: list[tuple[str, str, Any]], modules: dict[str, ModuleType]) -> list[str]:
+    """Parse + enrich every labeled page; returns a description of each mislabeled job."""
+    wrong: list[str] = []
+    for ats, expected, page in cases:
+        jobs = enrich_jobs(modules[ats].parse_jobs(page, "acme"))
+        if len(jobs) != 1:
+            wrong.append(f"{ats}: parsed {len(jobs)} jobs from a one-job page")
+        elif jobs[0].remote_type != expected:
+            job = jobs[0]
+            wrong.append(f"{ats}: {job.title!r} @ {job.location!r}: expected={expected} got={job.remote_type}")
+    return wrong
+
+
+def report_remote_labels(wrong: list[str], total: int) -> int:
+    """Log the labeled check; returns the number of mislabeled jobs."""
+    logger.info("=== REMOTE TYPE: labeled fixtures, %d/%d correct ===", total - len(wrong), total)
+    for example in wrong[:10]:
+        logger.info("      %s", example)
+    if wrong:
+        logger.error("%d mislabeled jobs", len(wrong))
+    return len(wrong)
+
+
+def run_benchmarks(
+    boards: dict[str, tuple[str, list[Any]]],
+    modules: dict[str, ModuleType],
+    repeat: int,
+    measure_alloc: bool,
+) -> dict[str, BenchResult]:
+    results: dict[str, BenchResult] = {}
+
+    for case, (ats, pages) in boards.items():
+        parse_jobs = modules[ats].parse_jobs
+
+        def parse_all(parse_jobs: Callable[..., Any] = parse_jobs, pages: list[Any] = pages) -> int:
+            return sum(len(parse_jobs(page, "acme")) for page in pages)
+
+        results[case] = _time(parse_all, repeat, measure_alloc)
+
+    full = _helper_corpus(boards, modules)
+    corpus = {name: _sample(items, HELPER_SAMPLE) for name, items in full.items()}
+    titles, remote, html_docs = corpus["titles"], corpus["remote"], corpus["html"]
+
+    def seniority() -> int:
+        for title in titles:
+            detect_seniority(title)
+        return len(titles)
+
+    def seniority_uncached() -> int:
+        _classify_title.cache_clear()
+        for title in titles:
+            detect_seniority(title)
+        return len(titles)
+
+    def seniority_batch() -> int:
+        _classify_title.cache_clear()
+        return len(classify_titles(titles))
+
+    def legacy_seniority() -> int:
+        for title in titles:
+            _legacy_detect_seniority(title)
+        return len(titles)
+
+    def remote_type() -> int:
+        for title, location, fields, _ in remote:
+            detect_remote_type(title, location, fields)
+        return len(remote)
+
+    def legacy_remote_type() -> int:
+        for title, location, _, raw in remote:
+            _legacy_detect_remote_type(title, location, raw)
+        return len(remote)
+
+    results["helper/legacy_detect_seniority"] = _time(legacy_seniority, repeat, measure_alloc)
+    results["helper/detect_seniority@uncached"] = _time(seniority_uncached, repeat, measure_alloc)
+    results["helper/detect_seniority"] = _time(seniority, repeat, measure_alloc)
+    results["helper/classify_titles@uncached"] = _time(seniority_batch, repeat, measure_alloc)
+    results["helper/legacy_detect_remote_type"] = _time(legacy_remote_type, repeat, measure_alloc)
+    results["helper/detect_remote_type"] = _time(remote_type, repeat, measure_alloc)
+
+    # Board salary strings plus the formats the boards don't cover, repeated the way boards repeat them
+    salary_texts = _sample([job.salary_text for job in full["jobs"] if job.salary_text] + SALARY_SAMPLES * 20, HELPER_SAMPLE)
+
+    def legacy_salary() -> int:
+        for text in salary_texts:
+            _legacy_parse_salary_string(text)
+        return len(salary_texts)
+
+    def salary_uncached() -> int:
+        for text in salary_texts:
+            parse_salary_uncached(text)
+        return len(salary_texts)
+
+    def salary_cached() -> int:
+        for text in salary_texts:
+            parse_salary(text)
+        return len(salary_texts)
+
+    results["helper/legacy_parse_salary_string"] = _time(legacy_salary, repeat, measure_alloc)
+    results["helper/parse_salary@uncached"] = _time(salary_uncached, repeat, measure_alloc)
+    results["helper/parse_salary"] = _time(salary_cached, repeat, measure_alloc)
+
+    # The whole corpus through enrichment, on fresh copies each run since it works in place
+    jobs = full["jobs"]
+    copies: list[list[ParsedJob]] = []
+
+    def fresh_copies() -> list[ParsedJob]:
+        if not copies:
+            copies.extend([copy.copy(job) for job in jobs] for _ in range(repeat + 1))
+        return copies.pop()
+
+    def enrich_per_job() -> int:
+        batch = fresh_copies()
+        for job in batch:
+            _enrich_one(job)
+        return len(batch)
+
+    def enrich_columns() -> int:
+        batch = fresh_copies()
+        Enricher().enrich(batch)
+        return len(batch)
+
+    results["enrich/per_job"] = _time(enrich_per_job, repeat, measure_alloc)
+    results["enrich/columns"] = _time(enrich_columns, repeat, measure_alloc)
+
+    if html_docs:
+        # Five copies of a board description stand in for the long (~8 KB) ones
+        sets = {"": html_docs, "@long": [doc * 5 for doc in html_docs]}
+        cleaners: dict[str, Callable[[str], str]] = {
+            "legacy_clean_html": _legacy_clean_html,
+            "html_to_text": html_to_text,
+            "description_text": description_text,
+        }
+        for name, clean in cleaners.items():
+            for suffix, docs in sets.items():
+
+                def clean_all(clean: Callable[[str], str] = clean, docs: list[str] = docs) -> int:
+                    for doc in docs:
+                        clean(doc)
+                    return len(docs)
+
+                results[f"helper/{name}{suffix}"] = _time(clean_all, repeat, measure_alloc)
+    return results
+
+
+def report(results: dict[str, BenchResult], baseline: dict[str, Any] | None, threshold: float) -> list[str]:
+    """Log the results table; return the names of cases that regressed against the baseline."""
+    base = (baseline or {}).get("results", {})
+    regressions: list[str] = []
+    logger.info("=== RESULTS ===")
+    logger.info("  %-36s %12s %10s %10s %9s", "case", "items/s", "ms", "peak KB", "vs base")
+    for name, r in results.items():
+        delta = ""
+        prev = base.get(name)
+        if prev and prev.get("items") == r.items:
+            speed = r.per_sec / prev["per_sec"] if prev.get("per_sec") else 1.0
+            delta = f"{speed:.2f}x"
+            slower = speed < 1 - threshold
+            heavier = prev.get("peak_kb") and r.peak_kb > prev["peak_kb"] * (1 + threshold)
+            if slower or heavier:
+                regressions.append(name)
+                delta += " !"
+        logger.info("  %-36s %12.0f %10.2f %10.0f %9s", name, r.per_sec, r.seconds * 1000, r.peak_kb, delta)
+    return regressions
+
+
+def save_baseline(path: Path, results: dict[str, BenchResult]) -> None:
+    data = {
+        "meta": {
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "json_decoder": json_codec.DECODER_NAME,
+            "created_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+        },
+        "results": {name: {**asdict(r), "per_sec": r.per_sec} for name, r in results.items()},
+    }
+    path.write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+    logger.info("Baseline saved to %s", path)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark the ATS parsers and their helpers")
+    parser.add_argument("--ats", type=str, default=None, help="Comma-separated ATS list (default: all 14)")
+    parser.add_argument("--sizes", type=str, default="small,median,large",
+                        help=f"Synthetic board sizes: {', '.join(f'{k}={v}' for k, v in BOARD_SIZES.items())}")
+    parser.add_argument("--payload-dir", type=Path, default=None,
+                        help="Benchmark on an ats_scraper.py --record directory instead of synthetic boards")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--no-alloc", action="store_true", help="Skip the tracemalloc pass")
+    parser.add_argument("--save-baseline", type=Path, default=None, metavar="PATH")
+    parser.add_argument("--baseline", type=Path, default=None, metavar="PATH",
+                        help="Compare against a saved baseline; exit 1 on regressions")
+    parser.add_argument("--threshold", type=float, default=0.2,
+                        help="Allowed slowdown / allocation growth vs the baseline (fraction)")
+    parser.add_argument("--check-remote", action="store_true",
+                        help="Instead of timing, compare detect_remote_type with the legacy str(raw) detector "
+                             "and check remote types against labeled fixtures; exit 1 on unexplained "
+                             "disagreements or mislabeled jobs")
+    args = parser.parse_args()
+
+    ats_list = args.ats.split(",") if args.ats else sorted(ATS_API_TEMPLATES)
+    modules = _parser_modules(ats_list)
+    if args.payload_dir:
+        boards = recorded_boards(args.payload_dir, ats_list)
+    else:
+        boards = synthetic_boards(ats_list, args.sizes.split(","))
+    if not boards:
+        logger.warning("Nothing to benchmark")
+        return
+
+    if args.check_remote:
+        failures = report_remote_agreement(check_remote_agreement(_helper_corpus(boards, modules)["remote"]))
+        cases = remote_label_cases(ats_list)
+        failures += report_remote_labels(check_remote_labels(cases, modules), len(cases))
+        if failures:
+            sys.exit(1)
+        return
+
+    logger.info("Benchmarking %d boards across %d parsers (%d repeats)", len(boards), len(modules), args.repeat)
+    results = run_benchmarks(boards, modules, args.repeat, measure_alloc=not args.no_alloc)
+
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8")) if args.baseline else None
+    regressions = report(results, baseline, args.threshold)
+    if args.save_baseline:
+        save_baseline(args.save_baseline, results)
+    if regressions:
+        logger.error("%d regressions beyond %.0f%%: %s", len(regressions), args.threshold * 100, ", ".join(regressions))
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
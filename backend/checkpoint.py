@@ -0,0 +1,147 @@
+"""
+Jobsekr — Crash-Safe Scrape Checkpoints
+
+Append-only JSONL log per scrape run ({SCRAPE_CHECKPOINT_DIR}/{run_id}.jsonl).
+A "flush" line is written (and fsynced) only after a batch is committed to the
+DB, listing the companies it covered and its job counts, so a run killed
+mid-way — e.g. by the GitHub Actions timeout — can be resumed with
+`ats_scraper.py --resume <run_id>`: done companies are skipped and the
+scrape_runs row is finished with totals merged across both processes.
+
+The start line also records the run's --ats / --company / --shard, which a
+resume restores, so a resumed shard scrapes only its own companies. A process
+interrupted mid-run writes a "finish" line with its metrics; they are carried
+into the metrics of the process that finishes the run.
+
+A torn last line (crash during the write) is ignored on load.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+from config import SCRAPE_CHECKPOINT_DIR
+
+logger = logging.getLogger(__name__)
+
+# Counters carried across a resume; names match RunStats fields
+TOTAL_FIELDS: tuple[str, ...] = (
+    "jobs_parsed",
+    "new_count",
+    "existing_count",
+    "touched_count",
+    "removed_count",
+    "error_count",  # companies that failed; they are retried on resume and count again if they fail again
+)
+
+
+@dataclass
+class Checkpoint:
+    """On-disk progress of one scrape run."""
+    run_id: str
+    path: Path
+    started_at: str | None = None  # the original run's scrape start, reused on resume
+    config: dict[str, Any] = field(default_factory=dict)
+    done: set[str] = field(default_factory=set)  # company ids whose results are in the DB
+    totals: dict[str, int] = field(default_factory=lambda: dict.fromkeys(TOTAL_FIELDS, 0))
+    resumes: int = 0
+    earlier_metrics: list[dict[str, Any]] = field(default_factory=list)  # of interrupted earlier processes
+
+    @staticmethod
+    def path_for(run_id: str, directory: str = SCRAPE_CHECKPOINT_DIR) -> Path:
+        return Path(directory) / f"{run_id}.jsonl"
+
+    @classmethod
+    def create(
+        cls,
+        run_id: str,
+        started_at: str,
+        config: dict[str, Any] | None = None,
+        directory: str = SCRAPE_CHECKPOINT_DIR,
+    ) -> Checkpoint:
+        path = cls.path_for(run_id, directory)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        checkpoint = cls(run_id=run_id, path=path, started_at=started_at, config=config or {})
+        checkpoint._append({"type": "start", "started_at": started_at, "config": checkpoint.config})
+        logger.info("Checkpointing to %s", path)
+        return checkpoint
+
+    @classmethod
+    def load(cls, run_id: str, directory: str = SCRAPE_CHECKPOINT_DIR) -> Checkpoint:
+        """Replay a run's log. Raises FileNotFoundError if there is none."""
+        path = cls.path_for(run_id, directory)
+        checkpoint = cls(run_id=run_id, path=path)
+        with path.open(encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    logger.warning("Ignoring torn checkpoint line in %s", path)
+                    continue
+                kind = entry.get("type")
+                if kind == "start":
+                    checkpoint.started_at = entry.get("started_at")
+                    checkpoint.config = entry.get("config") or {}
+                elif kind == "flush":
+                    checkpoint.done.update(entry.get("companies", []))
+                    for name in TOTAL_FIELDS:
+                        checkpoint.totals[name] += entry.get(name, 0)
+                elif kind == "resume":
+                    checkpoint.resumes += 1
+                elif kind == "finish" and entry.get("metrics"):
+                    checkpoint.earlier_metrics.append(entry["metrics"])
+        checkpoint.resumes += 1
+        checkpoint._append({"type": "resume", "at": datetime.now(timezone.utc).isoformat()})
+        logger.info(
+            "Resuming run %s: %d companies already done, %d jobs parsed so far",
+            run_id, len(checkpoint.done), checkpoint.totals["jobs_parsed"],
+        )
+        return checkpoint
+
+    def record_flush(self, company_ids: list[str], counts: dict[str, int]) -> None:
+        """Log a batch that is now committed to the DB."""
+        self.done.update(company_ids)
+        for name in TOTAL_FIELDS:
+            self.totals[name] += counts.get(name, 0)
+        self._append({"type": "flush", "companies": company_ids, **counts})
+
+    def record_finish(self, status: str, metrics: dict[str, Any] | None = None) -> None:
+        """Log the end of a process; an interrupted one passes its metrics for the resume."""
+        entry: dict[str, Any] = {"type": "finish", "status": status, "at": datetime.now(timezone.utc).isoformat()}
+        if metrics is not None:
+            entry["metrics"] = metrics
+        self._append(entry)
+
+    def filters(
+        self,
+        ats_filter: str | None,
+        company_filter: str | None,
+        shard: tuple[int, int] | None,
+    ) -> tuple[str | None, str | None, tuple[int, int] | None]:
+        """
+        The original run's (ats_filter, company_filter, shard). Flags given again
+        on resume must match them: raises ValueError on a conflict.
+        """
+        original = (
+            self.config.get("ats_filter"),
+            self.config.get("company_filter"),
+            tuple(self.config["shard"]) if self.config.get("shard") else None,
+        )
+        for flag, given, recorded in zip(("--ats", "--company", "--shard"), (ats_filter, company_filter, shard), original):
+            if given is not None and given != recorded:
+                raise ValueError(
+                    f"--resume {self.run_id}: {flag} {given!r} conflicts with the original run's {recorded!r}"
+                )
+        return original
+
+    def _append(self, entry: dict[str, Any]) -> None:
+        with self.path.open("a", encoding="utf-8") as f:
+            f.write(json.dumps(entry, separators=(",", ":")) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
@@ -0,0 +1,177 @@
+"""
+Jobsekr — Per-ATS-Host Circuit Breaker
+
+Stops a run from waiting out SCRAPE_TIMEOUT for every company of an ATS that
+is down. Each host (keyed like the rate limiter) has a breaker:
+
+  closed     requests flow; SCRAPE_BREAKER_FAILURES consecutive failures → open
+  open       requests fail fast with CircuitOpenError; after
+             SCRAPE_BREAKER_RESET_SECONDS → half-open
+  half-open  one probe request is let through; success → closed, failure → open
+
+Failures are timeouts, dropped connections and 5xx responses. 429s are left
+to the rate limiter — the host is up, just asking us to slow down.
+
+Usage:
+    breakers = CircuitBreakers()
+    breaker = breakers.get("rippling", api_url)
+    if not breaker.allow():
+        raise CircuitOpenError(breaker.host)
+    ...
+    breaker.on_success()   # or breaker.on_failure()
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from dataclasses import dataclass
+
+from config import SCRAPE_BREAKER_FAILURES, SCRAPE_BREAKER_RESET_SECONDS
+from rate_limiter import host_key
+
+logger = logging.getLogger(__name__)
+
+CLOSED, OPEN, HALF_OPEN = "closed", "open", "half_open"
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of sending a request to a host whose circuit is open."""
+
+    def __init__(self, host: str) -> None:
+        super().__init__(f"circuit open for {host}")
+        self.host = host
+
+
+@dataclass
+class BreakerEvent:
+    """A state change, for the run summary."""
+    host: str
+    state: str  # "open" or "closed"
+    at: float   # seconds since the registry was created
+    reason: str
+
+
+class CircuitBreaker:
+    """Consecutive-failure breaker for one host."""
+
+    def __init__(
+        self,
+        host: str,
+        registry: CircuitBreakers,
+        failure_threshold: int = SCRAPE_BREAKER_FAILURES,
+        reset_timeout: float = SCRAPE_BREAKER_RESET_SECONDS,
+    ) -> None:
+        self.host = host
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = CLOSED
+        self.failures = 0  # consecutive
+        self.fast_failed = 0
+        self._registry = registry
+        self._opened_at = 0.0
+        self._probe_started: float | None = None
+
+    def allow(self) -> bool:
+        """Whether a request may be sent now. In half-open state only one probe is in flight."""
+        if self.state == CLOSED:
+            return True
+        now = time.monotonic()
+        if self.state == OPEN and now - self._opened_at >= self.reset_timeout:
+            self.state = HALF_OPEN
+            self._probe_started = None
+        if self.state == HALF_OPEN:
+            # A probe that never reported back (cancelled) doesn't block the host forever
+            if self._probe_started is None or now - self._probe_started >= self.reset_timeout:
+                self._probe_started = now
+                return True
+        self.fast_failed += 1
+        return False
+
+    def tripped(self) -> bool:
+        """
+        Re-check for a request that passed allow() but waited for a slot meanwhile:
+        True (counted as fast-failed) if the circuit has opened since.
+        """
+        if self.state != OPEN:
+            return False
+        self.fast_failed += 1
+        return True
+
+    def on_success(self) -> None:
+        self.failures = 0
+        if self.state != CLOSED:
+            self.state = CLOSED
+            self._registry.record(self, "closed", "probe succeeded")
+
+    def on_failure(self) -> None:
+        self.failures += 1
+        if self.state == HALF_OPEN:
+            self._open("half-open probe failed")
+        elif self.state == CLOSED and self.failures >= self.failure_threshold:
+            self._open(f"{self.failures} consecutive failures")
+
+    def _open(self, reason: str) -> None:
+        self.state = OPEN
+        self._opened_at = time.monotonic()
+        self._registry.record(self, "open", reason)
+
+
+class CircuitBreakers:
+    """Registry of per-host circuit breakers."""
+
+    def __init__(
+        self,
+        failure_threshold: int = SCRAPE_BREAKER_FAILURES,
+        reset_timeout: float = SCRAPE_BREAKER_RESET_SECONDS,
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.events: list[BreakerEvent] = []
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self._created = time.monotonic()
+
+    def get(self, ats: str, api_url: str = "") -> CircuitBreaker:
+        """Return the breaker for the host serving this ATS, creating it on first use."""
+        host, _ = host_key(ats, api_url)
+        breaker = self._breakers.get(host)
+        if breaker is None:
+            breaker = CircuitBreaker(host, self, self.failure_threshold, self.reset_timeout)
+            self._breakers[host] = breaker
+        return breaker
+
+    def record(self, breaker: CircuitBreaker, state: str, reason: str) -> None:
+        at = time.monotonic() - self._created
+        self.events.append(BreakerEvent(breaker.host, state, round(at, 1), reason))
+        if state == "open":
+            logger.warning("Circuit opened for %s: %s", breaker.host, reason)
+        else:
+            logger.info("Circuit closed for %s: %s", breaker.host, reason)
+
+    def summary(self) -> dict[str, dict[str, int | str]]:
+        """Hosts whose breaker tripped at least once: final state, trips and fast-failed requests."""
+        trips: dict[str, int] = {}
+        for event in self.events:
+            if event.state == "open":
+                trips[event.host] = trips.get(event.host, 0) + 1
+        return {
+            host: {
+                "state": self._breakers[host].state,
+                "trips": count,
+                "fast_failed": self._breakers[host].fast_failed,
+            }
+            for host, count in sorted(trips.items())
+        }
+
+    def log_summary(self) -> None:
+        summary = self.summary()
+        if not summary:
+            return
+        logger.info("Circuit breakers:")
+        for event in self.events:
+            logger.info("  %6.1fs  %-32s %-6s (%s)", event.at, event.host, event.state, event.reason)
+        for host, stats in summary.items():
+            logger.info(
+                "  %-32s %s at end of run (%d trips, %d requests fast-failed)",
+                host, stats["state"], stats["trips"], stats["fast_failed"],
+            )
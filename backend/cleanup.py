@@ -9,6 +9,7 @@ Runs daily to:
 Usage:
     python cleanup.py
     python cleanup.py --dry-run
+    python cleanup.py --dry-run --profile
 """
 
 from __future__ import annotations
@@ -24,6 +25,7 @@ except ImportError:
 
 from config import JOB_TTL_DAYS, JOB_STALE_HOURS, LOG_FORMAT, LOG_LEVEL
 import db
+import profiling
 
 logging.basicConfig(format=LOG_FORMAT, level=LOG_LEVEL)
 logger = logging.getLogger(__name__)
@@ -87,8 +89,10 @@ def _cutoff_iso(hours: int = 0, days: int = 0) -> str:
 def main() -> None:
     parser = argparse.ArgumentParser(description="Jobsekr Data Cleanup")
     parser.add_argument("--dry-run", action="store_true", help="Show what would be cleaned up")
+    profiling.add_profile_args(parser)
     args = parser.parse_args()
-    run_cleanup(dry_run=args.dry_run)
+    with profiling.session("cleanup", args):
+        run_cleanup(dry_run=args.dry_run)
 
 
 if __name__ == "__main__":
@@ -35,12 +35,79 @@ SCRAPE_CONCURRENCY: int = int(os.environ.get("SCRAPE_CONCURRENCY", "20"))
 SCRAPE_TIMEOUT: int = int(os.environ.get("SCRAPE_TIMEOUT", "10"))
 SCRAPE_RATE_LIMIT_PER_ATS: float = 1.0  # seconds between requests to same ATS domain
 
+# Per-host adaptive (AIMD) rate limiting — see rate_limiter.py.
+# Every ATS host starts at 1 / SCRAPE_RATE_LIMIT_PER_ATS req/s, ramps up additively on
+# success and halves on 429 / 5xx / timeout, bounded by these limits.
+SCRAPE_HOST_MAX_RPS: float = float(os.environ.get("SCRAPE_HOST_MAX_RPS", "10"))  # shared API hosts
+SCRAPE_SUBDOMAIN_HOST_MAX_RPS: float = float(os.environ.get("SCRAPE_SUBDOMAIN_HOST_MAX_RPS", "2.0"))  # {slug}.<ats> hosts
+SCRAPE_HOST_MIN_RPS: float = 0.2
+SCRAPE_RATE_INCREASE: float = 0.25  # req/s added per successful response
+SCRAPE_RATE_DECREASE: float = 0.5   # multiplier applied on throttling
+
+# Retries for transient failures (429, 5xx, timeouts, dropped connections) — see retry.py
+SCRAPE_MAX_RETRIES: int = int(os.environ.get("SCRAPE_MAX_RETRIES", "3"))  # per company
+SCRAPE_RETRY_BASE_DELAY: float = 1.0   # seconds; doubled per attempt, full jitter
+SCRAPE_RETRY_MAX_DELAY: float = 30.0   # longer Retry-After values are not waited out
+SCRAPE_RETRY_BUDGET_RATIO: float = 0.25  # retries per run as a fraction of companies (min 10)
+
+# Per-host circuit breaker — see circuit_breaker.py
+SCRAPE_BREAKER_FAILURES: int = 5            # consecutive failures that open a host's circuit
+SCRAPE_BREAKER_RESET_SECONDS: float = 30.0  # open → half-open probe after this long
+
+# Streaming ingest: parsed jobs are flushed to the DB in batches while fetching continues
+SCRAPE_FLUSH_JOBS: int = int(os.environ.get("SCRAPE_FLUSH_JOBS", "1000"))  # jobs per DB flush
+SCRAPE_PIPELINE_QUEUE_SIZE: int = SCRAPE_CONCURRENCY * 2  # fetched results awaiting ingest
+
+# Two-phase Greenhouse fetch: the listing has no descriptions, so content is fetched
+# afterwards for jobs not yet in the DB — per job for a few, one ?content=true board
+# request when there are more new jobs than this
+SCRAPE_GREENHOUSE_CONTENT: bool = os.environ.get("SCRAPE_GREENHOUSE_CONTENT", "1") != "0"
+SCRAPE_CONTENT_PER_JOB_MAX: int = 10
+
+# Detail-fetch stage for new jobs whose listing has no description (SmartRecruiters,
+# Workable, Rippling) — see detail_fetcher.py. Separate limits from the listing scrape.
+SCRAPE_DETAIL_FETCH: bool = os.environ.get("SCRAPE_DETAIL_FETCH", "1") != "0"
+SCRAPE_DETAIL_CONCURRENCY: int = 5
+SCRAPE_DETAIL_MAX_RPS: float = 2.0     # per ATS host
+SCRAPE_DETAIL_QUEUE_SIZE: int = 2000   # pending jobs; more are dropped until the next new-job scrape
+SCRAPE_DETAIL_BATCH_SIZE: int = 50     # description patches per DB write
+SCRAPE_DETAIL_CANCEL_GRACE: float = 5.0  # seconds the stage may keep draining after an interrupt
+
+# Paginated boards (SmartRecruiters, Workable): pages fetched per company at most
+SCRAPE_MAX_PAGES: int = 50
+
+# Change-rate-aware refresh scheduling (--schedule) — see scheduler.py
+SCRAPE_FRESHNESS_SLO_HOURS: float = float(os.environ.get("SCRAPE_FRESHNESS_SLO_HOURS", "24"))
+SCRAPE_MIN_INTERVAL_HOURS: float = 1.0  # never rescrape a board sooner than this
+SCRAPE_DUE_CHANGES: float = 1.0         # rescrape once this many postings/removals are expected
+SCRAPE_POST_RATE_ALPHA: float = 0.3     # EWMA weight of the latest observed change rate
+
+# --deadline mode: seconds of the time budget kept for in-flight fetches and the final flush
+SCRAPE_DEADLINE_RESERVE: float = 60.0
+
+# Crash-safe checkpoints (append-only JSONL per scrape run) — see checkpoint.py
+SCRAPE_CHECKPOINT_DIR: str = os.environ.get("SCRAPE_CHECKPOINT_DIR", ".checkpoints")
+
+# Worker processes for JSON decode + parse_jobs (0 = parse on the event loop thread)
+SCRAPE_PARSE_WORKERS: int = int(os.environ.get("SCRAPE_PARSE_WORKERS", "0"))
+
+# Enrichment stage (parsers/enrich.py): distinct values remembered per column during a run
+ENRICH_MEMO_SIZE: int = 100_000
+
 # Jobs older than this are pruned by cleanup.py
 JOB_TTL_DAYS: int = 90
 
 # Jobs not seen for this long are marked inactive
 JOB_STALE_HOURS: int = 48
 
+# Leading characters of a description kept in jobs.description
+JOB_DESCRIPTION_CHARS: int = 500
+
+# --profile reports (see profiling.py): base directory, and the event-loop
+# step duration above which asyncio debug mode reports a slow callback
+PROFILE_DIR: str = os.environ.get("PROFILE_DIR", "profiles")
+PROFILE_SLOW_CALLBACK_MS: float = 100.0
+
 # ---------------------------------------------------------------------------
 # ATS API URL Templates
 # ---------------------------------------------------------------------------
@@ -15,7 +15,7 @@ from urllib.parse import urlparse, urlunparse
 
 from supabase import create_client, Client
 
-from config import SUPABASE_URL, SUPABASE_SERVICE_KEY
+from config import JOB_DESCRIPTION_CHARS, SUPABASE_URL, SUPABASE_SERVICE_KEY
 
 logger = logging.getLogger(__name__)
 
@@ -229,6 +229,8 @@ def upsert_job(
     description: str | None = None,
     salary_min: int | None = None,
     salary_max: int | None = None,
+    salary_currency: str | None = None,
+    salary_interval: str | None = None,
     remote_type: str | None = None,
     seniority: str | None = None,
     platform: str | None = None,
@@ -274,12 +276,15 @@ def upsert_job(
         if location:
             row["location"] = location.strip()
         if description:
-            # Store first 500 chars in description column
-            row["description"] = description[:500].strip()
+            # Store the leading chars in description column
+            row["description"] = description[:JOB_DESCRIPTION_CHARS].strip()
         if salary_min is not None:
             row["salary_min"] = salary_min
         if salary_max is not None:
             row["salary_max"] = salary_max
+        if salary_min is not None or salary_max is not None:
+            row["salary_currency"] = salary_currency or "USD"
+            row["salary_interval"] = salary_interval
         if remote_type and remote_type in ("remote", "onsite", "hybrid", "unknown"):
             row["remote_type"] = remote_type
         if seniority:
@@ -317,6 +322,9 @@ def upsert_job(
             updates["salary_min"] = salary_min
         if salary_max is not None:
             updates["salary_max"] = salary_max
+        if salary_min is not None or salary_max is not None:
+            updates["salary_currency"] = salary_currency or "USD"
+            updates["salary_interval"] = salary_interval
 
         try:
             result = _retry(lambda: (
@@ -332,24 +340,12 @@ def upsert_job(
             return (None, False)
 
 
-def batch_insert_jobs(jobs: list[dict[str, Any]], batch_size: int = 500) -> tuple[int, int]:
+def existing_url_hashes(hashes: list[str]) -> set[str]:
     """
-    Batch insert jobs, skipping duplicates via url_hash unique constraint.
-    Much faster than individual upserts — one request per batch.
-    Returns (new_count, skipped_count).
+    Return the subset of url_hashes already stored in jobs. Raises if a lookup
+    fails: a partial answer would pass stored jobs off as new.
     """
-    if not jobs:
-        return 0, 0
-
-    # Pre-compute url_hashes
-    for job in jobs:
-        if "url_hash" not in job:
-            job["url_hash"] = hash_url(job["url"])
-
-    # Fetch existing hashes in one query
-    hashes = [j["url_hash"] for j in jobs]
-    existing_hashes: set[str] = set()
-
+    existing: set[str] = set()
     # Query in smaller batches to avoid URL length limits
     for i in range(0, len(hashes), 200):
         chunk = hashes[i:i + 200]
@@ -362,23 +358,95 @@ def batch_insert_jobs(jobs: list[dict[str, Any]], batch_size: int = 500) -> tupl
                 .execute()
             ))
             if result.data:
-                existing_hashes.update(r["url_hash"] for r in result.data)
+                existing.update(r["url_hash"] for r in result.data)
         except Exception as e:
             logger.error("Failed to check existing hashes: %s", e)
+            raise
+    return existing
+
+
+def _salary_columns(job: dict[str, Any]) -> dict[str, Any]:
+    """The salary_* columns for a job dict, or {} if it has no amounts."""
+    if job.get("salary_min") is None and job.get("salary_max") is None:
+        return {}
+    return {
+        "salary_min": job.get("salary_min"),
+        "salary_max": job.get("salary_max"),
+        "salary_currency": job.get("salary_currency") or "USD",
+        "salary_interval": job.get("salary_interval"),
+    }
 
-    # Filter to only new jobs
-    new_jobs = [j for j in jobs if j["url_hash"] not in existing_hashes]
 
-    if not new_jobs:
-        return 0, len(jobs)
+def batch_insert_jobs(
+    jobs: list[dict[str, Any]],
+    batch_size: int = 500,
+    existing: set[str] | None = None,
+) -> tuple[int, int]:
+    """
+    Batch insert jobs, skipping duplicates via url_hash unique constraint.
+    Much faster than individual upserts — one request per batch.
+    `existing` is the result of existing_url_hashes() if the caller already
+    looked the hashes up. Sets job["is_new"] on each input dict, and
+    job["write_failed"] on those whose writes failed, so callers can hold back
+    anything that must only follow the jobs (company content hashes).
+    Returns (new_count, skipped_count).
+    """
+    if not jobs:
+        return 0, 0
+
+    # Pre-compute url_hashes
+    for job in jobs:
+        if "url_hash" not in job:
+            job["url_hash"] = hash_url(job["url"])
+
+    if existing is None:
+        try:
+            existing = existing_url_hashes([j["url_hash"] for j in jobs])
+        except Exception:
+            for job in jobs:
+                job["write_failed"] = True
+            return 0, 0
+
+    # Filter to only new jobs (flagged on the dicts so callers can count per company)
+    for job in jobs:
+        job["is_new"] = job["url_hash"] not in existing
+    new_jobs = [j for j in jobs if j["is_new"]]
 
-    # Update last_seen for existing jobs in one batch
-    existing_jobs = [j for j in jobs if j["url_hash"] in existing_hashes]
+    # Update last_seen for existing jobs in one batch; those with a salary get it
+    # rewritten too, so rows stored before salaries were annualized catch up
+    existing_jobs = [j for j in jobs if j["url_hash"] in existing]
     if existing_jobs:
         now = datetime.now(timezone.utc).isoformat()
-        existing_job_hashes = [j["url_hash"] for j in existing_jobs]
-        for i in range(0, len(existing_job_hashes), 200):
-            chunk = existing_job_hashes[i:i + 200]
+        salaried = [j for j in existing_jobs if _salary_columns(j)]
+        for i in range(0, len(salaried), batch_size):
+            rows = [
+                {
+                    "url_hash": job["url_hash"],
+                    "url": job["url"].strip(),
+                    "title": job["title"].strip(),
+                    "ats_source": job.get("ats_source", "unknown").lower().strip(),
+                    "last_seen": now,
+                    "is_active": True,
+                    **_salary_columns(job),
+                }
+                for job in salaried[i:i + batch_size]
+            ]
+            try:
+                _retry(lambda r=rows: (
+                    get_client()
+                    .table("jobs")
+                    .upsert(r, on_conflict="url_hash")
+                    .execute()
+                ))
+            except Exception as e:
+                logger.warning("Failed to update salary batch: %s", e)
+                for job in salaried[i:i + batch_size]:
+                    job["write_failed"] = True
+
+        salaried_hashes = {j["url_hash"] for j in salaried}
+        unsalaried = [j for j in existing_jobs if j["url_hash"] not in salaried_hashes]
+        for i in range(0, len(unsalaried), 200):
+            chunk = [j["url_hash"] for j in unsalaried[i:i + 200]]
             try:
                 _retry(lambda c=chunk: (
                     get_client()
@@ -389,6 +457,11 @@ def batch_insert_jobs(jobs: list[dict[str, Any]], batch_size: int = 500) -> tupl
                 ))
             except Exception as e:
                 logger.warning("Failed to update last_seen batch: %s", e)
+                for job in unsalaried[i:i + 200]:
+                    job["write_failed"] = True
+
+    if not new_jobs:
+        return 0, len(existing_jobs)
 
     # Insert new jobs in batches using upsert to handle any remaining dupes
     new_count = 0
@@ -420,11 +493,8 @@ def batch_insert_jobs(jobs: list[dict[str, Any]], batch_size: int = 500) -> tupl
                 else:
                     row["location"] = str(loc).strip()
             if job.get("description"):
-                row["description"] = job["description"][:500].strip()
-            if job.get("salary_min") is not None:
-                row["salary_min"] = job["salary_min"]
-            if job.get("salary_max") is not None:
-                row["salary_max"] = job["salary_max"]
+                row["description"] = job["description"][:JOB_DESCRIPTION_CHARS].strip()
+            row.update(_salary_columns(job))
             if job.get("remote_type") and job["remote_type"] in ("remote", "onsite", "hybrid", "unknown"):
                 row["remote_type"] = job["remote_type"]
             if job.get("seniority"):
@@ -449,11 +519,61 @@ def batch_insert_jobs(jobs: list[dict[str, Any]], batch_size: int = 500) -> tupl
             new_count += len(result.data) if result.data else 0
         except Exception as e:
             logger.error("Batch upsert failed: %s", e)
+            for job in batch:
+                job["write_failed"] = True
 
     logger.info("Batch insert: %d new, %d existing (updated last_seen)", new_count, len(existing_jobs))
     return new_count, len(existing_jobs)
 
 
+def update_job_descriptions(patches: list[tuple[str, str]]) -> int:
+    """
+    Set full descriptions on stored jobs: patches are (url_hash, description).
+    Each row is its own update — PostgREST can't bulk-update different values.
+    Returns the number of rows patched.
+    """
+    patched = 0
+    for url_hash, description in patches:
+        try:
+            _retry(lambda h=url_hash, d=description: (
+                get_client()
+                .table("jobs")
+                .update({"description": d})
+                .eq("url_hash", h)
+                .execute()
+            ))
+            patched += 1
+        except Exception as e:
+            logger.warning("Failed to patch description for %s: %s", url_hash, e)
+    return patched
+
+
+def touch_company_jobs(company_id: str, seen_since: str | None = None) -> int | None:
+    """
+    Refresh last_seen for a company whose board hasn't changed since the last scrape.
+    Only jobs seen at or after `seen_since` (the previous scrape) are touched, so
+    postings that had already dropped off the board still go stale normally.
+    Returns count of jobs touched, or None if the update failed.
+    """
+    now = datetime.now(timezone.utc).isoformat()
+    query = (
+        get_client()
+        .table("jobs")
+        .update({"last_seen": now})
+        .eq("company_id", company_id)
+        .eq("is_active", True)
+    )
+    if seen_since:
+        query = query.gte("last_seen", seen_since)
+
+    try:
+        result = _retry(lambda: query.execute())
+        return len(result.data) if result.data else 0
+    except Exception as e:
+        logger.warning("Failed to touch jobs for company %s: %s", company_id, e)
+        return None
+
+
 def mark_stale_jobs(ats_source: str, active_url_hashes: set[str]) -> int:
     """
     Mark jobs as inactive if they weren't seen in the latest scrape.
@@ -497,6 +617,8 @@ def start_scrape_run(
     source: str,
     job_title: str | None = None,
     config: dict[str, Any] | None = None,
+    run_group: str | None = None,
+    shard: tuple[int, int] | None = None,
 ) -> str:
     """Create a new scrape_run record. Returns the run ID."""
     row: dict[str, Any] = {
@@ -508,6 +630,10 @@ def start_scrape_run(
         row["job_title"] = job_title
     if config:
         row["config"] = config
+    if run_group:
+        row["run_group"] = run_group
+    if shard:
+        row["shard_index"], row["shard_count"] = shard
 
     result = get_client().table("scrape_runs").insert(row).execute()
     run_id: str = result.data[0]["id"]
@@ -521,19 +647,23 @@ def finish_scrape_run(
     new_found: int = 0,
     errors: int = 0,
     status: str = "completed",
+    metrics: dict[str, Any] | None = None,
 ) -> None:
-    """Mark a scrape run as finished with stats."""
+    """Mark a scrape run as finished with stats (and per-stage metrics, see metrics.py)."""
+    updates: dict[str, Any] = {
+        "total_found": total_found,
+        "new_found": new_found,
+        "errors": errors,
+        "status": status,
+        "finished_at": datetime.now(timezone.utc).isoformat(),
+    }
+    if metrics is not None:
+        updates["metrics"] = metrics
     try:
         (
             get_client()
             .table("scrape_runs")
-            .update({
-                "total_found": total_found,
-                "new_found": new_found,
-                "errors": errors,
-                "status": status,
-                "finished_at": datetime.now(timezone.utc).isoformat(),
-            })
+            .update(updates)
             .eq("id", run_id)
             .execute()
         )
@@ -545,6 +675,23 @@ def finish_scrape_run(
         logger.error("Failed to finish scrape run %s: %s", run_id, e)
 
 
+def get_run_group_totals(run_group: str, source: str = "ats_scraper") -> dict[str, Any] | None:
+    """Merged totals across every shard of a run group (see scrape_run_groups view)."""
+    try:
+        result = (
+            get_client()
+            .table("scrape_run_groups")
+            .select("*")
+            .eq("run_group", run_group)
+            .eq("source", source)
+            .execute()
+        )
+        return result.data[0] if result.data else None
+    except Exception as e:
+        logger.error("Failed to fetch run group %s: %s", run_group, e)
+        return None
+
+
 # ---------------------------------------------------------------------------
 # Cleanup
 # ---------------------------------------------------------------------------
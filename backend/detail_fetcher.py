@@ -0,0 +1,219 @@
+"""
+Jobsekr — Detail-Fetch Stage for New Jobs
+
+SmartRecruiters, Workable and Rippling listings carry little or no description.
+After a scrape batch is inserted, its new jobs from those ATSes are queued here;
+a small pool of workers fetches each job's detail endpoint — with its own
+session, concurrency cap and per-host rate limits, so listing scrapes are never
+slowed down — and patches the stored descriptions in batches, cut to
+JOB_DESCRIPTION_CHARS like every other description writer.
+
+Usage (inside run_scraper):
+    details = DetailFetcher()
+    await details.start()
+    details.submit(job)          # job dicts after db.batch_insert_jobs (is_new set)
+    await details.close(timeout)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from typing import Any, Callable
+
+import aiohttp
+
+from config import (
+    SCRAPE_DETAIL_BATCH_SIZE,
+    SCRAPE_DETAIL_CONCURRENCY,
+    SCRAPE_DETAIL_MAX_RPS,
+    SCRAPE_DETAIL_QUEUE_SIZE,
+    SCRAPE_TIMEOUT,
+)
+import db
+import json_codec
+from parsers.text import description_text
+from rate_limiter import HostRateLimiter
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class DetailTask:
+    url_hash: str
+    ats: str
+    url: str  # detail endpoint
+
+
+# ---------------------------------------------------------------------------
+# Per-ATS detail endpoints and response shapes
+# ---------------------------------------------------------------------------
+
+def _smartrecruiters_url(slug: str, raw: dict[str, Any]) -> str | None:
+    if raw.get("ref"):
+        return raw["ref"]
+    job_id = raw.get("id") or raw.get("uuid")
+    return f"https://api.smartrecruiters.com/v1/companies/{slug}/postings/{job_id}" if job_id else None
+
+
+def _smartrecruiters_html(data: dict[str, Any]) -> str:
+    # {"jobAd": {"sections": {"jobDescription": {"text": "<p>..."}, "qualifications": {...}, ...}}}
+    sections = (data.get("jobAd") or {}).get("sections") or {}
+    order = ("jobDescription", "qualifications", "additionalInformation", "companyDescription")
+    return " ".join((sections.get(k) or {}).get("text") or "" for k in order)
+
+
+def _workable_url(slug: str, raw: dict[str, Any]) -> str | None:
+    shortcode = raw.get("shortcode")
+    return f"https://apply.workable.com/api/v2/accounts/{slug}/jobs/{shortcode}" if shortcode else None
+
+
+def _workable_html(data: dict[str, Any]) -> str:
+    # {"description": "<p>...", "requirements": "<ul>...", "benefits": "..."}
+    return " ".join(data.get(k) or "" for k in ("description", "requirements", "benefits"))
+
+
+def _rippling_url(slug: str, raw: dict[str, Any]) -> str | None:
+    job_id = raw.get("id") or raw.get("uuid")
+    return f"https://ats.rippling.com/api/{slug}/jobs/{job_id}" if job_id else None
+
+
+def _rippling_html(data: dict[str, Any]) -> str:
+    # "description" is either HTML or {"company": "<p>...", "role": "<p>..."}
+    description = data.get("description") or ""
+    if isinstance(description, dict):
+        return " ".join(description.get(k) or "" for k in ("role", "company"))
+    return str(description)
+
+
+DETAIL_ATS: dict[str, tuple[Callable[[str, dict[str, Any]], str | None], Callable[[dict[str, Any]], str]]] = {
+    "smartrecruiters": (_smartrecruiters_url, _smartrecruiters_html),
+    "workable": (_workable_url, _workable_html),
+    "rippling": (_rippling_url, _rippling_html),
+}
+
+
+def task_for(job: dict[str, Any]) -> DetailTask | None:
+    """Detail task for an inserted job dict, or None if it needs none."""
+    ats = job.get("ats_source")
+    if ats not in DETAIL_ATS or not job.get("is_new") or job.get("description"):
+        return None
+    url = DETAIL_ATS[ats][0](job.get("company_slug") or "", job.get("raw_data") or {})
+    return DetailTask(url_hash=job["url_hash"], ats=ats, url=url) if url else None
+
+
+# ---------------------------------------------------------------------------
+# Fetcher
+# ---------------------------------------------------------------------------
+
+class DetailFetcher:
+    """Bounded queue of detail fetches drained by a worker pool."""
+
+    def __init__(
+        self,
+        concurrency: int = SCRAPE_DETAIL_CONCURRENCY,
+        max_rps: float = SCRAPE_DETAIL_MAX_RPS,
+        queue_size: int = SCRAPE_DETAIL_QUEUE_SIZE,
+        batch_size: int = SCRAPE_DETAIL_BATCH_SIZE,
+    ) -> None:
+        self.concurrency = concurrency
+        self.batch_size = batch_size
+        self.limiter = HostRateLimiter(initial_rps=max_rps, max_rps=max_rps, subdomain_max_rps=max_rps)
+        self.queued = 0
+        self.fetched = 0
+        self.failed = 0
+        self.dropped = 0
+        self.patched = 0
+        self._queue: asyncio.Queue[DetailTask] = asyncio.Queue(maxsize=queue_size)
+        self._pending: list[tuple[str, str]] = []
+        self._workers: list[asyncio.Task[None]] = []
+        self._session: aiohttp.ClientSession | None = None
+
+    async def start(self) -> None:
+        self._session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=self.concurrency))
+        self._workers = [asyncio.create_task(self._worker()) for _ in range(self.concurrency)]
+
+    def submit(self, job: dict[str, Any]) -> None:
+        """Queue a freshly inserted job if its ATS needs a detail fetch. Never blocks."""
+        task = task_for(job)
+        if task is None:
+            return
+        try:
+            self._queue.put_nowait(task)
+            self.queued += 1
+        except asyncio.QueueFull:
+            self.dropped += 1
+
+    async def close(self, timeout: float | None = None) -> None:
+        """Drain the queue (for at most `timeout` seconds), stop the workers and write the last patches."""
+        if self._session is None:
+            return  # never started, or already closed
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout)
+        except asyncio.TimeoutError:
+            self.dropped += self._queue.qsize()
+            logger.warning("Detail fetch stopped at the deadline with %d jobs left", self._queue.qsize())
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        await self._session.close()
+        self._session = None
+        await self._write(self._pending)
+        self._pending = []
+
+    async def _worker(self) -> None:
+        while True:
+            task = await self._queue.get()
+            try:
+                description = await self._fetch(task)
+                if description:
+                    self._pending.append((task.url_hash, description))
+                    if len(self._pending) >= self.batch_size:
+                        patches, self._pending = self._pending, []
+                        await self._write(patches)
+            except Exception as e:
+                # One bad response or DB hiccup must not take the worker down for the rest of the run
+                self.failed += 1
+                logger.warning("Detail fetch failed for %s: %s", task.url, e)
+            finally:
+                self._queue.task_done()
+
+    async def _fetch(self, task: DetailTask) -> str | None:
+        assert self._session is not None
+        bucket = self.limiter.get(task.ats, task.url)
+        await bucket.acquire()
+        try:
+            async with self._session.get(
+                task.url,
+                timeout=aiohttp.ClientTimeout(total=SCRAPE_TIMEOUT),
+                headers={"Accept": "application/json"},
+            ) as resp:
+                if resp.status == 429 or resp.status >= 500:
+                    bucket.on_throttle()
+                else:
+                    bucket.on_success()
+                if resp.status != 200:
+                    self.failed += 1
+                    return None
+                data = json_codec.loads(await resp.read())
+        except (asyncio.TimeoutError, aiohttp.ClientError, ValueError) as e:
+            logger.debug("Detail fetch failed for %s: %s", task.url, e)
+            self.failed += 1
+            return None
+        self.fetched += 1
+        if not isinstance(data, dict):
+            return None
+        return description_text(DETAIL_ATS[task.ats][1](data)) or None
+
+    async def _write(self, patches: list[tuple[str, str]]) -> None:
+        if patches:
+            self.patched += await asyncio.to_thread(db.update_job_descriptions, patches)
+
+    def log_summary(self) -> None:
+        if not (self.queued or self.dropped):
+            return
+        logger.info(
+            "Detail fetch: %d queued, %d fetched, %d failed, %d dropped, %d descriptions stored",
+            self.queued, self.fetched, self.failed, self.dropped, self.patched,
+        )
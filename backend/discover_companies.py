@@ -22,6 +22,9 @@ Usage:
 
     # Dry run:
     python discover_companies.py --dry-run
+
+    # Profile (cProfile, slow event-loop callbacks) into ./profiles:
+    python discover_companies.py --dry-run --profile
 """
 
 from __future__ import annotations
@@ -55,6 +58,8 @@ from config import (
     SLUG_PATTERNS,
 )
 import db
+import json_codec
+import profiling
 
 logging.basicConfig(format=LOG_FORMAT, level=LOG_LEVEL)
 logger = logging.getLogger(__name__)
@@ -190,7 +195,7 @@ async def discover_from_yc(session: aiohttp.ClientSession) -> list[DiscoveredCom
             ) as resp:
                 if resp.status != 200:
                     continue
-                data = await resp.json(content_type=None)
+                data = json_codec.loads(await resp.read())
 
                 if isinstance(data, list):
                     company_list = data
@@ -275,7 +280,7 @@ async def probe_company(
             ) as resp:
                 if resp.status == 200:
                     try:
-                        data = await resp.json(content_type=None)
+                        data = json_codec.loads(await resp.read())
                         job_count = _count_jobs_in_response(data, ats)
                         return slug, ats, True, job_count
                     except Exception:
@@ -489,6 +494,7 @@ async def run_discovery(
                         total_discovered += 1
                     else:
                         errors += 1
+            profiling.mark("github")
 
         # ---------------------------------------------------------------
         # Source 2: YC
@@ -517,6 +523,7 @@ async def run_discovery(
                         total_discovered += 1
                     else:
                         errors += 1
+            profiling.mark("yc")
 
     # ---------------------------------------------------------------
     # Probe unverified companies
@@ -525,6 +532,7 @@ async def run_discovery(
         logger.info("=== Probing unverified companies ===")
         verified, probed = await probe_unverified_companies()
         logger.info("Probed %d, verified %d", probed, verified)
+        profiling.mark("probe")
 
     # ---------------------------------------------------------------
     # Cross-probe LinkedIn companies
@@ -533,6 +541,7 @@ async def run_discovery(
         logger.info("=== Cross-probing LinkedIn companies ===")
         cross_found = await cross_probe_linkedin_companies()
         total_discovered += cross_found
+        profiling.mark("cross_probe")
 
     # ---------------------------------------------------------------
     # Summary
@@ -567,18 +576,23 @@ def main() -> None:
     parser.add_argument("--cross-probe-only", action="store_true", help="Only cross-probe LinkedIn companies")
     parser.add_argument("--dry-run", action="store_true", help="Don't write to database")
 
+    profiling.add_profile_args(parser)
+
     args = parser.parse_args()
 
     if args.probe_only:
-        asyncio.run(run_discovery(github=False, yc=False, probe=True, cross_probe=False, dry_run=args.dry_run))
+        discovery = run_discovery(github=False, yc=False, probe=True, cross_probe=False, dry_run=args.dry_run)
     elif args.github_only:
-        asyncio.run(run_discovery(github=True, yc=False, probe=False, cross_probe=False, dry_run=args.dry_run))
+        discovery = run_discovery(github=True, yc=False, probe=False, cross_probe=False, dry_run=args.dry_run)
     elif args.yc_only:
-        asyncio.run(run_discovery(github=False, yc=True, probe=False, cross_probe=False, dry_run=args.dry_run))
+        discovery = run_discovery(github=False, yc=True, probe=False, cross_probe=False, dry_run=args.dry_run)
     elif args.cross_probe_only:
-        asyncio.run(run_discovery(github=False, yc=False, probe=False, cross_probe=True, dry_run=args.dry_run))
+        discovery = run_discovery(github=False, yc=False, probe=False, cross_probe=True, dry_run=args.dry_run)
     else:
-        asyncio.run(run_discovery(dry_run=args.dry_run))
+        discovery = run_discovery(dry_run=args.dry_run)
+
+    with profiling.session("discover_companies", args) as profile:
+        asyncio.run(profile.watch(discovery))
 
 
 if __name__ == "__main__":
@@ -11,6 +11,7 @@ Usage:
     python harvest_github.py
     python harvest_github.py --dry-run
     python harvest_github.py --probe   # also probe unmatched companies
+    python harvest_github.py --dry-run --profile
 """
 
 from __future__ import annotations
@@ -39,6 +40,8 @@ from config import (
     SCRAPE_TIMEOUT,
 )
 import db
+import json_codec
+import profiling
 from seed_from_results import extract_slug_from_url
 
 logging.basicConfig(format=LOG_FORMAT, level=LOG_LEVEL)
@@ -178,7 +181,7 @@ async def probe_company_against_all_ats(
                 ) as resp:
                     if resp.status == 200:
                         try:
-                            data = await resp.json(content_type=None)
+                            data = json_codec.loads(await resp.read())
                             job_count = _count_jobs(data)
                             if job_count > 0:
                                 found.append({
@@ -226,6 +229,8 @@ async def run_harvest(dry_run: bool = False, probe: bool = False) -> None:
             logger.info("  Found %d company links", len(companies))
             all_companies.extend(companies)
 
+    profiling.mark("fetch")
+
     # Deduplicate
     unique = deduplicate(all_companies)
     ats_companies = [c for c in unique if c["ats"] != "unknown"]
@@ -329,9 +334,11 @@ def main() -> None:
     parser = argparse.ArgumentParser(description="Harvest companies from GitHub repos")
     parser.add_argument("--dry-run", action="store_true", help="Show what would be added")
     parser.add_argument("--probe", action="store_true", help="Cross-probe unknown companies")
+    profiling.add_profile_args(parser)
     args = parser.parse_args()
 
-    asyncio.run(run_harvest(dry_run=args.dry_run, probe=args.probe))
+    with profiling.session("harvest_github", args) as profile:
+        asyncio.run(profile.watch(run_harvest(dry_run=args.dry_run, probe=args.probe)))
 
 
 if __name__ == "__main__":
@@ -0,0 +1,70 @@
+"""
+Jobsekr — JSON Decoding
+
+Decodes ATS responses straight from the raw response bytes with the fastest
+backend installed: orjson, then msgspec, then the stdlib json module.
+Set JSON_DECODER=orjson|msgspec|stdlib to force a specific backend.
+
+Every backend raises ValueError on malformed input.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from typing import Any, Callable
+
+logger = logging.getLogger(__name__)
+
+Decoder = Callable[[bytes], Any]
+
+
+def _stdlib_loads(data: bytes) -> Any:
+    return json.loads(data)
+
+
+def _build_decoders() -> dict[str, Decoder]:
+    """Available decoders, fastest first."""
+    decoders: dict[str, Decoder] = {}
+
+    try:
+        import orjson
+        # orjson.JSONDecodeError already subclasses ValueError
+        decoders["orjson"] = orjson.loads
+    except ImportError:
+        pass
+
+    try:
+        import msgspec
+
+        _msgspec_decode = msgspec.json.decode
+
+        def _msgspec_loads(data: bytes) -> Any:
+            try:
+                return _msgspec_decode(data)
+            except msgspec.DecodeError as e:
+                raise ValueError(str(e)) from e
+
+        decoders["msgspec"] = _msgspec_loads
+    except ImportError:
+        pass
+
+    decoders["stdlib"] = _stdlib_loads
+    return decoders
+
+
+DECODERS: dict[str, Decoder] = _build_decoders()
+
+
+def get_decoder(name: str | None = None) -> tuple[str, Decoder]:
+    """Return (name, decoder) — the requested backend if installed, else the fastest one."""
+    if name:
+        if name in DECODERS:
+            return name, DECODERS[name]
+        logger.warning("JSON decoder %r not installed, falling back to %s", name, next(iter(DECODERS)))
+    first = next(iter(DECODERS))
+    return first, DECODERS[first]
+
+
+DECODER_NAME, loads = get_decoder(os.environ.get("JSON_DECODER"))
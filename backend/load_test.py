@@ -0,0 +1,133 @@
+"""
+Jobsekr — Scraper Load Test
+
+Starts mock_ats_server.py in a subprocess, points run_scraper at N synthetic
+companies spread over all 14 mocked ATSes (dry run — nothing is written to
+the DB), and reports throughput, per-company tail latency and memory.
+
+Usage:
+    python load_test.py --companies 10000
+    python load_test.py --companies 2000 --latency-ms 200 --error-rate 0.02 --host-rps 50
+    python load_test.py --url http://127.0.0.1:8765 --companies 500   # server already running
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import importlib
+import logging
+import os
+import resource
+import subprocess
+import sys
+import time
+import tracemalloc
+
+import config
+from config import LOG_FORMAT, LOG_LEVEL
+from mock_ats_server import add_config_args, company_rows
+
+logging.basicConfig(format=LOG_FORMAT, level=LOG_LEVEL)
+logger = logging.getLogger(__name__)
+
+
+async def _wait_for_port(host: str, port: int, timeout: float = 15.0) -> None:
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            _, writer = await asyncio.open_connection(host, port)
+            writer.close()
+            return
+        except OSError:
+            if time.monotonic() > deadline:
+                raise RuntimeError(f"mock server did not come up on {host}:{port}")
+            await asyncio.sleep(0.1)
+
+
+def _server_argv(args: argparse.Namespace) -> list[str]:
+    return [
+        sys.executable, "mock_ats_server.py",
+        "--port", str(args.port),
+        "--jobs-median", str(args.jobs_median),
+        "--jobs-max", str(args.jobs_max),
+        "--latency-ms", str(args.latency_ms),
+        "--latency-sigma", str(args.latency_sigma),
+        "--throttle-rate", str(args.throttle_rate),
+        "--error-rate", str(args.error_rate),
+        "--seed", str(args.seed),
+    ]
+
+
+async def run_load_test(args: argparse.Namespace) -> None:
+    # Rate limits and concurrency are read from the environment when config is
+    # imported, so re-read it before the scraper modules are first imported
+    if args.host_rps:
+        os.environ["SCRAPE_HOST_MAX_RPS"] = str(args.host_rps)
+        os.environ["SCRAPE_SUBDOMAIN_HOST_MAX_RPS"] = str(args.host_rps)
+    if args.concurrency:
+        os.environ["SCRAPE_CONCURRENCY"] = str(args.concurrency)
+    importlib.reload(config)
+    import ats_scraper
+
+    server: subprocess.Popen[bytes] | None = None
+    base_url = args.url
+    if not base_url:
+        server = subprocess.Popen(_server_argv(args))
+        base_url = f"http://127.0.0.1:{args.port}"
+        await _wait_for_port("127.0.0.1", args.port)
+
+    companies = company_rows(base_url, args.companies)
+    if args.tracemalloc:
+        tracemalloc.start()
+    start = time.monotonic()
+    try:
+        stats = await ats_scraper.run_scraper(
+            dry_run=True,
+            use_cache=False,
+            fetch_content=False,
+            fetch_details=False,
+            parse_workers=args.parse_workers,
+            company_rows=companies,
+        )
+    finally:
+        if server:
+            server.terminate()
+            server.wait()
+    elapsed = time.monotonic() - start
+
+    if stats is None:
+        return
+    peak_rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    logger.info("=== LOAD TEST ===")
+    logger.info("Companies: %d (%d errors, %d deferred), jobs parsed: %d",
+                len(companies), stats.error_count, stats.deferred, stats.jobs_parsed)
+    logger.info("Wall time: %.1fs — %.1f companies/s, %.0f jobs/s",
+                elapsed, len(companies) / elapsed, stats.jobs_parsed / elapsed)
+    logger.info("Company latency: p50 %.2fs, p95 %.2fs, p99 %.2fs, max %.2fs",
+                stats.latency_percentile(50), stats.latency_percentile(95),
+                stats.latency_percentile(99), max(stats.latencies, default=0.0))
+    logger.info("Peak RSS: %.0f MB", peak_rss_mb)
+    if args.tracemalloc:
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        logger.info("Peak traced Python allocations: %.1f MB", peak / 1024 / 1024)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Jobsekr Scraper Load Test")
+    parser.add_argument("--companies", type=int, default=10000)
+    parser.add_argument("--url", type=str, default=None, help="Use a mock server that is already running")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--host-rps", type=float, default=None,
+                        help="Override per-host max req/s (real ATS limits would dominate a 10k run)")
+    parser.add_argument("--concurrency", type=int, default=None, help="Override SCRAPE_CONCURRENCY")
+    parser.add_argument("--parse-workers", type=int, default=0)
+    parser.add_argument("--tracemalloc", action="store_true", help="Also report peak Python allocations (slower)")
+    add_config_args(parser)
+    args = parser.parse_args()
+    asyncio.run(run_load_test(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""
+Jobsekr — Scrape Run Metrics
+
+Per-stage timings for one ats_scraper.py run, so trends in where a run's
+time goes can be read back from scrape_runs.metrics (or a --metrics-file).
+
+Stages:
+  fetch           ATS requests (time on the wire, bytes downloaded)
+  decode          JSON decoding of page payloads
+  parse           ATS parser → ParsedJob
+  enrich          inferred fields: remote type, seniority, salary, category
+  transform       ParsedJob → job row dicts for the ingest batch
+  dedup_check     url_hash lookups against the jobs table
+  insert          job inserts + last_seen bumps
+  touch           last_seen bumps for unchanged boards
+  company_update  companies row writes
+
+A resumed run (--resume) stores the metrics of the process that finished it,
+with those of the interrupted processes before it under "earlier_processes".
+
+Stages overlap (fetches run concurrently with each other and with DB
+flushes), so a stage's `seconds` is the time spent in it summed over calls,
+not a slice of the run's wall time. Requests also feed a latency histogram
+per host, reported as p50/p95/p99.
+
+Usage:
+    metrics = RunMetrics()
+    with metrics.stage("insert", items=len(jobs)):
+        ...
+    metrics.observe_request(host, seconds, len(body))
+    db.finish_scrape_run(run_id, ..., metrics=metrics.to_dict())
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterator
+
+logger = logging.getLogger(__name__)
+
+STAGES = ("fetch", "decode", "parse", "enrich", "transform", "dedup_check", "insert", "touch", "company_update")
+PERCENTILES = (50, 95, 99)
+
+
+def percentile(values: list[float], pct: float) -> float:
+    """Nearest-rank percentile; 0.0 for no values."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+@dataclass
+class StageStats:
+    """Time spent in one stage, summed over its calls."""
+    seconds: float = 0.0
+    calls: int = 0
+    items: int = 0  # jobs / companies / pages handled, depending on the stage
+    bytes: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "seconds": round(self.seconds, 3),
+            "calls": self.calls,
+            "items": self.items,
+            "bytes": self.bytes,
+        }
+
+
+@dataclass
+class RunMetrics:
+    """Stage timings and per-host request latencies of one scrape run."""
+    stages: dict[str, StageStats] = field(default_factory=lambda: {name: StageStats() for name in STAGES})
+    host_latencies: dict[str, list[float]] = field(default_factory=dict)
+    wall_seconds: dict[str, float] = field(default_factory=dict)  # "run", "fetch_phase", ...
+
+    def add(self, name: str, seconds: float, items: int = 0, nbytes: int = 0) -> None:
+        stage = self.stages.setdefault(name, StageStats())
+        stage.seconds += seconds
+        stage.calls += 1
+        stage.items += items
+        stage.bytes += nbytes
+
+    @contextmanager
+    def stage(self, name: str, items: int = 0) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - start, items)
+
+    def observe_request(self, host: str, seconds: float, nbytes: int = 0) -> None:
+        """One ATS request: counts toward the fetch stage and the host's histogram."""
+        self.add("fetch", seconds, 1, nbytes)
+        self.host_latencies.setdefault(host, []).append(seconds)
+
+    def host_percentiles(self) -> dict[str, dict[str, float]]:
+        return {
+            host: {
+                "requests": len(latencies),
+                **{f"p{p}": round(percentile(latencies, p), 3) for p in PERCENTILES},
+            }
+            for host, latencies in sorted(self.host_latencies.items())
+        }
+
+    def to_dict(self) -> dict[str, Any]:
+        """JSON-ready summary, as stored in scrape_runs.metrics."""
+        return {
+            "wall_seconds": {name: round(s, 3) for name, s in self.wall_seconds.items()},
+            "stages": {name: s.to_dict() for name, s in self.stages.items() if s.calls},
+            "hosts": self.host_percentiles(),
+        }
+
+    def write_json(self, path: str | Path, extra: dict[str, Any] | None = None) -> None:
+        data = {**(extra or {}), **self.to_dict()}
+        Path(path).write_text(json.dumps(data, indent=2) + "\n", encoding="utf-8")
+        logger.info("Run metrics written to %s", path)
+
+    def log_summary(self) -> None:
+        logger.info("Time per stage (summed over overlapping calls):")
+        for name, s in self.stages.items():
+            if not s.calls:
+                continue
+            extra = f", {s.bytes / 1e6:.1f} MB" if s.bytes else ""
+            logger.info("  %-15s %8.1fs  %6d calls  %8d items%s", name, s.seconds, s.calls, s.items, extra)
+        slowest = sorted(self.host_percentiles().items(), key=lambda kv: -kv[1]["p95"])[:5]
+        if slowest:
+            logger.info("Slowest hosts by p95 request latency:")
+            for host, p in slowest:
+                logger.info("  %-40s p50 %.2fs  p95 %.2fs  p99 %.2fs  (%d requests)",
+                            host, p["p50"], p["p95"], p["p99"], p["requests"])
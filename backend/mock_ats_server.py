@@ -0,0 +1,422 @@
+"""
+Jobsekr — Mock ATS Server
+
+Local aiohttp server that emulates the job-board endpoints of all 14 ATSes in
+ATS_API_TEMPLATES, for load-testing the scraper without touching real
+ATSes. Each board is served at /{ats}/{slug} in that ATS's response shape:
+
+  - board sizes are log-normal around --jobs-median (deterministic per slug)
+  - response latency is log-normal around --latency-ms (--latency-sigma)
+  - --throttle-rate / --error-rate inject 429 (with Retry-After) and 503
+  - SmartRecruiters pages by offset/limit, Workable by paging.next cursor
+  - Greenhouse also serves ?content=true and /{slug}/{id}
+
+Usage:
+    python mock_ats_server.py --port 8765
+    python mock_ats_server.py --jobs-median 50 --latency-ms 120 --error-rate 0.01
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+import math
+import random
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Callable
+
+from aiohttp import web
+
+from config import ATS_API_TEMPLATES, LOG_FORMAT, LOG_LEVEL
+
+logging.basicConfig(format=LOG_FORMAT, level=LOG_LEVEL)
+logger = logging.getLogger(__name__)
+
+SMARTRECRUITERS_MAX_LIMIT = 100
+WORKABLE_PAGE_SIZE = 20
+
+_TITLES = (
+    "Software Engineer", "Senior Backend Engineer", "Staff Data Scientist",
+    "Product Manager", "Junior Frontend Developer", "Engineering Manager",
+    "Director of Sales", "Account Executive", "Site Reliability Engineer",
+)
+_LOCATIONS = ("San Francisco, CA", "New York, NY", "Remote", "London, UK", "Berlin, Germany")
+# A typical posting body is a few KB of HTML: intro, responsibilities, requirements, benefits
+_DESCRIPTION = (
+    "<div><h2>About the role</h2><p>Join us to build reliable systems at scale. You will own "
+    "services end to end, from design reviews to on-call, and work closely with product &amp; "
+    "design.</p>"
+    + "<h3>What you'll do</h3><ul>"
+    + "".join(f"<li>Ship and operate <strong>feature area {n}</strong> used by thousands of customers.</li>"
+              for n in range(8))
+    + "</ul><h3>What we're looking for</h3><ul>"
+    + "".join(f"<li>{n}+ years with Python, SQL or Go &mdash; remote-friendly, hybrid options.</li>"
+              for n in range(2, 8))
+    + "</ul><h3>Benefits</h3><p>Competitive salary ($120,000 &ndash; $180,000), equity, "
+    "health, dental &amp; vision, 401(k), and a home-office stipend.</p></div>"
+)
+
+
+@dataclass
+class MockConfig:
+    """Shape of the simulated ATS fleet."""
+    jobs_median: int = 30
+    jobs_sigma: float = 1.0
+    jobs_max: int = 2000
+    latency_ms: float = 80.0
+    latency_sigma: float = 0.6
+    throttle_rate: float = 0.0
+    error_rate: float = 0.0
+    seed: int = 0
+
+    def board_size(self, ats: str, slug: str) -> int:
+        rng = random.Random(f"{self.seed}:{ats}:{slug}")
+        size = int(rng.lognormvariate(math.log(max(self.jobs_median, 1)), self.jobs_sigma))
+        return min(size, self.jobs_max)
+
+    def latency(self) -> float:
+        return random.lognormvariate(math.log(max(self.latency_ms, 0.1)), self.latency_sigma) / 1000
+
+
+# ---------------------------------------------------------------------------
+# Per-ATS payloads: job(slug, i) and envelope(jobs) in each ATS's format
+# ---------------------------------------------------------------------------
+
+def _base(slug: str, i: int) -> tuple[str, str, str]:
+    rng = random.Random(f"{slug}:{i}")
+    return f"{slug}-{i}", f"{rng.choice(_TITLES)} {i}", rng.choice(_LOCATIONS)
+
+
+def _greenhouse(slug: str, i: int, content: bool = False) -> dict[str, Any]:
+    _, title, location = _base(slug, i)
+    job: dict[str, Any] = {
+        "id": 4000000 + i,
+        "title": title,
+        "absolute_url": f"https://boards.greenhouse.io/{slug}/jobs/{4000000 + i}",
+        "location": {"name": location},
+        "updated_at": "2026-02-20T10:00:00-05:00",
+        "metadata": [{"name": "Salary Range", "value": "$120,000 - $180,000"}],
+    }
+    if content:
+        job["content"] = _DESCRIPTION.replace("<", "&lt;").replace(">", "&gt;")
+        job["departments"] = [{"name": "Engineering"}]
+    return job
+
+
+def _lever(slug: str, i: int) -> dict[str, Any]:
+    job_id, title, location = _base(slug, i)
+    return {
+        "id": job_id, "text": title, "hostedUrl": f"https://jobs.lever.co/{slug}/{job_id}",
+        "categories": {"location": location, "team": "Engineering", "commitment": "Full-time"},
+        "descriptionPlain": "Build reliable systems.", "workplaceType": "hybrid", "createdAt": 1771581600000,
+    }
+
+
+def _ashby(slug: str, i: int) -> dict[str, Any]:
+    job_id, title, location = _base(slug, i)
+    return {
+        "id": job_id, "title": title, "jobUrl": f"https://jobs.ashbyhq.com/{slug}/{job_id}",
+        "location": location, "isRemote": location == "Remote", "department": "Engineering",
+        "descriptionPlain": "Build reliable systems.", "publishedAt": "2026-02-20T10:00:00Z",
+    }
+
+
+def _workable(slug: str, i: int) -> dict[str, Any]:
+    job_id, title, location = _base(slug, i)
+    shortcode = f"W{i:06d}"
+    return {
+        "id": job_id, "title": title, "shortcode": shortcode,
+        "url": f"https://apply.workable.com/{slug}/j/{shortcode}/",
+        "location": {"city": location, "country": "United States", "telecommuting": False},
+        "department": "Engineering", "workplace": "on_site", "published": "2026-02-20",
+    }
+
+
+def _smartrecruiters(slug: str, i: int) -> dict[str, Any]:
+    job_id, title, location = _base(slug, i)
+    return {
+        "id": job_id, "name": title, "releasedDate": "2026-02-20T10:00:00.000Z",
+        "location": {"city": location, "country": "us", "remote": location == "Remote"},
+        "department": {"label": "Engineering"}, "experienceLevel": {"label": "Mid-Senior level"},
+        "typeOfEmployment": {"label": "Full-time"},
+    }
+
+
+def _recruitee(slug: str, i: int) -> dict[str, Any]:
+    job_id, title, location = _base(slug, i)
+    return {
+        "id": i, "slug": job_id, "title": title, "status": "published", "location": location,
+        "careers_url": f"https://{slug}.recruitee.com/o/{job_id}", "description": _DESCRIPTION,
+        "department": "Engineering", "remote": location == "Remote", "created_at": "2026-02-20 10:00:00 UTC",
+    }
+
+
+def _dover(slug: str, i: int) -> dict[str, Any]:
+    job_id, title, location = _base(slug, i)
+    return {
+        "id": job_id, "title": title, "url": f"https://app.dover.com/apply/{slug}/{job_id}",
+        "location": location, "description": _DESCRIPTION, "is_remote": location == "Remote",
+        "published_date": "2026-02-20T10:00:00Z",
+    }
+
+
+def _breezy(slug: str, i: int) -> dict[str, Any]:
+    job_id, title, location = _base(slug, i)
+    return {
+        "id": job_id, "friendly_id": job_id, "name": title, "url": f"https://{slug}.breezy.hr/p/{job_id}",
+        "location": {"name": location, "is_remote": location == "Remote"},
+        "description": _DESCRIPTION, "department": "Engineering", "published_date": "2026-02-20T10:00:00Z",
+    }
+
+
+def _bamboohr(slug: str, i: int) -> dict[str, Any]:
+    _, title, location = _base(slug, i)
+    return {
+        "id": str(i), "jobOpeningName": title, "jobOpeningUrl": f"/careers/{i}",
+        "locationLabel": location, "isRemote": "Yes" if location == "Remote" else "No",
+        "departmentLabel": "Engineering", "employmentStatusLabel": "Full-Time",
+    }
+
+
+def _teamtailor(slug: str, i: int) -> dict[str, Any]:
+    job_id, title, location = _base(slug, i)
+    return {
+        "id": str(i), "type": "jobs",
+        "attributes": {"title": title, "body": _DESCRIPTION, "status": "open", "remote-status": "none"},
+        "links": {"careersite-job-url": f"https://{slug}.teamtailor.com/jobs/{i}-{job_id}"},
+    }
+
+
+def _pinpoint(slug: str, i: int) -> dict[str, Any]:
+    job_id, title, location = _base(slug, i)
+    return {
+        "id": str(i), "title": title, "url": f"https://{slug}.pinpointhq.com/postings/{job_id}",
+        "location_name": location, "description": _DESCRIPTION, "remote": location == "Remote",
+    }
+
+
+def _rippling(slug: str, i: int) -> dict[str, Any]:
+    job_id, title, location = _base(slug, i)
+    return {
+        "id": job_id, "title": title, "url": f"https://ats.rippling.com/{slug}/jobs/{job_id}",
+        "location": location, "department": "Engineering", "workplaceType": "ON_SITE",
+        "employmentType": "FULL_TIME", "publishedAt": "2026-02-20T10:00:00Z",
+    }
+
+
+def _personio(slug: str, i: int) -> dict[str, Any]:
+    _, title, location = _base(slug, i)
+    return {
+        "id": i, "name": title, "office": location, "department": "Engineering",
+        "description": _DESCRIPTION, "employmentType": "permanent", "schedule": "full-time",
+        "createdAt": "2026-02-20T10:00:00+00:00",
+    }
+
+
+def _freshteam(slug: str, i: int) -> dict[str, Any]:
+    _, title, location = _base(slug, i)
+    return {
+        "id": i, "title": title, "status": "published", "description": _DESCRIPTION,
+        "branch": {"city": location}, "remote": location == "Remote", "created_at": "2026-02-20T10:00:00Z",
+    }
+
+
+# ats → (job builder, envelope for a list of jobs)
+BOARDS: dict[str, tuple[Callable[[str, int], dict[str, Any]], Callable[[list[Any]], Any]]] = {
+    "greenhouse": (_greenhouse, lambda jobs: {"jobs": jobs, "meta": {"total": len(jobs)}}),
+    "lever": (_lever, lambda jobs: jobs),
+    "ashby": (_ashby, lambda jobs: {"jobs": jobs}),
+    "workable": (_workable, lambda jobs: {"results": jobs}),
+    "smartrecruiters": (_smartrecruiters, lambda jobs: {"content": jobs}),
+    "recruitee": (_recruitee, lambda jobs: {"offers": jobs}),
+    "dover": (_dover, lambda jobs: {"jobs": jobs}),
+    "breezy": (_breezy, lambda jobs: jobs),
+    "bamboohr": (_bamboohr, lambda jobs: {"result": jobs}),
+    "teamtailor": (_teamtailor, lambda jobs: {"data": jobs, "included": []}),
+    "pinpoint": (_pinpoint, lambda jobs: {"data": jobs}),
+    "rippling": (_rippling, lambda jobs: jobs),
+    "personio": (_personio, lambda jobs: jobs),
+    "freshteam": (_freshteam, lambda jobs: jobs),
+}
+assert set(BOARDS) == set(ATS_API_TEMPLATES), "mock server must cover every ATS template"
+
+
+# ATSes whose mock jobs all carry the same workplace field, and the remote_type it means;
+# on the rest only the "Remote" location is flagged, and nothing else says where the job is
+_WORKPLACE_LABELS = {"lever": "hybrid", "workable": "onsite", "rippling": "onsite", "teamtailor": "onsite"}
+
+
+def workplace_label(ats: str, slug: str, i: int) -> str:
+    """The remote_type parsing + enrichment should give job i of a mock board."""
+    if ats in _WORKPLACE_LABELS:
+        return _WORKPLACE_LABELS[ats]
+    return "remote" if _base(slug, i)[2] == "Remote" else "unknown"
+
+
+@lru_cache(maxsize=4096)
+def _board_jobs(ats: str, slug: str, size: int) -> tuple[dict[str, Any], ...]:
+    build = BOARDS[ats][0]
+    return tuple(build(slug, i) for i in range(size))
+
+
+def board_payload(ats: str, slug: str, size: int, content: bool = False) -> Any:
+    """A whole, unpaginated board in the ATS's response shape (Greenhouse with content if asked)."""
+    if ats == "greenhouse" and content:
+        return BOARDS[ats][1]([_greenhouse(slug, i, content=True) for i in range(size)])
+    return BOARDS[ats][1](list(_board_jobs(ats, slug, size)))
+
+
+# ---------------------------------------------------------------------------
+# Server
+# ---------------------------------------------------------------------------
+
+class MockATS:
+    """Request handlers plus counters for one server instance."""
+
+    def __init__(self, config: MockConfig) -> None:
+        self.config = config
+        self.requests = 0
+        self.statuses: dict[int, int] = {}
+
+    def _respond(self, status: int, payload: Any = None, headers: dict[str, str] | None = None) -> web.Response:
+        self.statuses[status] = self.statuses.get(status, 0) + 1
+        if payload is None:
+            return web.Response(status=status, headers=headers)
+        return web.Response(status=status, body=json.dumps(payload), content_type="application/json",
+                            headers=headers)
+
+    async def _fault(self) -> web.Response | None:
+        """Simulated latency, then maybe an injected 429 / 503."""
+        self.requests += 1
+        await asyncio.sleep(self.config.latency())
+        roll = random.random()
+        if roll < self.config.throttle_rate:
+            return self._respond(429, headers={"Retry-After": "1"})
+        if roll < self.config.throttle_rate + self.config.error_rate:
+            return self._respond(503)
+        return None
+
+    async def board(self, request: web.Request) -> web.Response:
+        ats, slug = request.match_info["ats"], request.match_info["slug"]
+        if ats not in BOARDS:
+            return self._respond(404)
+        fault = await self._fault()
+        if fault:
+            return fault
+
+        size = self.config.board_size(ats, slug)
+        jobs = list(_board_jobs(ats, slug, size))
+        query = request.query
+        envelope = BOARDS[ats][1]
+
+        if ats == "greenhouse" and query.get("content") == "true":
+            return self._respond(200, board_payload(ats, slug, size, content=True))
+        if ats == "smartrecruiters":
+            limit = min(int(query.get("limit", SMARTRECRUITERS_MAX_LIMIT)), SMARTRECRUITERS_MAX_LIMIT)
+            offset = int(query.get("offset", 0))
+            return self._respond(200, {
+                "totalFound": size, "offset": offset, "limit": limit,
+                "content": jobs[offset:offset + limit],
+            })
+        if ats == "workable":
+            start = int(query.get("token", 0))
+            end = start + WORKABLE_PAGE_SIZE
+            page: dict[str, Any] = {"total": size, "results": jobs[start:end]}
+            if end < size:
+                page["paging"] = {"next": str(end)}
+            return self._respond(200, page)
+        return self._respond(200, envelope(jobs))
+
+    async def greenhouse_job(self, request: web.Request) -> web.Response:
+        slug, job_id = request.match_info["slug"], request.match_info["job_id"]
+        fault = await self._fault()
+        if fault:
+            return fault
+        i = int(job_id) - 4000000
+        if not 0 <= i < self.config.board_size("greenhouse", slug):
+            return self._respond(404)
+        return self._respond(200, _greenhouse(slug, i, content=True))
+
+    def make_app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_get("/greenhouse/{slug}/{job_id:\\d+}", self.greenhouse_job)
+        app.router.add_get("/{ats}/{slug}", self.board)
+        return app
+
+
+async def start_server(config: MockConfig, host: str = "127.0.0.1", port: int = 8765) -> tuple[web.AppRunner, MockATS]:
+    """Start a mock server in the running loop. Stop it with `await runner.cleanup()`."""
+    mock = MockATS(config)
+    runner = web.AppRunner(mock.make_app(), access_log=None)
+    await runner.setup()
+    await web.TCPSite(runner, host, port).start()
+    logger.info("Mock ATS server on http://%s:%d/{ats}/{slug}", host, port)
+    return runner, mock
+
+
+def company_rows(base_url: str, count: int, ats_list: list[str] | None = None) -> list[dict[str, Any]]:
+    """Synthetic verified companies spread round-robin over the mock's ATSes."""
+    ats_list = ats_list or sorted(BOARDS)
+    rows: list[dict[str, Any]] = []
+    for i in range(count):
+        ats = ats_list[i % len(ats_list)]
+        slug = f"co{i:05d}"
+        rows.append({
+            "id": f"mock-{i}",
+            "slug": slug,
+            "name": f"Mock Company {i}",
+            "ats": ats,
+            "api_url": f"{base_url.rstrip('/')}/{ats}/{slug}",
+            "job_count": 0,
+        })
+    return rows
+
+
+def add_config_args(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--jobs-median", type=int, default=30, help="Median jobs per board")
+    parser.add_argument("--jobs-max", type=int, default=2000)
+    parser.add_argument("--latency-ms", type=float, default=80.0, help="Median response latency")
+    parser.add_argument("--latency-sigma", type=float, default=0.6, help="Log-normal spread of latency")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="Fraction of requests answered 429")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered 503")
+    parser.add_argument("--seed", type=int, default=0)
+
+
+def config_from_args(args: argparse.Namespace) -> MockConfig:
+    return MockConfig(
+        jobs_median=args.jobs_median,
+        jobs_max=args.jobs_max,
+        latency_ms=args.latency_ms,
+        latency_sigma=args.latency_sigma,
+        throttle_rate=args.throttle_rate,
+        error_rate=args.error_rate,
+        seed=args.seed,
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Jobsekr Mock ATS Server")
+    parser.add_argument("--host", type=str, default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    add_config_args(parser)
+    args = parser.parse_args()
+
+    async def serve() -> None:
+        runner, mock = await start_server(config_from_args(args), args.host, args.port)
+        try:
+            await asyncio.Event().wait()
+        finally:
+            logger.info("Served %d requests: %s", mock.requests, mock.statuses)
+            await runner.cleanup()
+
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+Jobsekr — Paginated ATS Boards
+
+Most ATS board endpoints return every job in one response. SmartRecruiters
+(offset/limit, max 100 per page) and Workable (paging.next cursor) don't,
+so large employers are truncated unless the remaining pages are fetched.
+
+    first_page_url(ats, api_url)       → URL for page one (asks for the max page size)
+    paging_fields(ats, body)           → a page's paging fields, without decoding its jobs
+    offset_page_urls(ats, url, data)   → remaining offset pages, fetched concurrently
+    cursor_next_url(ats, url, data)    → next cursor page, fetched sequentially
+    merge_pages(ats, pages)            → one payload the ATS parser understands
+"""
+
+from __future__ import annotations
+
+import re
+from typing import Any
+from urllib.parse import parse_qsl, urlencode, urljoin, urlparse, urlunparse
+
+import json_codec
+
+SMARTRECRUITERS_PAGE_SIZE: int = 100
+
+# ATS → key holding the job list in each page
+PAGINATED_ATS: dict[str, str] = {
+    "smartrecruiters": "content",
+    "workable": "results",
+}
+
+# Paging keys in a raw page. Only a key can match: a quote inside a JSON string is escaped
+_TOTAL_FOUND = re.compile(rb'"totalFound"\s*:\s*(\d+)')
+_LIMIT = re.compile(rb'"limit"\s*:\s*(\d+)')
+_PAGING = re.compile(rb'"paging"\s*:\s*(\{[^{}]*\}|null)')
+_NEXT_PAGE = re.compile(rb'"nextPage"\s*:\s*("(?:[^"\\]|\\.)*"|null)')
+
+
+def _with_params(url: str, **params: Any) -> str:
+    parsed = urlparse(url)
+    query = dict(parse_qsl(parsed.query))
+    query.update({k: str(v) for k, v in params.items()})
+    return urlunparse(parsed._replace(query=urlencode(query)))
+
+
+def first_page_url(ats: str, api_url: str) -> str:
+    """Page-one URL. SmartRecruiters defaults to 10 per page, so ask for the maximum."""
+    if ats == "smartrecruiters":
+        return _with_params(api_url, limit=SMARTRECRUITERS_PAGE_SIZE, offset=0)
+    return api_url
+
+
+def paging_fields(ats: str, body: bytes) -> Any:
+    """
+    The fields offset_page_urls / cursor_next_url read, taken from a page's raw
+    bytes. The whole page is decoded once, by the parser (maybe in a worker),
+    not here on the event loop as well; only a page these patterns can't read
+    is decoded in full. Raises ValueError on undecodable payloads.
+    """
+    if ats == "smartrecruiters":
+        # The envelope's keys come before its content, so the first match is the envelope's
+        total, limit = _TOTAL_FOUND.search(body), _LIMIT.search(body)
+        if total and limit and int(limit.group(1)):
+            return {"totalFound": int(total.group(1)), "limit": int(limit.group(1))}
+    elif ats == "workable":
+        # ...and after its results here, so search back from the end
+        fields: dict[str, Any] = {}
+        for key, pattern in (("paging", _PAGING), ("nextPage", _NEXT_PAGE)):
+            if (fields.get("paging") or {}).get("next"):
+                break  # nextPage is only read without a paging.next
+            at = body.rfind(f'"{key}"'.encode())
+            if at == -1:
+                continue
+            match = pattern.match(body, at)
+            if not match:
+                return json_codec.loads(body)
+            fields[key] = json_codec.loads(match.group(1))
+        return fields
+    return json_codec.loads(body)
+
+
+def offset_page_urls(ats: str, api_url: str, first_page: Any, max_pages: int) -> list[str]:
+    """URLs for every page after the first, for ATSes that report a total up front."""
+    if ats != "smartrecruiters" or not isinstance(first_page, dict):
+        return []
+    total = first_page.get("totalFound")
+    limit = first_page.get("limit") or len(first_page.get("content") or [])
+    if not isinstance(total, int) or not isinstance(limit, int) or limit <= 0:
+        return []
+    last_offset = min(total, limit * max_pages)
+    return [
+        _with_params(api_url, limit=limit, offset=offset)
+        for offset in range(limit, last_offset, limit)
+    ]
+
+
+def cursor_next_url(ats: str, page_url: str, page: Any) -> str | None:
+    """URL of the next page for cursor-paginated ATSes, or None on the last page."""
+    if ats != "workable" or not isinstance(page, dict):
+        return None
+    paging = page.get("paging") or {}
+    cursor = paging.get("next") if isinstance(paging, dict) else None
+    cursor = cursor or page.get("nextPage")
+    if not cursor or not isinstance(cursor, str):
+        return None
+    if cursor.startswith(("http://", "https://", "/")):
+        return urljoin(page_url, cursor)
+    # Bare cursor token
+    return _with_params(page_url, token=cursor)
+
+
+def merge_pages(ats: str, pages: list[Any]) -> Any:
+    """Concatenate each page's job list into the first page's envelope."""
+    if len(pages) == 1:
+        return pages[0]
+    key = PAGINATED_ATS.get(ats)
+    merged = pages[0]
+    if not key or not isinstance(merged, dict):
+        return merged
+    jobs = list(merged.get(key) or [])
+    for page in pages[1:]:
+        if isinstance(page, dict):
+            jobs.extend(page.get(key) or [])
+    return {**merged, key: jobs}
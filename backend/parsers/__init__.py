@@ -2,12 +2,17 @@
 SYKR ATS Parsers
 
 Each parser normalizes an ATS API response into a common job schema.
+Fields inferred from text (remote type, seniority, free-text salaries) are
+left empty and filled in afterwards by the enrichment stage (parsers/enrich.py);
+salaries of either kind go through parsers/salary.py.
 """
 
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass, field
-from typing import Any
+from functools import lru_cache
+from typing import Any, Iterable, Iterator
 
 
 @dataclass
@@ -20,45 +25,97 @@ class ParsedJob:
     salary_min: int | None = None
     salary_max: int | None = None
     salary_currency: str = "USD"
-    remote_type: str = "unknown"  # remote | onsite | hybrid | unknown
-    seniority: str | None = None
+    salary_interval: str | None = None  # hour | day | week | month | year as posted; amounts are annual
+    remote_type: str | None = None  # remote | onsite | hybrid | unknown; None until enriched
+    seniority: str | None = None    # None until enriched, unless the ATS states a level
     category: str | None = None
     tags: list[str] = field(default_factory=list)
     posted_at: str | None = None  # ISO 8601
     raw_data: dict[str, Any] = field(default_factory=dict)
+    # Inputs for the enrichment stage (parsers/enrich.py)
+    workplace_hints: list[Any] = field(default_factory=list)  # values of the ATS's workplace/location fields
+    salary_text: str | None = None  # free-text salary ("$120K – $180K") still to be parsed
+
+
+# Workplace keywords in one pass; the kinds found are ranked hybrid > remote > onsite
+_WORKPLACE_TERMS = re.compile(r"hybrid|remote|on-?site|in-office", re.IGNORECASE)
 
 
 def detect_remote_type(
     title: str,
     location: str | None = None,
-    metadata: dict[str, Any] | None = None,
+    fields: Iterable[Any] | None = None,
 ) -> str:
-    """Infer remote type from job title, location, and metadata."""
-    text = f"{title} {location or ''}".lower()
-    meta_str = str(metadata or {}).lower()
+    """
+    Infer remote type from job title, location, and the values of whichever
+    workplace/location fields the parser passes in. Only those values are
+    scanned — never key names or the description.
+    """
+    return remote_type_of(workplace_text(title, location, fields))
+
+
+def workplace_text(title: str, location: str | None = None, fields: Iterable[Any] | None = None) -> str:
+    """The text detect_remote_type scans; equal texts always get the same remote type."""
+    text = f"{title} {location or ''}"
+    if fields:
+        text = " ".join([text, *_field_strings(fields)])
+    return text
 
-    if "hybrid" in text or "hybrid" in meta_str:
+
+def remote_type_of(text: str) -> str:
+    found = {term.lower() for term in _WORKPLACE_TERMS.findall(text)}
+    if not found:
+        return "unknown"
+    if "hybrid" in found:
         return "hybrid"
-    if "remote" in text or "remote" in meta_str:
+    if "remote" in found:
         return "remote"
-    if "on-site" in text or "onsite" in text or "in-office" in text:
-        return "onsite"
-    if "on-site" in meta_str or "onsite" in meta_str:
-        return "onsite"
-    return "unknown"
+    return "onsite"
+
+
+def _field_strings(value: Any) -> Iterator[str]:
+    """String values of a field, walking into dicts and lists."""
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from _field_strings(item)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            yield from _field_strings(item)
+
+
+# One alternative per level; a title can hit several ("Senior Director") and the
+# highest-ranked level wins. Matches are whole words, so "Staffing", "Internal"
+# and "Leadership" don't count.
+_SENIORITY_TERMS = re.compile(
+    r"\b(?:"
+    r"(?P<intern>intern|internship)"
+    r"|(?P<junior>junior|jr\.?|entry[- ]level|new grad)"
+    r"|(?P<director>director|vp|vice president|head of|chief)"
+    r"|(?P<senior>senior|sr\.?|lead|principal|staff)"
+    r"|(?P<manager>manager)"
+    r")(?!\w)",
+)
+_SENIORITY_RANK = ("intern", "junior", "director", "senior", "manager")
+_SENIORITY_CACHE_SIZE = 65536
 
 
 def detect_seniority(title: str) -> str | None:
     """Infer seniority level from job title."""
-    t = title.lower()
-    if any(k in t for k in ("intern ", "internship")):
-        return "intern"
-    if any(k in t for k in ("junior", "jr.", "jr ", "entry level", "entry-level", "new grad")):
-        return "junior"
-    if any(k in t for k in ("senior", "sr.", "sr ", "lead", "principal", "staff")):
-        return "senior"
-    if any(k in t for k in ("director", "vp ", "vice president", "head of", "chief")):
-        return "director"
-    if any(k in t for k in ("manager", "engineering manager")):
-        return "manager"
-    return "mid"
\ No newline at end of file
+    return _classify_title(" ".join(title.lower().split()))
+
+
+@lru_cache(maxsize=_SENIORITY_CACHE_SIZE)
+def _classify_title(normalized: str) -> str:
+    found = {m.lastgroup for m in _SENIORITY_TERMS.finditer(normalized)}
+    for level in _SENIORITY_RANK:
+        if level in found:
+            return level
+    return "mid"
+
+
+def classify_titles(titles: list[str]) -> list[str | None]:
+    """detect_seniority for a batch of titles, classifying each distinct title once."""
+    levels = {title: detect_seniority(title) for title in dict.fromkeys(titles)}
+    return [levels[title] for title in titles]
\ No newline at end of file
@@ -30,10 +30,9 @@ Response:
 
 from __future__ import annotations
 
-import re
 from typing import Any
 
-from parsers import ParsedJob, detect_remote_type, detect_seniority
+from parsers import ParsedJob
 
 
 def parse_jobs(data: dict | list, slug: str) -> list[ParsedJob]:
@@ -63,16 +62,14 @@ def parse_jobs(data: dict | list, slug: str) -> list[ParsedJob]:
         location = raw.get("location")
         description = raw.get("descriptionPlain", "")
 
-        # Salary from compensationTierSummary
-        salary_min, salary_max, salary_currency = _parse_compensation(
-            raw.get("compensationTierSummary", "")
-        )
+        # Salary from compensationTierSummary ("$120K – $180K"), parsed in enrichment
+        salary_text = raw.get("compensationTierSummary") or None
 
         # Remote type — Ashby has explicit isRemote flag
         if raw.get("isRemote") is True:
             remote_type = "remote"
         else:
-            remote_type = detect_remote_type(title, location, raw)
+            remote_type = None
 
         # Tags
         tags: list[str] = []
@@ -88,11 +85,9 @@ def parse_jobs(data: dict | list, slug: str) -> list[ParsedJob]:
             title=title,
             location=location,
             description=description,
-            salary_min=salary_min,
-            salary_max=salary_max,
-            salary_currency=salary_currency,
+            salary_text=salary_text,
             remote_type=remote_type,
-            seniority=detect_seniority(title),
+            workplace_hints=[raw.get("workplaceType"), raw.get("secondaryLocations")],
             category=raw.get("department"),
             tags=tags,
             posted_at=raw.get("publishedAt"),
@@ -100,32 +95,3 @@ def parse_jobs(data: dict | list, slug: str) -> list[ParsedJob]:
         ))
 
     return jobs
-
-
-def _parse_compensation(comp_str: str) -> tuple[int | None, int | None, str]:
-    """Parse Ashby compensation strings like '$120K – $180K'."""
-    if not comp_str:
-        return None, None, "USD"
-
-    currency = "USD"
-    if "€" in comp_str:
-        currency = "EUR"
-    elif "£" in comp_str:
-        currency = "GBP"
-
-    amounts = re.findall(r"[\d,]+\.?\d*[kK]?", comp_str)
-    parsed: list[int] = []
-    for amt in amounts:
-        amt = amt.replace(",", "")
-        if amt.lower().endswith("k"):
-            parsed.append(int(float(amt[:-1]) * 1000))
-        else:
-            val = float(amt)
-            if val > 0:
-                parsed.append(int(val))
-
-    if len(parsed) >= 2:
-        return min(parsed), max(parsed), currency
-    elif len(parsed) == 1:
-        return parsed[0], None, currency
-    return None, None, currency
\ No newline at end of file
@@ -33,7 +33,7 @@ from __future__ import annotations
 import re
 from typing import Any
 
-from parsers import ParsedJob, detect_remote_type, detect_seniority
+from parsers import ParsedJob
 
 
 def parse_jobs(data: dict | list, slug: str) -> list[ParsedJob]:
@@ -76,7 +76,7 @@ def parse_jobs(data: dict | list, slug: str) -> list[ParsedJob]:
         if is_remote:
             remote_type = "remote"
         else:
-            remote_type = detect_remote_type(title, location, raw)
+            remote_type = None
 
         # Tags
         tags: list[str] = []
@@ -89,7 +89,6 @@ def parse_jobs(data: dict | list, slug: str) -> list[ParsedJob]:
             title=title,
             location=location,
             remote_type=remote_type,
-            seniority=detect_seniority(title),
             category=raw.get("departmentLabel") or raw.get("department"),
             tags=tags,
             raw_data=raw,
@@ -30,10 +30,10 @@ Response: array of position objects
 
 from __future__ import annotations
 
-import re
 from typing import Any
 
-from parsers import ParsedJob, detect_remote_type, detect_seniority
+from parsers import ParsedJob
+from parsers.text import description_text
 
 
 def parse_jobs(data: dict | list, slug: str) -> list[ParsedJob]:
@@ -68,18 +68,18 @@ def parse_jobs(data: dict | list, slug: str) -> list[ParsedJob]:
         location = _build_location(raw.get("location"))
 
         # Description
-        description = _clean_html(raw.get("description", ""))
+        description = description_text(raw.get("description", ""))
 
         # Remote
         loc_data = raw.get("location") or {}
         if isinstance(loc_data, dict) and loc_data.get("is_remote") is True:
             remote_type = "remote"
         else:
-            remote_type = detect_remote_type(title, location, raw)
+            remote_type = None
 
         # Seniority from experience field
         exp = raw.get("experience")
-        seniority = _map_experience(exp) or detect_seniority(title)
+        seniority = _map_experience(exp)
 
         # Category
         cat = raw.get("category")
@@ -97,6 +97,7 @@ def parse_jobs(data: dict | list, slug: str) -> list[ParsedJob]:
             location=location,
             description=description,
             remote_type=remote_type,
+            workplace_hints=[loc_data],
             seniority=seniority,
             category=category,
             tags=tags,
@@ -159,12 +160,4 @@ def _map_experience(exp: Any) -> str | None:
         "executive": "director",
         "manager": "manager",
     }
-    return mapping.get(exp_id)
-
-
-def _clean_html(html: str) -> str:
-    if not html:
-        return ""
-    text = re.sub(r"<[^>]+>", " ", html)
-    text = re.sub(r"\s+", " ", text).strip()
-    return text
\ No newline at end of file
+    return mapping.get(exp_id)
\ No newline at end of file
@@ -24,10 +24,11 @@ Note: Dover's API format may vary. This parser handles known variants.
 
 from __future__ import annotations
 
-import re
 from typing import Any
 
-from parsers import ParsedJob, detect_remote_type, detect_seniority
+from parsers import ParsedJob
+from parsers.salary import Salary, salary_from_range
+from parsers.text import description_text
 
 
 def parse_jobs(data: dict | list, slug: str) -> list[ParsedJob]:
@@ -57,16 +58,16 @@ def parse_jobs(data: dict | list, slug: str) -> list[ParsedJob]:
             continue
 
         location = raw.get("location")
-        description = _clean_html(raw.get("description", ""))
+        description = description_text(raw.get("description", ""))
 
         # Salary
-        salary_min, salary_max, salary_currency = _extract_salary(raw)
+        salary, salary_text = _extract_salary(raw)
 
         # Remote
         if raw.get("is_remote") is True:
             remote_type = "remote"
         else:
-            remote_type = detect_remote_type(title, location, raw)
+            remote_type = None
 
         # Tags
         tags: list[str] = []
@@ -79,11 +80,12 @@ def parse_jobs(data: dict | list, slug: str) -> list[ParsedJob]:
             title=title,
             location=location,
             description=description,
-            salary_min=salary_min,
-            salary_max=salary_max,
-            salary_currency=salary_currency,
+            salary_min=salary.min,
+            salary_max=salary.max,
+            salary_currency=salary.currency,
+            salary_interval=salary.interval,
+            salary_text=salary_text,
             remote_type=remote_type,
-            seniority=detect_seniority(title),
             category=raw.get("department"),
             tags=tags,
             posted_at=raw.get("published_date") or raw.get("created_at"),
@@ -93,51 +95,12 @@ def parse_jobs(data: dict | list, slug: str) -> list[ParsedJob]:
     return jobs
 
 
-def _extract_salary(raw: dict[str, Any]) -> tuple[int | None, int | None, str]:
+def _extract_salary(raw: dict[str, Any]) -> tuple[Salary, str | None]:
+    """(structured salary, salary_text) — string salaries are left to enrichment."""
     salary = raw.get("salary")
     if isinstance(salary, dict):
-        sal_min = salary.get("min")
-        sal_max = salary.get("max")
-        currency = salary.get("currency", "USD") or "USD"
-        return (
-            int(sal_min) if sal_min else None,
-            int(sal_max) if sal_max else None,
-            currency,
-        )
+        return salary_from_range(salary.get("min"), salary.get("max"), salary.get("currency")), None
     # Sometimes salary is a string
-    if isinstance(salary, str):
-        return _parse_salary_string(salary)
-    return None, None, "USD"
-
-
-def _parse_salary_string(s: str) -> tuple[int | None, int | None, str]:
-    currency = "USD"
-    if "€" in s:
-        currency = "EUR"
-    elif "£" in s:
-        currency = "GBP"
-
-    amounts = re.findall(r"[\d,]+\.?\d*[kK]?", s)
-    parsed: list[int] = []
-    for amt in amounts:
-        amt = amt.replace(",", "")
-        if amt.lower().endswith("k"):
-            parsed.append(int(float(amt[:-1]) * 1000))
-        else:
-            val = float(amt)
-            if val > 0:
-                parsed.append(int(val))
-
-    if len(parsed) >= 2:
-        return min(parsed), max(parsed), currency
-    elif len(parsed) == 1:
-        return parsed[0], None, currency
-    return None, None, currency
-
-
-def _clean_html(html: str) -> str:
-    if not html:
-        return ""
-    text = re.sub(r"<[^>]+>", " ", html)
-    text = re.sub(r"\s+", " ", text).strip()
-    return text
\ No newline at end of file
+    if isinstance(salary, str) and salary:
+        return Salary(), salary
+    return Salary(), None
\ No newline at end of file
@@ -0,0 +1,107 @@
+"""
+Job Enrichment
+
+Parsers only normalize what an ATS states outright: its remote flag or
+workplace field, its experience level, structured salary fields, the
+department label. Everything inferred is left to this stage, which runs over
+a list of ParsedJobs column by column:
+
+  remote_type  detect_remote_type over title, location and workplace_hints,
+               for jobs the ATS gave no workplace answer (remote_type None)
+  seniority    classify_titles, for jobs without an ATS experience level
+  salary       salary_text through parsers/salary.py into annual
+               salary_min / salary_max, currency and interval (structured
+               ATS salaries already went through it in the parser)
+  category     department labels with whitespace collapsed, "" → None
+
+Each column is reduced to its distinct inputs before anything is computed,
+and an Enricher remembers results across calls, so a scrape run does the work
+once per distinct title / workplace text / salary string / label rather than
+once per job.
+
+Usage:
+    enricher = Enricher()
+    enricher.enrich(jobs)    # in place, after parse_jobs
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Callable, Hashable, TypeVar
+
+from config import ENRICH_MEMO_SIZE
+from parsers import ParsedJob, classify_titles, remote_type_of, workplace_text
+from parsers.salary import parse_salary
+
+logger = logging.getLogger(__name__)
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+COLUMNS = ("remote_type", "seniority", "salary", "category")
+
+
+class Enricher:
+    """Column-wise enrichment with per-column memos that live as long as the Enricher."""
+
+    def __init__(self, memo_size: int = ENRICH_MEMO_SIZE):
+        self.memo_size = memo_size
+        self.memos: dict[str, dict] = {name: {} for name in COLUMNS}
+        self.inputs = {name: 0 for name in COLUMNS}    # values enriched
+        self.computed = {name: 0 for name in COLUMNS}  # distinct values actually worked out
+
+    def enrich(self, jobs: list[ParsedJob]) -> list[ParsedJob]:
+        pending = [job for job in jobs if job.remote_type is None]
+        texts = [workplace_text(job.title, job.location, job.workplace_hints) for job in pending]
+        for job, remote_type in zip(pending, self._column("remote_type", texts, _each(remote_type_of))):
+            job.remote_type = remote_type
+
+        pending = [job for job in jobs if job.seniority is None]
+        titles = [job.title for job in pending]
+        for job, seniority in zip(pending, self._column("seniority", titles, classify_titles)):
+            job.seniority = seniority
+
+        pending = [job for job in jobs if job.salary_text]
+        salaries = [job.salary_text for job in pending]
+        for job, salary in zip(pending, self._column("salary", salaries, _each(parse_salary))):
+            job.salary_min, job.salary_max = salary.min, salary.max
+            job.salary_currency, job.salary_interval = salary.currency, salary.interval
+
+        pending = [job for job in jobs if isinstance(job.category, str)]
+        labels = [job.category for job in pending]
+        for job, category in zip(pending, self._column("category", labels, _each(_clean_label))):
+            job.category = category
+        return jobs
+
+    def _column(self, name: str, values: list[K], compute: Callable[[list[K]], list[V]]) -> list[V]:
+        """Results for a column's values, computing each distinct value not yet memoized once."""
+        memo = self.memos[name]
+        distinct = dict.fromkeys(values)
+        if len(memo) + len(distinct) > self.memo_size:
+            memo.clear()
+        missing = [value for value in distinct if value not in memo]
+        if missing:
+            memo.update(zip(missing, compute(missing)))
+        self.inputs[name] += len(values)
+        self.computed[name] += len(missing)
+        return [memo[value] for value in values]
+
+    def log_summary(self) -> None:
+        if not any(self.inputs.values()):
+            return
+        logger.info("Enrichment (values → distinct computed):")
+        for name in COLUMNS:
+            logger.info("  %-12s %8d → %d", name, self.inputs[name], self.computed[name])
+
+
+def enrich_jobs(jobs: list[ParsedJob]) -> list[ParsedJob]:
+    """One-off enrichment, for callers without a run-wide Enricher."""
+    return Enricher().enrich(jobs)
+
+
+def _each(fn: Callable[[K], V]) -> Callable[[list[K]], list[V]]:
+    return lambda values: [fn(value) for value in values]
+
+
+def _clean_label(label: str) -> str | None:
+    return " ".join(label.split()) or None
@@ -25,10 +25,11 @@ Response:
 
 from __future__ import annotations
 
-import re
 from typing import Any
 
-from parsers import ParsedJob, detect_remote_type, detect_seniority
+from parsers import ParsedJob
+from parsers.salary import Salary, salary_from_range
+from parsers.text import description_text
 
 
 def parse_jobs(data: dict | list, slug: str) -> list[ParsedJob]:
@@ -61,16 +62,16 @@ def parse_jobs(data: dict | list, slug: str) -> list[ParsedJob]:
         location = _build_location(raw.get("branch"))
 
         # Description
-        description = _clean_html(raw.get("description", ""))
+        description = description_text(raw.get("description", ""))
 
         # Salary
-        salary_min, salary_max, salary_currency = _extract_salary(raw.get("salary"))
+        salary = _extract_salary(raw.get("salary"))
 
         # Remote
         if raw.get("remote") is True:
             remote_type = "remote"
         else:
-            remote_type = detect_remote_type(title, location, raw)
+            remote_type = None
 
         # Category
         dept = raw.get("department")
@@ -87,11 +88,12 @@ def parse_jobs(data: dict | list, slug: str) -> list[ParsedJob]:
             title=title,
             location=location,
             description=description,
-            salary_min=salary_min,
-            salary_max=salary_max,
-            salary_currency=salary_currency,
+            salary_min=salary.min,
+            salary_max=salary.max,
+            salary_currency=salary.currency,
+            salary_interval=salary.interval,
             remote_type=remote_type,
-            seniority=detect_seniority(title),
+            workplace_hints=[raw.get("branch")],
             category=category,
             tags=tags,
             posted_at=raw.get("created_at"),
@@ -120,24 +122,7 @@ def _build_location(branch: Any) -> str | None:
     return ", ".join(parts) if parts else None
 
 
-def _extract_salary(salary: Any) -> tuple[int | None, int | None, str]:
+def _extract_salary(salary: Any) -> Salary:
     if not salary or not isinstance(salary, dict):
-        return None, None, "USD"
-
-    sal_min = salary.get("min")
-    sal_max = salary.get("max")
-    currency = salary.get("currency", "USD") or "USD"
-
-    return (
-        int(float(sal_min)) if sal_min else None,
-        int(float(sal_max)) if sal_max else None,
-        currency,
-    )
-
-
-def _clean_html(html: str) -> str:
-    if not html:
-        return ""
-    text = re.sub(r"<[^>]+>", " ", html)
-    text = re.sub(r"\s+", " ", text).strip()
-    return text
\ No newline at end of file
+        return Salary()
+    return salary_from_range(salary.get("min"), salary.get("max"), salary.get("currency"))
\ No newline at end of file
@@ -3,6 +3,7 @@ Greenhouse ATS Parser
 
 API: GET https://boards-api.greenhouse.io/v1/boards/{slug}/jobs
 Optional: ?content=true for full descriptions
+Single job: GET https://boards-api.greenhouse.io/v1/boards/{slug}/jobs/{id} (always has content)
 
 Response:
 {
@@ -15,7 +16,7 @@ Response:
       "updated_at": "2026-02-20T10:00:00-05:00",
       "metadata": [...],
       "departments": [{ "name": "Engineering" }],
-      "content": "<p>Job description HTML...</p>"  (if ?content=true)
+      "content": "&lt;p&gt;Job description HTML...&lt;/p&gt;"  (if ?content=true; entity-escaped)
     }
   ],
   "meta": { "total": 42 }
@@ -24,10 +25,11 @@ Response:
 
 from __future__ import annotations
 
-import re
+import html
 from typing import Any
 
-from parsers import ParsedJob, detect_remote_type, detect_seniority
+from parsers import ParsedJob
+from parsers.text import description_text
 
 
 def parse_jobs(data: dict | list, slug: str) -> list[ParsedJob]:
@@ -53,14 +55,11 @@ def parse_jobs(data: dict | list, slug: str) -> list[ParsedJob]:
         location_obj = raw.get("location") or {}
         location = location_obj.get("name") if isinstance(location_obj, dict) else None
 
-        # Description (available if ?content=true was used)
-        description = _clean_html(raw.get("content", ""))
+        # Description (available if ?content=true was used; the HTML arrives entity-escaped)
+        description = description_text(html.unescape(raw.get("content") or ""))
 
         # Salary from metadata
-        salary_min, salary_max, salary_currency = _extract_salary(raw.get("metadata", []))
-
-        # Remote type
-        remote_type = detect_remote_type(title, location, raw)
+        salary_text = _salary_text(raw.get("metadata", []))
 
         # Category from departments
         departments = raw.get("departments", [])
@@ -74,11 +73,8 @@ def parse_jobs(data: dict | list, slug: str) -> list[ParsedJob]:
             title=title,
             location=location,
             description=description,
-            salary_min=salary_min,
-            salary_max=salary_max,
-            salary_currency=salary_currency,
-            remote_type=remote_type,
-            seniority=detect_seniority(title),
+            salary_text=salary_text,
+            workplace_hints=[m.get("value") for m in raw.get("metadata") or [] if isinstance(m, dict)],
             category=category,
             posted_at=posted_at,
             raw_data=raw,
@@ -87,53 +83,18 @@ def parse_jobs(data: dict | list, slug: str) -> list[ParsedJob]:
     return jobs
 
 
-def _extract_salary(metadata: list[dict[str, Any]]) -> tuple[int | None, int | None, str]:
-    """Extract salary from Greenhouse metadata field."""
+def _salary_text(metadata: list[dict[str, Any]]) -> str | None:
+    """The salary / compensation value among Greenhouse metadata fields, parsed in enrichment."""
     if not metadata or not isinstance(metadata, list):
-        return None, None, "USD"
+        return None
 
     for item in metadata:
         if not isinstance(item, dict):
             continue
         name = (item.get("name") or "").lower()
-        value = item.get("value") or ""
-
-        if "salary" in name or "compensation" in name:
-            return _parse_salary_string(str(value))
-
-    return None, None, "USD"
-
-
-def _parse_salary_string(s: str) -> tuple[int | None, int | None, str]:
-    """Parse salary strings like '$120,000 - $180,000' or '$120K-$180K'."""
-    currency = "USD"
-    if "€" in s or "eur" in s.lower():
-        currency = "EUR"
-    elif "£" in s or "gbp" in s.lower():
-        currency = "GBP"
-
-    amounts = re.findall(r"[\d,]+\.?\d*[kK]?", s)
-    parsed: list[int] = []
-    for amt in amounts:
-        amt = amt.replace(",", "")
-        if amt.lower().endswith("k"):
-            parsed.append(int(float(amt[:-1]) * 1000))
-        else:
-            val = float(amt)
-            if val > 0:
-                parsed.append(int(val))
-
-    if len(parsed) >= 2:
-        return min(parsed), max(parsed), currency
-    elif len(parsed) == 1:
-        return parsed[0], None, currency
-    return None, None, currency
-
-
-def _clean_html(html: str) -> str:
-    """Strip HTML tags for plain text description."""
-    if not html:
-        return ""
-    text = re.sub(r"<[^>]+>", " ", html)
-    text = re.sub(r"\s+", " ", text).strip()
-    return text
\ No newline at end of file
+        value = item.get("value")
+
+        if ("salary" in name or "compensation" in name) and value:
+            return str(value)
+
+    return None
\ No newline at end of file
@@ -32,7 +32,8 @@ from __future__ import annotations
 
 from typing import Any
 
-from parsers import ParsedJob, detect_remote_type, detect_seniority
+from parsers import ParsedJob
+from parsers.salary import Salary, salary_from_range
 
 
 def parse_jobs(data: dict | list, slug: str) -> list[ParsedJob]:
@@ -65,7 +66,7 @@ def parse_jobs(data: dict | list, slug: str) -> list[ParsedJob]:
         description = raw.get("descriptionPlain", "")
 
         # Salary
-        salary_min, salary_max, salary_currency = _extract_salary(raw)
+        salary = _extract_salary(raw)
 
         # Remote type — Lever has a workplaceType field
         workplace = (raw.get("workplaceType") or "").lower()
@@ -76,7 +77,7 @@ def parse_jobs(data: dict | list, slug: str) -> list[ParsedJob]:
         elif workplace in ("onsite", "on-site"):
             remote_type = "onsite"
         else:
-            remote_type = detect_remote_type(title, location, raw)
+            remote_type = None
 
         # Tags from commitment and team
         tags: list[str] = []
@@ -98,11 +99,12 @@ def parse_jobs(data: dict | list, slug: str) -> list[ParsedJob]:
             title=title,
             location=location,
             description=description,
-            salary_min=salary_min,
-            salary_max=salary_max,
-            salary_currency=salary_currency,
+            salary_min=salary.min,
+            salary_max=salary.max,
+            salary_currency=salary.currency,
+            salary_interval=salary.interval,
             remote_type=remote_type,
-            seniority=detect_seniority(title),
+            workplace_hints=[categories.get("allLocations")],
             category=department,
             tags=tags,
             posted_at=posted_at,
@@ -112,22 +114,11 @@ def parse_jobs(data: dict | list, slug: str) -> list[ParsedJob]:
     return jobs
 
 
-def _extract_salary(raw: dict[str, Any]) -> tuple[int | None, int | None, str]:
-    """Extract salary from Lever's salaryRange field."""
+def _extract_salary(raw: dict[str, Any]) -> Salary:
+    """Extract salary from Lever's salaryRange field (interval: "per-year-salary", "per-hour-wage", ...)."""
     salary_range = raw.get("salaryRange")
     if not salary_range or not isinstance(salary_range, dict):
-        return None, None, "USD"
-
-    sal_min = salary_range.get("min")
-    sal_max = salary_range.get("max")
-    currency = salary_range.get("currency", "USD") or "USD"
-
-    def safe_int(v: Any) -> int | None:
-        if v is None or v == "":
-            return None
-        try:
-            return int(float(v))
-        except (ValueError, TypeError):
-            return None
-
-    return safe_int(sal_min), safe_int(sal_max), currency
\ No newline at end of file
+        return Salary()
+    return salary_from_range(
+        salary_range.get("min"), salary_range.get("max"), salary_range.get("currency"), salary_range.get("interval")
+    )
\ No newline at end of file
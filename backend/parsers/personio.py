@@ -26,10 +26,10 @@ Response:
 
 from __future__ import annotations
 
-import re
 from typing import Any
 
-from parsers import ParsedJob, detect_remote_type, detect_seniority
+from parsers import ParsedJob
+from parsers.text import description_text
 
 
 def parse_jobs(data: dict | list, slug: str) -> list[ParsedJob]:
@@ -62,14 +62,11 @@ def parse_jobs(data: dict | list, slug: str) -> list[ParsedJob]:
             continue
 
         location = raw.get("office") or raw.get("location")
-        description = _clean_html(raw.get("description", ""))
-
-        # Remote
-        remote_type = detect_remote_type(title, location, raw)
+        description = description_text(raw.get("description", ""))
 
         # Seniority from field or title
         personio_seniority = (raw.get("seniority") or "").lower()
-        seniority = _map_seniority(personio_seniority) or detect_seniority(title)
+        seniority = _map_seniority(personio_seniority)
 
         # Tags
         tags: list[str] = raw.get("tags", []) or []
@@ -85,7 +82,6 @@ def parse_jobs(data: dict | list, slug: str) -> list[ParsedJob]:
             title=title,
             location=location,
             description=description,
-            remote_type=remote_type,
             seniority=seniority,
             category=raw.get("department") or raw.get("recruitingCategory"),
             tags=tags,
@@ -107,12 +103,4 @@ def _map_seniority(s: str) -> str | None:
         "executive": "director",
         "manager": "manager",
     }
-    return mapping.get(s)
-
-
-def _clean_html(html: str) -> str:
-    if not html:
-        return ""
-    text = re.sub(r"<[^>]+>", " ", html)
-    text = re.sub(r"\s+", " ", text).strip()
-    return text
\ No newline at end of file
+    return mapping.get(s)
\ No newline at end of file
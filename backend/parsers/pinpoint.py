@@ -27,10 +27,10 @@ Response:
 
 from __future__ import annotations
 
-import re
 from typing import Any
 
-from parsers import ParsedJob, detect_remote_type, detect_seniority
+from parsers import ParsedJob
+from parsers.text import description_text
 
 
 def parse_jobs(data: dict | list, slug: str) -> list[ParsedJob]:
@@ -66,13 +66,13 @@ def parse_jobs(data: dict | list, slug: str) -> list[ParsedJob]:
         location = attrs.get("location_name") or attrs.get("location")
 
         # Description
-        description = _clean_html(attrs.get("description", ""))
+        description = description_text(attrs.get("description", ""))
 
         # Remote
         if attrs.get("remote") is True:
             remote_type = "remote"
         else:
-            remote_type = detect_remote_type(title, location, attrs)
+            remote_type = None
 
         # Tags
         tags: list[str] = []
@@ -86,19 +86,10 @@ def parse_jobs(data: dict | list, slug: str) -> list[ParsedJob]:
             location=location,
             description=description,
             remote_type=remote_type,
-            seniority=detect_seniority(title),
             category=attrs.get("department_name") or attrs.get("department"),
             tags=tags,
             posted_at=attrs.get("published_at") or attrs.get("created_at"),
             raw_data=raw,
         ))
 
-    return jobs
-
-
-def _clean_html(html: str) -> str:
-    if not html:
-        return ""
-    text = re.sub(r"<[^>]+>", " ", html)
-    text = re.sub(r"\s+", " ", text).strip()
-    return text
\ No newline at end of file
+    return jobs
\ No newline at end of file
@@ -42,10 +42,11 @@ Response:
 
 from __future__ import annotations
 
-import re
 from typing import Any
 
-from parsers import ParsedJob, detect_remote_type, detect_seniority
+from parsers import ParsedJob
+from parsers.salary import salary_from_range
+from parsers.text import description_text
 
 
 def parse_jobs(data: dict | list, slug: str) -> list[ParsedJob]:
@@ -79,21 +80,21 @@ def parse_jobs(data: dict | list, slug: str) -> list[ParsedJob]:
         location = raw.get("location") or _build_location(raw)
 
         # Description
-        description = _clean_html(raw.get("description", ""))
+        description = description_text(raw.get("description", ""))
 
         # Salary
-        salary_min = _safe_int(raw.get("salary_min"))
-        salary_max = _safe_int(raw.get("salary_max"))
-        salary_currency = raw.get("salary_currency", "USD") or "USD"
+        salary = salary_from_range(
+            raw.get("salary_min"), raw.get("salary_max"), raw.get("salary_currency"), raw.get("salary_period")
+        )
 
         # Remote
         if raw.get("remote") is True:
             remote_type = "remote"
         else:
-            remote_type = detect_remote_type(title, location, raw)
+            remote_type = None
 
         # Seniority from experience_code or title
-        seniority = _map_experience(raw.get("experience_code")) or detect_seniority(title)
+        seniority = _map_experience(raw.get("experience_code"))
 
         # Tags
         tags: list[str] = raw.get("tags", []) or []
@@ -106,9 +107,10 @@ def parse_jobs(data: dict | list, slug: str) -> list[ParsedJob]:
             title=title,
             location=location,
             description=description,
-            salary_min=salary_min,
-            salary_max=salary_max,
-            salary_currency=salary_currency,
+            salary_min=salary.min,
+            salary_max=salary.max,
+            salary_currency=salary.currency,
+            salary_interval=salary.interval,
             remote_type=remote_type,
             seniority=seniority,
             category=raw.get("department"),
@@ -129,16 +131,6 @@ def _build_location(raw: dict[str, Any]) -> str | None:
     return ", ".join(parts) if parts else None
 
 
-def _safe_int(val: Any) -> int | None:
-    if val is None:
-        return None
-    try:
-        v = int(val)
-        return v if v > 0 else None
-    except (ValueError, TypeError):
-        return None
-
-
 def _map_experience(code: str | None) -> str | None:
     if not code:
         return None
@@ -156,12 +148,4 @@ def _map_experience(code: str | None) -> str | None:
         "director": "director",
         "manager": "manager",
     }
-    return mapping.get(code)
-
-
-def _clean_html(html: str) -> str:
-    if not html:
-        return ""
-    text = re.sub(r"<[^>]+>", " ", html)
-    text = re.sub(r"\s+", " ", text).strip()
-    return text
\ No newline at end of file
+    return mapping.get(code)
\ No newline at end of file
@@ -28,10 +28,11 @@ Response:
 
 from __future__ import annotations
 
-import re
 from typing import Any
 
-from parsers import ParsedJob, detect_remote_type, detect_seniority
+from parsers import ParsedJob
+from parsers.salary import Salary, salary_from_range
+from parsers.text import description_text
 
 
 def parse_jobs(data: dict | list, slug: str) -> list[ParsedJob]:
@@ -60,10 +61,10 @@ def parse_jobs(data: dict | list, slug: str) -> list[ParsedJob]:
             url = f"https://ats.rippling.com/{slug}/jobs/{job_id}"
 
         location = raw.get("location")
-        description = _clean_html(raw.get("description", ""))
+        description = description_text(raw.get("description", ""))
 
         # Salary
-        salary_min, salary_max, salary_currency = _extract_salary(raw.get("compensationRange"))
+        salary = _extract_salary(raw.get("compensationRange"))
 
         # Remote
         workplace = (raw.get("workplaceType") or "").upper()
@@ -74,7 +75,7 @@ def parse_jobs(data: dict | list, slug: str) -> list[ParsedJob]:
         elif workplace in ("ONSITE", "ON_SITE", "IN_OFFICE"):
             remote_type = "onsite"
         else:
-            remote_type = detect_remote_type(title, location, raw)
+            remote_type = None
 
         # Tags
         tags: list[str] = []
@@ -87,11 +88,12 @@ def parse_jobs(data: dict | list, slug: str) -> list[ParsedJob]:
             title=title,
             location=location,
             description=description,
-            salary_min=salary_min,
-            salary_max=salary_max,
-            salary_currency=salary_currency,
+            salary_min=salary.min,
+            salary_max=salary.max,
+            salary_currency=salary.currency,
+            salary_interval=salary.interval,
             remote_type=remote_type,
-            seniority=detect_seniority(title),
+            workplace_hints=[workplace],
             category=raw.get("department"),
             tags=tags,
             posted_at=raw.get("publishedAt") or raw.get("created_at"),
@@ -101,24 +103,7 @@ def parse_jobs(data: dict | list, slug: str) -> list[ParsedJob]:
     return jobs
 
 
-def _extract_salary(comp: Any) -> tuple[int | None, int | None, str]:
+def _extract_salary(comp: Any) -> Salary:
     if not comp or not isinstance(comp, dict):
-        return None, None, "USD"
-
-    sal_min = comp.get("min")
-    sal_max = comp.get("max")
-    currency = comp.get("currency", "USD") or "USD"
-
-    return (
-        int(float(sal_min)) if sal_min else None,
-        int(float(sal_max)) if sal_max else None,
-        currency,
-    )
-
-
-def _clean_html(html: str) -> str:
-    if not html:
-        return ""
-    text = re.sub(r"<[^>]+>", " ", html)
-    text = re.sub(r"\s+", " ", text).strip()
-    return text
\ No newline at end of file
+        return Salary()
+    return salary_from_range(comp.get("min"), comp.get("max"), comp.get("currency"), comp.get("interval"))
\ No newline at end of file
@@ -0,0 +1,256 @@
+"""
+Salary Parsing
+
+One engine for every salary the scrapers see, free text ("$120K – $180K",
+"€45.000 - €55.000 per year", "$50-60/hr") as well as the min / max / currency
+(/ interval) fields some ATSes send, normalized so jobs.salary_min and
+salary_max compare across postings:
+
+  amounts    the first amount or range next to a currency, else the first with
+             a "k" (never "401k"), else the first; "k" on either end applies
+             to both ("120-180k"); thousands separators "," "." "'" and spaces
+  currency   ISO code from a code ("EUR", "cad") or symbol ("€", "CA$"),
+             else the default (USD)
+  interval   hour / day / week / month / year from a cue ("/hr", "per month",
+             "annually") or the ATS's field ("per-hour-wage", "ANNUAL"); with
+             none the amounts are annual, and too small to be annual ("$500 -
+             $700") means no salary rather than a guessed hourly or daily rate
+  annual     amounts multiplied up to a year (2080 h, 260 d, 52 w, 12 mo) and
+             stored that way; the stated interval is kept alongside
+
+Text results are memoized, since the same compensation string repeats across
+a board and across runs.
+
+Usage:
+    parse_salary("$50 - $60 / hour")
+    # Salary(min=104000, max=124800, currency='USD', interval='hour')
+    salary_from_range("90000", 120000, "eur", "per-year-salary")
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any
+
+DEFAULT_CURRENCY = "USD"
+ANNUAL_MULTIPLIER = {"hour": 2080, "day": 260, "week": 52, "month": 12, "year": 1}
+# Bounds in USD, scaled for other currencies by _UNITS_PER_USD: amounts with no
+# interval below MIN_ANNUAL are left unparsed, annual amounts above MAX_ANNUAL
+# are IDs or phone numbers, not salaries
+MIN_ANNUAL = 1000
+MAX_ANNUAL = 5_000_000
+# Rough units per USD for the currencies far from parity; only used to scale the
+# bounds above, stored amounts are never converted
+_UNITS_PER_USD = {
+    "JPY": 150, "INR": 85, "CZK": 23, "ZAR": 18, "MXN": 18, "SEK": 10, "NOK": 10,
+    "HKD": 8, "DKK": 7, "BRL": 5, "PLN": 4, "ILS": 4, "AED": 4,
+}
+_CACHE_SIZE = 8192
+
+_CURRENCY_CODES = "USD|EUR|GBP|CAD|AUD|NZD|CHF|SEK|NOK|DKK|PLN|CZK|INR|JPY|SGD|HKD|BRL|MXN|ZAR|ILS|AED"
+_CURRENCY_SYMBOLS = {
+    "us$": "USD", "ca$": "CAD", "c$": "CAD", "au$": "AUD", "a$": "AUD", "nz$": "NZD",
+    "s$": "SGD", "hk$": "HKD", "r$": "BRL", "$": "USD", "€": "EUR", "£": "GBP",
+    "₹": "INR", "¥": "JPY", "zł": "PLN", "₪": "ILS",
+}
+_SYMBOLS = r"US\$|CA\$|C\$|AU\$|A\$|NZ\$|S\$|HK\$|R\$|\$|€|£|₹|¥|zł|₪"
+_CURRENCY = re.compile(rf"\b({_CURRENCY_CODES})\b|({_SYMBOLS})", re.IGNORECASE)
+# A 401(k) plan, not an amount in thousands
+_RETIREMENT_PLAN = re.compile(r"401\s*(?:\(k\)|k\b)", re.IGNORECASE)
+
+# Grouped thousands (incl. Indian lakh grouping "12,00,000"), else a plain number
+_NUMBER = r"\d{1,2}(?:,\d\d)+,\d{3}(?!\d)|\d{1,3}(?:[,.' \u00a0\u202f]\d{3})+(?:[.,]\d{1,2})?(?!\d)|\d+(?:[.,]\d+)?"
+
+
+def _amount(name: str) -> str:
+    return rf"(?P<{name}>{_NUMBER})\s*(?P<{name}_k>[kK](?![a-zA-Z]))?"
+
+
+# The low end may carry its own currency before the dash ("80 000 € - 95 000 €"); the
+# lookahead keeps the common "120,000 - 150,000" from trying every currency there
+_RANGE = re.compile(
+    _amount("low")
+    + rf"(?:(?:\s*(?=[A-Za-z$€£₹¥₪])(?i:{_CURRENCY_CODES}|{_SYMBOLS}))?\s*(?:[-–—~]|to|bis|à)\s*(?:[^\d\s]{{1,3}}\s*)?"
+    + _amount("high") + r")?"
+)
+
+# A cue bound to the amount ("/hr", "per month", "an hour", "hourly", "p.a."),
+# so "25 days vacation" or "5+ years of experience" don't count. The lookahead lets the
+# scan skip positions that can't start a cue instead of trying every alternative there.
+_INTERVAL_CUE = re.compile(
+    r"(?=[/pahdwmy])(?:"
+    r"(?:/\s*|\bper\s+|\ban?\s+)(hour|hr|day|week|wk|month|mo|year|yr|annum)\b"
+    r"|\b(hourly|daily|weekly|monthly|yearly|annual(?:ly)?|p\.\s?a\.))",
+    re.IGNORECASE,
+)
+# ATS interval fields are labels, not prose: "per-hour-wage", "ANNUAL", "month"
+_INTERVAL_LABEL = re.compile(r"hour|hr\b|day|daily|week|month|year|yr\b|annual|annum", re.IGNORECASE)
+_INTERVAL_NAMES = {
+    "hour": "hour", "hr": "hour", "hourly": "hour",
+    "day": "day", "daily": "day",
+    "week": "week", "wk": "week", "weekly": "week",
+    "month": "month", "mo": "month", "monthly": "month",
+    "year": "year", "yr": "year", "yearly": "year", "annum": "year", "annual": "year", "annually": "year",
+    "p.a.": "year",
+}
+
+
+@dataclass(frozen=True)
+class Salary:
+    """Annual amounts, the currency, and the interval the posting stated (or that was inferred)."""
+    min: int | None = None
+    max: int | None = None
+    currency: str = DEFAULT_CURRENCY
+    interval: str | None = None  # hour | day | week | month | year; None without amounts
+
+
+def parse_salary(text: str | None, default_currency: str = DEFAULT_CURRENCY) -> Salary:
+    """Salary from free text; no amounts found → Salary(None, None, currency, None)."""
+    if not text:
+        return Salary(currency=default_currency)
+    return _parse_cached(text, default_currency)
+
+
+def parse_salary_uncached(text: str | None, default_currency: str = DEFAULT_CURRENCY) -> Salary:
+    """parse_salary without the memo, for strings not worth caching (and benchmarks)."""
+    if not text:
+        return Salary(currency=default_currency)
+    return _parse_text(text, default_currency)
+
+
+def salary_from_range(
+    low: Any,
+    high: Any = None,
+    currency: str | None = None,
+    interval: str | None = None,
+    default_currency: str = DEFAULT_CURRENCY,
+) -> Salary:
+    """Salary from an ATS's structured fields; amounts may be numbers or numeric strings."""
+    return _normalize(
+        _to_amount(low),
+        _to_amount(high),
+        normalize_currency(currency, default_currency),
+        normalize_interval(interval),
+    )
+
+
+def normalize_currency(value: str | None, default: str = DEFAULT_CURRENCY) -> str:
+    """ISO code for a code or symbol ("eur", "€", "CA$"); the default if unrecognized."""
+    if not value:
+        return default
+    match = _CURRENCY.search(value)
+    return _currency_of(match) if match else default
+
+
+def normalize_interval(value: str | None) -> str | None:
+    """hour / day / week / month / year for an ATS interval label, None if unrecognized."""
+    if not value:
+        return None
+    match = _INTERVAL_LABEL.search(value)
+    return _INTERVAL_NAMES.get(match.group().lower()) if match else None
+
+
+def _parse_text(text: str, default_currency: str) -> Salary:
+    currency_match = _CURRENCY.search(text)
+    currency = _currency_of(currency_match) if currency_match else default_currency
+
+    match = _salary_range(text)
+    if not match:
+        return Salary(currency=currency)
+    k = bool(match.group("low_k") or match.group("high_k"))
+    low = _to_number(match.group("low"))
+    high = _to_number(match.group("high")) if match.group("high") else None
+    if k:
+        # "120-180k" / "120k-180": the suffix belongs to the whole range, unless an end is already large
+        low = low * 1000 if low is not None and low < 1000 else low
+        high = high * 1000 if high is not None and high < 1000 else high
+
+    cue = _INTERVAL_CUE.search(text)
+    interval = _INTERVAL_NAMES[(cue.group(1) or cue.group(2)).lower().replace(" ", "")] if cue else None
+    return _normalize(low, high, currency, interval)
+
+
+_parse_cached = lru_cache(maxsize=_CACHE_SIZE)(_parse_text)
+
+
+def _salary_range(text: str) -> re.Match[str] | None:
+    """
+    The first amount or range next to a currency; else the first with a "k";
+    else simply the first one. "401k" / "401(k)" never counts.
+    """
+    first = first_k = None
+    for match in _RANGE.finditer(text):
+        start, end = match.span()
+        if text.startswith("401", start) and _RETIREMENT_PLAN.match(text, start):
+            continue
+        if _CURRENCY.search(text, max(0, start - 4), start) or _CURRENCY.search(text, end, end + 4):
+            return match
+        if match.group("low_k") or match.group("high_k"):
+            first_k = first_k or match
+        first = first or match
+    return first_k or first
+
+
+def _normalize(low: float | None, high: float | None, currency: str, interval: str | None) -> Salary:
+    if low is not None and low <= 0:
+        low = None
+    if high is not None and high <= 0:
+        high = None
+    if low is None and high is None:
+        return Salary(currency=currency)
+    if low is not None and high is not None and low > high:
+        low, high = high, low
+
+    scale = _UNITS_PER_USD.get(currency, 1)
+    if interval is None:
+        if (low if low is not None else high) < MIN_ANNUAL * scale:
+            return Salary(currency=currency)
+        interval = "year"
+    multiplier = ANNUAL_MULTIPLIER[interval]
+    annual_low = round(low * multiplier) if low is not None else None
+    annual_high = round(high * multiplier) if high is not None else None
+    if max(annual_low or 0, annual_high or 0) > MAX_ANNUAL * scale:
+        return Salary(currency=currency)
+    return Salary(annual_low, annual_high, currency, interval)
+
+
+def _currency_of(match: re.Match[str]) -> str:
+    code, symbol = match.groups()
+    return code.upper() if code else _CURRENCY_SYMBOLS[symbol.lower()]
+
+
+def _to_amount(value: Any) -> float | None:
+    if isinstance(value, bool) or value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str):
+        match = _RANGE.search(value)
+        if match:
+            number = _to_number(match.group("low"))
+            return number * 1000 if number is not None and match.group("low_k") else number
+    return None
+
+
+def _to_number(token: str) -> float | None:
+    """
+    "120,000" / "120.000" / "120 000" / "1,200.50" / "1.200,50" / "4.5" → float.
+    A separator followed by exactly three digits groups thousands; otherwise
+    the last separator is the decimal point.
+    """
+    if token.isdigit():
+        return float(token)
+    token = token.replace("'", "").replace(" ", "").replace("\u00a0", "").replace("\u202f", "")
+    last = max(token.rfind(","), token.rfind("."))
+    if last == -1:
+        return float(token) if token else None
+    integer, fraction = token[:last], token[last + 1:]
+    if len(fraction) == 3 and (integer.replace(",", "").replace(".", "").isdigit()):
+        return float(integer.replace(",", "").replace(".", "") + fraction)
+    integer = integer.replace(",", "").replace(".", "")
+    try:
+        return float(f"{integer}.{fraction}")
+    except ValueError:
+        return None
@@ -35,7 +35,7 @@ from __future__ import annotations
 
 from typing import Any
 
-from parsers import ParsedJob, detect_remote_type, detect_seniority
+from parsers import ParsedJob
 
 
 def parse_jobs(data: dict | list, slug: str) -> list[ParsedJob]:
@@ -66,10 +66,9 @@ def parse_jobs(data: dict | list, slug: str) -> list[ParsedJob]:
         # Remote type
         loc_data = raw.get("location") or {}
         is_remote = loc_data.get("remote", False) if isinstance(loc_data, dict) else False
-        if is_remote:
-            remote_type = "remote"
-        else:
-            remote_type = detect_remote_type(title, location, raw)
+        remote_type = "remote" if is_remote else None
+        # Custom fields are company-defined ("Workplace": "Hybrid"); only their values count
+        custom_values = [c.get("valueLabel") for c in raw.get("customField") or [] if isinstance(c, dict)]
 
         # Department
         dept = raw.get("department")
@@ -78,7 +77,7 @@ def parse_jobs(data: dict | list, slug: str) -> list[ParsedJob]:
         # Experience level → seniority
         exp_level = raw.get("experienceLevel")
         seniority_raw = exp_level.get("label", "") if isinstance(exp_level, dict) else ""
-        seniority = _map_seniority(seniority_raw) or detect_seniority(title)
+        seniority = _map_seniority(seniority_raw)
 
         # Tags from employment type
         tags: list[str] = []
@@ -91,6 +90,7 @@ def parse_jobs(data: dict | list, slug: str) -> list[ParsedJob]:
             title=title,
             location=location,
             remote_type=remote_type,
+            workplace_hints=[loc_data, custom_values],
             seniority=seniority,
             category=category,
             tags=tags,
@@ -37,10 +37,11 @@ Response (JSON:API format):
 
 from __future__ import annotations
 
-import re
 from typing import Any
 
-from parsers import ParsedJob, detect_remote_type, detect_seniority
+from parsers import ParsedJob
+from parsers.salary import Salary, salary_from_range
+from parsers.text import description_text
 
 
 def parse_jobs(data: dict | list, slug: str) -> list[ParsedJob]:
@@ -81,13 +82,13 @@ def parse_jobs(data: dict | list, slug: str) -> list[ParsedJob]:
             continue
 
         # Description
-        description = _clean_html(attrs.get("body", ""))
+        description = description_text(attrs.get("body", ""))
 
         # Location from relationships
         location = _resolve_location(raw, included_map)
 
         # Salary
-        salary_min, salary_max, salary_currency = _extract_salary(attrs.get("salary"))
+        salary = _extract_salary(attrs.get("salary"))
 
         # Remote
         remote_status = (attrs.get("remote-status") or "").lower()
@@ -98,7 +99,7 @@ def parse_jobs(data: dict | list, slug: str) -> list[ParsedJob]:
         elif remote_status in ("none", "onsite"):
             remote_type = "onsite"
         else:
-            remote_type = detect_remote_type(title, location, attrs)
+            remote_type = None
 
         # Department from relationships
         category = _resolve_department(raw, included_map)
@@ -114,11 +115,12 @@ def parse_jobs(data: dict | list, slug: str) -> list[ParsedJob]:
             title=title,
             location=location,
             description=description,
-            salary_min=salary_min,
-            salary_max=salary_max,
-            salary_currency=salary_currency,
+            salary_min=salary.min,
+            salary_max=salary.max,
+            salary_currency=salary.currency,
+            salary_interval=salary.interval,
             remote_type=remote_type,
-            seniority=detect_seniority(title),
+            workplace_hints=[remote_status],
             category=category,
             tags=tags,
             posted_at=attrs.get("created-at"),
@@ -168,24 +170,7 @@ def _resolve_department(raw: dict, included_map: dict) -> str | None:
     return None
 
 
-def _extract_salary(salary: Any) -> tuple[int | None, int | None, str]:
+def _extract_salary(salary: Any) -> Salary:
     if not salary or not isinstance(salary, dict):
-        return None, None, "USD"
-
-    sal_min = salary.get("min")
-    sal_max = salary.get("max")
-    currency = salary.get("currency", "USD") or "USD"
-
-    return (
-        int(float(sal_min)) if sal_min else None,
-        int(float(sal_max)) if sal_max else None,
-        currency,
-    )
-
-
-def _clean_html(html: str) -> str:
-    if not html:
-        return ""
-    text = re.sub(r"<[^>]+>", " ", html)
-    text = re.sub(r"\s+", " ", text).strip()
-    return text
\ No newline at end of file
+        return Salary()
+    return salary_from_range(salary.get("min"), salary.get("max"), salary.get("currency"))
\ No newline at end of file
@@ -0,0 +1,84 @@
+"""
+HTML → Plain Text
+
+Shared by every parser whose ATS sends HTML descriptions (and by the detail
+fetcher). Compared with stripping tags and collapsing whitespace, it also:
+
+  - drops <script>, <style>, <noscript>, <template> and comments with their content
+  - turns block-level tags (<p>, <li>, <br>, <h1>..., <tr>, ...) into line breaks
+  - decodes entities (&amp;, &nbsp;, &#8217;, ...) after tags are gone, so
+    escaped markup in the text stays text
+
+Every pass is a precompiled regex or a str method, with no per-match Python
+callbacks. With max_chars only a prefix of the HTML is converted, and the
+window grows only if it did not yield enough text. jobs.description keeps
+JOB_DESCRIPTION_CHARS, so long descriptions are mostly never converted in full.
+"""
+
+from __future__ import annotations
+
+import html as _html
+import re
+
+from config import JOB_DESCRIPTION_CHARS
+
+_BLOCK_TAG = re.compile(
+    r"</?(?:p|div|br|li|ul|ol|dl|dt|dd|h[1-6]|tr|table|thead|tbody|tfoot|section|article|aside"
+    r"|header|footer|main|nav|blockquote|pre|hr|figure|figcaption|form|fieldset|address)\b[^>]*>",
+    re.IGNORECASE,
+)
+# Skipped elements up to their end tag (or the end of a truncated window), comments, any other tag
+_OTHER_TAG = re.compile(
+    r"<(?:(script|style|noscript|template)\b.*?(?:</\1\s*>|\Z)|!--.*?(?:-->|\Z)|/?[a-zA-Z][^>]*>|[!?][^>]*>)",
+    re.IGNORECASE | re.DOTALL,
+)
+_BREAK = "\x00"  # placeholder for block boundaries until whitespace is collapsed
+
+# HTML chars converted per requested text char on the first try; doubled until enough
+_WINDOW_FACTOR = 4
+
+
+def html_to_text(html: str | None, max_chars: int | None = None) -> str:
+    """Plain text of an HTML fragment, one line per block; at most max_chars if given."""
+    if not html:
+        return ""
+    if not max_chars:
+        return _convert(html)
+
+    window = max_chars * _WINDOW_FACTOR
+    while True:
+        if window >= len(html):
+            return _convert(html)[:max_chars].rstrip()
+        text = _convert(_cut(html[:window]))
+        if len(text) >= max_chars:
+            return text[:max_chars].rstrip()
+        window *= 2
+
+
+def description_text(html: str | None) -> str:
+    """A description as parsers store it: plain text, JOB_DESCRIPTION_CHARS at most."""
+    return html_to_text(html, JOB_DESCRIPTION_CHARS)
+
+
+def _convert(html: str) -> str:
+    text = html
+    if "<" in text:
+        text = _BLOCK_TAG.sub(_BREAK, text)
+        text = _OTHER_TAG.sub(" ", text)
+    if "&" in text:
+        text = _html.unescape(text)
+    text = " ".join(text.split())
+    if _BREAK in text:
+        text = "\n".join(filter(None, (line.strip() for line in text.split(_BREAK))))
+    return text
+
+
+def _cut(chunk: str) -> str:
+    """Drop a tag or entity left unfinished at the end of a truncation window."""
+    lt = chunk.rfind("<")
+    if lt > chunk.rfind(">"):
+        chunk = chunk[:lt]
+    amp = chunk.rfind("&", len(chunk) - 10)
+    if amp != -1 and ";" not in chunk[amp:]:
+        chunk = chunk[:amp]
+    return chunk
@@ -34,7 +34,7 @@ from __future__ import annotations
 
 from typing import Any
 
-from parsers import ParsedJob, detect_remote_type, detect_seniority
+from parsers import ParsedJob
 
 
 def parse_jobs(data: dict | list, slug: str) -> list[ParsedJob]:
@@ -73,10 +73,10 @@ def parse_jobs(data: dict | list, slug: str) -> list[ParsedJob]:
             remote_type = "remote"
         elif workplace == "hybrid":
             remote_type = "hybrid"
-        elif workplace in ("onsite", "on-site"):
+        elif workplace in ("onsite", "on-site", "on_site"):
             remote_type = "onsite"
         else:
-            remote_type = detect_remote_type(title, location, raw)
+            remote_type = None
 
         # Posted date
         posted_at = raw.get("published") or raw.get("created")
@@ -88,7 +88,7 @@ def parse_jobs(data: dict | list, slug: str) -> list[ParsedJob]:
             title=title,
             location=location,
             remote_type=remote_type,
-            seniority=detect_seniority(title),
+            workplace_hints=[workplace, loc_data],
             category=raw.get("department"),
             posted_at=posted_at,
             raw_data=raw,
@@ -0,0 +1,187 @@
+"""
+Jobsekr — Profiling Hooks
+
+Shared --profile support for the backend entry points. A profiled run writes
+a report directory PROFILE_DIR/<script>-<UTC timestamp>/ containing:
+
+  cprofile.pstats      raw cProfile stats (snakeviz, pstats, gprof2dot)
+  cprofile.txt         top functions by cumulative and by own time
+  slow_callbacks.txt   event-loop steps that blocked longer than --slow-callback
+                       (asyncio debug mode, loop.slow_callback_duration)
+  tracemalloc.txt      with --profile-memory: top allocation sites at each
+                       stage marked with profiling.mark(), and the growth since
+                       the previous mark
+
+cProfile follows the main thread — the event loop and everything it runs.
+Work handed to to_thread (the Supabase client in ats_scraper.py) is only seen
+on Python 3.12+, and parse worker processes (--parse-workers) never; their
+wall time is in scrape_runs.metrics (see metrics.py).
+
+Usage:
+    parser = argparse.ArgumentParser()
+    profiling.add_profile_args(parser)
+    args = parser.parse_args()
+    with profiling.session("ats_scraper", args) as profile:
+        asyncio.run(profile.watch(run_scraper()))
+
+    profiling.mark("fetch")   # anywhere; no-op unless --profile-memory is on
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import cProfile
+import io
+import logging
+import pstats
+import time
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Coroutine, Iterator, TypeVar
+
+from config import PROFILE_DIR, PROFILE_SLOW_CALLBACK_MS
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+TOP_FUNCTIONS = 50
+TOP_ALLOCATIONS = 20
+
+_active: Profiler | None = None
+
+
+def add_profile_args(parser: argparse.ArgumentParser) -> None:
+    group = parser.add_argument_group("profiling")
+    group.add_argument("--profile", nargs="?", const=PROFILE_DIR, default=None, metavar="DIR",
+                       help=f"Write cProfile stats and slow event-loop callbacks under DIR (default: {PROFILE_DIR})")
+    group.add_argument("--profile-memory", action="store_true",
+                       help="With --profile, also record tracemalloc top allocations per stage")
+    group.add_argument("--slow-callback", type=float, default=PROFILE_SLOW_CALLBACK_MS, metavar="MS",
+                       help="With --profile, report event-loop callbacks that block longer than MS")
+
+
+class _SlowCallbackHandler(logging.Handler):
+    """Collects asyncio debug mode's 'Executing <Handle ...> took N seconds' warnings."""
+
+    def __init__(self) -> None:
+        super().__init__(logging.WARNING)
+        self.messages: list[str] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        message = record.getMessage()
+        if message.startswith("Executing "):
+            self.messages.append(message)
+
+
+class Profiler:
+    """One profiled run of an entry point; see the module docstring for the report layout."""
+
+    def __init__(self, name: str, report_dir: str | Path, memory: bool = False, slow_callback_ms: float = 100.0):
+        self.name = name
+        self.report_dir = Path(report_dir) / f"{name}-{time.strftime('%Y%m%dT%H%M%SZ', time.gmtime())}"
+        self.memory = memory
+        self.slow_callback = slow_callback_ms / 1000
+        self.profile = cProfile.Profile()
+        self.slow_callbacks = _SlowCallbackHandler()
+        self.allocations: list[tuple[str, tracemalloc.Snapshot]] = []
+        self.started = 0.0
+
+    def start(self) -> None:
+        global _active
+        _active = self
+        self.started = time.monotonic()
+        logging.getLogger("asyncio").addHandler(self.slow_callbacks)
+        if self.memory:
+            tracemalloc.start()
+            self.mark("start")
+        self.profile.enable()
+
+    def stop(self) -> None:
+        global _active
+        self.profile.disable()
+        if self.memory:
+            self.mark("end")
+            tracemalloc.stop()
+        logging.getLogger("asyncio").removeHandler(self.slow_callbacks)
+        _active = None
+        self.write_report()
+
+    async def watch(self, coro: Coroutine[Any, Any, T]) -> T:
+        """Run `coro` with asyncio debug mode on, so slow callbacks get logged."""
+        loop = asyncio.get_running_loop()
+        loop.set_debug(True)
+        loop.slow_callback_duration = self.slow_callback
+        return await coro
+
+    def mark(self, stage: str) -> None:
+        if self.memory and tracemalloc.is_tracing():
+            self.allocations.append((stage, tracemalloc.take_snapshot()))
+
+    def write_report(self) -> None:
+        self.report_dir.mkdir(parents=True, exist_ok=True)
+        self.profile.dump_stats(self.report_dir / "cprofile.pstats")
+
+        out = io.StringIO()
+        stats = pstats.Stats(self.profile, stream=out).strip_dirs()
+        out.write(f"{self.name}: {time.monotonic() - self.started:.1f}s wall\n\n")
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(TOP_FUNCTIONS)
+        stats.sort_stats(pstats.SortKey.TIME).print_stats(TOP_FUNCTIONS)
+        (self.report_dir / "cprofile.txt").write_text(out.getvalue(), encoding="utf-8")
+
+        lines = [f"{len(self.slow_callbacks.messages)} callbacks over {self.slow_callback * 1000:.0f} ms", ""]
+        lines.extend(self.slow_callbacks.messages)
+        (self.report_dir / "slow_callbacks.txt").write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+        if self.allocations:
+            (self.report_dir / "tracemalloc.txt").write_text(self._allocation_report(), encoding="utf-8")
+
+        logger.info("Profile written to %s (%d slow callbacks)", self.report_dir, len(self.slow_callbacks.messages))
+
+    def _allocation_report(self) -> str:
+        ignore = (
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        )
+        lines: list[str] = []
+        previous: tracemalloc.Snapshot | None = None
+        for stage, snapshot in self.allocations:
+            snapshot = snapshot.filter_traces(ignore)
+            total = sum(stat.size for stat in snapshot.statistics("filename"))
+            lines.append(f"=== {stage}: {total / 1024 / 1024:.1f} MB traced")
+            lines.extend(f"  {stat}" for stat in snapshot.statistics("lineno")[:TOP_ALLOCATIONS])
+            if previous is not None:
+                lines.append("--- growth since the previous mark")
+                lines.extend(f"  {stat}" for stat in snapshot.compare_to(previous, "lineno")[:TOP_ALLOCATIONS])
+            lines.append("")
+            previous = snapshot
+        return "\n".join(lines)
+
+
+class _NoProfile:
+    """Stand-in when --profile is off, so entry points don't branch."""
+
+    def watch(self, coro: Coroutine[Any, Any, T]) -> Coroutine[Any, Any, T]:
+        return coro
+
+
+@contextmanager
+def session(name: str, args: argparse.Namespace) -> Iterator[Profiler | _NoProfile]:
+    """Profile the enclosed block if --profile was given; the report is written on exit."""
+    if not getattr(args, "profile", None):
+        yield _NoProfile()
+        return
+    profiler = Profiler(name, args.profile, memory=args.profile_memory, slow_callback_ms=args.slow_callback)
+    profiler.start()
+    try:
+        yield profiler
+    finally:
+        profiler.stop()
+
+
+def mark(stage: str) -> None:
+    """Snapshot allocations at a stage boundary of the profiled run (no-op otherwise)."""
+    if _active is not None:
+        _active.mark(stage)
@@ -0,0 +1,143 @@
+"""
+Jobsekr — Per-ATS-Host Rate Limiter
+
+Token-bucket scheduler with AIMD (additive increase, multiplicative decrease)
+rate control, one bucket per ATS host. Hosts are keyed from ATS_API_TEMPLATES,
+so every company on a subdomain-based ATS ({slug}.recruitee.com, ...) shares
+the bucket of the ATS behind it.
+
+Usage:
+    limiter = HostRateLimiter()
+    bucket = limiter.get("greenhouse", api_url)
+    await bucket.acquire()
+    ...
+    bucket.on_success()   # or bucket.on_throttle() on 429 / 5xx / timeout
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from urllib.parse import urlparse
+
+from config import (
+    ATS_API_TEMPLATES,
+    SCRAPE_HOST_MAX_RPS,
+    SCRAPE_HOST_MIN_RPS,
+    SCRAPE_RATE_DECREASE,
+    SCRAPE_RATE_INCREASE,
+    SCRAPE_RATE_LIMIT_PER_ATS,
+    SCRAPE_SUBDOMAIN_HOST_MAX_RPS,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def host_key(ats: str, api_url: str = "") -> tuple[str, bool]:
+    """
+    Return (host, is_shared) for an ATS.
+    Subdomain templates collapse to the ATS domain: "{slug}.breezy.hr" → "breezy.hr".
+    is_shared is True for single API hosts like boards-api.greenhouse.io.
+    """
+    template = ATS_API_TEMPLATES.get(ats)
+    if template:
+        netloc = urlparse(template).netloc.lower()
+        if "{slug}." in netloc:
+            return netloc.replace("{slug}.", ""), False
+        return netloc, True
+    return (urlparse(api_url).hostname or ats or "unknown").lower(), False
+
+
+class TokenBucket:
+    """Token bucket whose refill rate adapts to how the host responds."""
+
+    def __init__(self, rate: float, max_rate: float, min_rate: float) -> None:
+        self.rate = rate
+        self.max_rate = max_rate
+        self.min_rate = min_rate
+        self.successes = 0
+        self.throttles = 0
+        self._tokens = 1.0
+        self._updated = time.monotonic()
+        self._last_decrease = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a request to this host is allowed. Waiters are served FIFO."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                # Allow at most one second of burst at the current rate
+                capacity = max(1.0, self.rate)
+                self._tokens = min(capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1.0:
+                    self._tokens -= 1.0
+                    return
+                await asyncio.sleep((1.0 - self._tokens) / self.rate)
+
+    def on_success(self) -> None:
+        """Additive increase."""
+        self.successes += 1
+        self.rate = min(self.max_rate, self.rate + SCRAPE_RATE_INCREASE)
+
+    def on_throttle(self) -> None:
+        """Multiplicative decrease, at most once per refill interval so a burst of
+        in-flight 429s only counts as one congestion signal."""
+        self.throttles += 1
+        now = time.monotonic()
+        if now - self._last_decrease < max(1.0, 1.0 / self.rate):
+            return
+        self._last_decrease = now
+        self.rate = max(self.min_rate, self.rate * SCRAPE_RATE_DECREASE)
+        self._tokens = 0.0
+
+
+class HostRateLimiter:
+    """Registry of per-host token buckets."""
+
+    def __init__(
+        self,
+        initial_rps: float = 1.0 / SCRAPE_RATE_LIMIT_PER_ATS,
+        max_rps: float = SCRAPE_HOST_MAX_RPS,
+        subdomain_max_rps: float = SCRAPE_SUBDOMAIN_HOST_MAX_RPS,
+        min_rps: float = SCRAPE_HOST_MIN_RPS,
+    ) -> None:
+        self.initial_rps = initial_rps
+        self.max_rps = max_rps
+        self.subdomain_max_rps = subdomain_max_rps
+        self.min_rps = min_rps
+        self._buckets: dict[str, TokenBucket] = {}
+
+    def get(self, ats: str, api_url: str = "") -> TokenBucket:
+        """Return the bucket for the host serving this ATS, creating it on first use."""
+        host, is_shared = host_key(ats, api_url)
+        bucket = self._buckets.get(host)
+        if bucket is None:
+            max_rate = self.max_rps if is_shared else self.subdomain_max_rps
+            bucket = TokenBucket(
+                rate=min(self.initial_rps, max_rate),
+                max_rate=max_rate,
+                min_rate=self.min_rps,
+            )
+            self._buckets[host] = bucket
+        return bucket
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        """Final rate and response counts per host."""
+        return {
+            host: {
+                "rate": round(b.rate, 2),
+                "successes": b.successes,
+                "throttles": b.throttles,
+            }
+            for host, b in sorted(self._buckets.items())
+        }
+
+    def log_summary(self) -> None:
+        for host, stats in self.summary().items():
+            logger.info(
+                "  %-32s %5.2f req/s (%d ok, %d throttled)",
+                host, stats["rate"], stats["successes"], stats["throttles"],
+            )
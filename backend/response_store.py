@@ -0,0 +1,101 @@
+"""
+Jobsekr — Record / Replay Store for ATS Responses
+
+`ats_scraper.py --record DIR` saves every ATS response it receives;
+`--replay DIR` serves them back with no network, so parsing and ingest can be
+profiled on production-shaped payloads and parser versions compared on
+identical input.
+
+Layout (one entry per request, keyed by ATS and company slug):
+    DIR/companies.json                 company rows of the recorded run
+    DIR/{ats}/{name}.meta.json         url, status, headers
+    DIR/{ats}/{name}.json.gz           body (200 responses only)
+
+Both modes imply --no-cache: recorded boards are fetched without
+If-None-Match / If-Modified-Since, so every entry has a body, and replayed
+boards are parsed even though companies.json still carries the recorded
+run's ETags and content hashes.
+
+`name` is the slug for a board's first page and "{slug}.{suffix}" for the
+requests that follow it (extra pages, Greenhouse content). The bodies are
+plain gzipped JSON, so bench_json.py --payload-dir DIR can read a recording.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import logging
+import re
+from pathlib import Path
+from typing import Any, Mapping
+
+from multidict import CIMultiDict
+
+logger = logging.getLogger(__name__)
+
+COMPANIES_FILE = "companies.json"
+
+
+class ResponseStore:
+    """A recording directory, opened for writing (record) or reading (replay)."""
+
+    def __init__(self, directory: str | Path, replay: bool = False) -> None:
+        self.directory = Path(directory)
+        self.replay = replay
+        self.saved = 0
+        self.served = 0
+        self.missing = 0
+        if replay and not self.directory.is_dir():
+            raise FileNotFoundError(f"no recording at {self.directory}")
+
+    def _path(self, ats: str, name: str) -> Path:
+        safe = re.sub(r"[^A-Za-z0-9._-]", "_", name)
+        return self.directory / ats / safe
+
+    def save(
+        self,
+        ats: str,
+        name: str,
+        url: str,
+        status: int,
+        headers: Mapping[str, str],
+        body: bytes | None,
+    ) -> None:
+        base = self._path(ats, name)
+        base.parent.mkdir(parents=True, exist_ok=True)
+        meta = {"url": url, "status": status, "headers": dict(headers)}
+        base.with_name(base.name + ".meta.json").write_text(json.dumps(meta, indent=1), encoding="utf-8")
+        if body is not None:
+            base.with_name(base.name + ".json.gz").write_bytes(gzip.compress(body, compresslevel=6))
+        self.saved += 1
+
+    def load(self, ats: str, name: str) -> tuple[int, CIMultiDict[str], bytes | None]:
+        """(status, headers, body) of a recorded response. Unrecorded requests replay as 404."""
+        base = self._path(ats, name)
+        meta_path = base.with_name(base.name + ".meta.json")
+        if not meta_path.exists():
+            self.missing += 1
+            return 404, CIMultiDict(), None
+        meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        body_path = base.with_name(base.name + ".json.gz")
+        body = gzip.decompress(body_path.read_bytes()) if body_path.exists() else None
+        self.served += 1
+        return meta["status"], CIMultiDict(meta.get("headers") or {}), body
+
+    def save_companies(self, companies: list[dict[str, Any]]) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        (self.directory / COMPANIES_FILE).write_text(json.dumps(companies, default=str), encoding="utf-8")
+
+    def load_companies(self) -> list[dict[str, Any]] | None:
+        """Company rows saved with the recording, or None to read them from the DB."""
+        path = self.directory / COMPANIES_FILE
+        if not path.exists():
+            return None
+        return json.loads(path.read_text(encoding="utf-8"))
+
+    def log_summary(self) -> None:
+        if self.replay:
+            logger.info("Replayed %d responses from %s (%d not recorded)", self.served, self.directory, self.missing)
+        else:
+            logger.info("Recorded %d responses to %s", self.saved, self.directory)
@@ -0,0 +1,100 @@
+"""
+Jobsekr — Retry Policy for Transient Scrape Failures
+
+Jittered exponential backoff, Retry-After parsing and a per-run retry budget.
+The scraper re-queues a failed company after the delay instead of sleeping
+inside its concurrency slot, so retries never block other fetches.
+"""
+
+from __future__ import annotations
+
+import logging
+import random
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+from config import (
+    SCRAPE_MAX_RETRIES,
+    SCRAPE_RETRY_BASE_DELAY,
+    SCRAPE_RETRY_BUDGET_RATIO,
+    SCRAPE_RETRY_MAX_DELAY,
+)
+
+logger = logging.getLogger(__name__)
+
+# HTTP statuses worth retrying — everything else is treated as a permanent answer
+RETRYABLE_STATUSES: frozenset[int] = frozenset({429, 500, 502, 503, 504})
+
+
+def backoff_delay(
+    attempt: int,
+    base: float = SCRAPE_RETRY_BASE_DELAY,
+    cap: float = SCRAPE_RETRY_MAX_DELAY,
+) -> float:
+    """Full-jitter exponential backoff: uniform(0, min(cap, base * 2**attempt))."""
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """
+    Parse a Retry-After header into seconds.
+    Accepts delta-seconds ("120") or an HTTP date ("Wed, 21 Oct 2026 07:28:00 GMT").
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+@dataclass
+class RetryBudget:
+    """Caps total retries in a run and records every retry for the run summary."""
+    limit: int
+    max_attempts: int = SCRAPE_MAX_RETRIES
+    spent: int = 0
+    exhausted: int = 0  # retries refused because the budget ran out
+    by_reason: dict[str, int] = field(default_factory=dict)
+
+    @classmethod
+    def for_run(cls, company_count: int) -> RetryBudget:
+        return cls(limit=max(10, int(company_count * SCRAPE_RETRY_BUDGET_RATIO)))
+
+    def next_delay(self, attempt: int, reason: str, retry_after: float | None = None) -> float | None:
+        """
+        Reserve a retry for a company that just failed its `attempt`-th try (0-based).
+        Returns the delay to wait before re-queueing, or None to give up.
+        """
+        if attempt >= self.max_attempts:
+            return None
+        if retry_after is not None and retry_after > SCRAPE_RETRY_MAX_DELAY:
+            return None
+        if self.spent >= self.limit:
+            self.exhausted += 1
+            return None
+
+        self.spent += 1
+        self.by_reason[reason] = self.by_reason.get(reason, 0) + 1
+        if retry_after is not None:
+            # Honour the server's hint, with a little jitter so waiters don't stampede
+            return retry_after + random.uniform(0, SCRAPE_RETRY_BASE_DELAY)
+        return backoff_delay(attempt)
+
+    def log_summary(self) -> None:
+        reasons = ", ".join(f"{r}: {n}" for r, n in sorted(self.by_reason.items(), key=lambda x: -x[1]))
+        logger.info(
+            "Retries: %d / %d budget used%s%s",
+            self.spent, self.limit,
+            f" ({reasons})" if reasons else "",
+            f", {self.exhausted} refused (budget exhausted)" if self.exhausted else "",
+        )
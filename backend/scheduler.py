@@ -0,0 +1,129 @@
+"""
+Jobsekr — Change-Rate-Aware Refresh Scheduler
+
+Estimates how fast each company's board changes (new + removed postings per
+hour, as an EWMA stored in companies.post_rate) and picks the companies due
+in a run:
+
+  - never scraped, or older than the freshness SLO    → always due
+  - post_rate × hours since last scrape ≥ threshold   → due (hot boards)
+  - scraped less than SCRAPE_MIN_INTERVAL_HOURS ago    → never due
+
+Due companies are ordered by expected changes, so a per-run budget spends its
+requests on the boards most likely to have new jobs.
+"""
+
+from __future__ import annotations
+
+import logging
+from datetime import datetime, timezone
+from typing import Any
+
+from config import (
+    SCRAPE_DUE_CHANGES,
+    SCRAPE_FRESHNESS_SLO_HOURS,
+    SCRAPE_MIN_INTERVAL_HOURS,
+    SCRAPE_POST_RATE_ALPHA,
+)
+
+logger = logging.getLogger(__name__)
+
+# Prior for boards without history: assume postings turn over about once a month
+_PRIOR_TURNOVER_HOURS: float = 30 * 24
+
+
+def _parse_ts(value: str | None) -> datetime | None:
+    if not value:
+        return None
+    try:
+        ts = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return ts if ts.tzinfo else ts.replace(tzinfo=timezone.utc)
+
+
+def hours_since_scrape(company: dict[str, Any], now: datetime) -> float | None:
+    """Hours since the company was last scraped, or None if it never was."""
+    last = _parse_ts(company.get("last_scraped_at"))
+    if last is None:
+        return None
+    return max(0.0, (now - last).total_seconds() / 3600)
+
+
+def post_rate(company: dict[str, Any]) -> float:
+    """Estimated changes per hour — stored EWMA, or a prior from job_count."""
+    rate = company.get("post_rate")
+    if isinstance(rate, (int, float)) and rate >= 0:
+        return float(rate)
+    return max(company.get("job_count") or 0, 1) / _PRIOR_TURNOVER_HOURS
+
+
+def next_post_rate(
+    company: dict[str, Any],
+    new_count: int,
+    removed_count: int,
+    now: datetime,
+) -> float:
+    """Fold one scrape's observed changes into the company's EWMA post rate."""
+    hours = hours_since_scrape(company, now)
+    if not hours:
+        # First scrape (or same instant): no interval to measure a rate over
+        return post_rate(company)
+    observed = (new_count + removed_count) / hours
+    alpha = SCRAPE_POST_RATE_ALPHA
+    return round(alpha * observed + (1 - alpha) * post_rate(company), 6)
+
+
+def expected_changes(company: dict[str, Any], now: datetime) -> float:
+    """Postings expected to have appeared or vanished since the last scrape."""
+    hours = hours_since_scrape(company, now)
+    if hours is None:
+        return float("inf")
+    return post_rate(company) * hours
+
+
+def is_due(company: dict[str, Any], now: datetime, slo_hours: float = SCRAPE_FRESHNESS_SLO_HOURS) -> bool:
+    hours = hours_since_scrape(company, now)
+    if hours is None or hours >= slo_hours:
+        return True
+    if hours < SCRAPE_MIN_INTERVAL_HOURS:
+        return False
+    return expected_changes(company, now) >= SCRAPE_DUE_CHANGES
+
+
+def prioritize(
+    companies: list[dict[str, Any]],
+    slo_hours: float = SCRAPE_FRESHNESS_SLO_HOURS,
+    now: datetime | None = None,
+) -> list[dict[str, Any]]:
+    """
+    Order companies by scrape priority: SLO breaches (and never-scraped boards)
+    first, then by expected changes — staleness weighted by post rate.
+    """
+    now = now or datetime.now(timezone.utc)
+
+    def priority(c: dict[str, Any]) -> tuple[bool, float]:
+        hours = hours_since_scrape(c, now)
+        breached = hours is None or hours >= slo_hours
+        return breached, expected_changes(c, now)
+
+    return sorted(companies, key=priority, reverse=True)
+
+
+def select_due_companies(
+    companies: list[dict[str, Any]],
+    slo_hours: float = SCRAPE_FRESHNESS_SLO_HOURS,
+    budget: int | None = None,
+    now: datetime | None = None,
+) -> list[dict[str, Any]]:
+    """
+    Return the companies due for a scrape, most expected changes first.
+    SLO breaches outrank everything else so the budget can't starve quiet boards forever.
+    """
+    now = now or datetime.now(timezone.utc)
+    due = prioritize([c for c in companies if is_due(c, now, slo_hours)], slo_hours, now)
+    if budget is not None and len(due) > budget:
+        logger.info("Budget of %d companies: deferring %d due companies", budget, len(due) - budget)
+        due = due[:budget]
+    logger.info("Scheduler: %d / %d companies due (SLO %.0fh)", len(due), len(companies), slo_hours)
+    return due
@@ -16,6 +16,9 @@ Usage:
 
     # Also seed jobs (not just companies):
     python seed_from_results.py --data-dir ../data --seed-jobs
+
+    # Profile (cProfile + per-phase allocations) into ./profiles:
+    python seed_from_results.py --data-dir ../data --dry-run --profile --profile-memory
 """
 
 from __future__ import annotations
@@ -48,6 +51,8 @@ from config import (
     SlugPattern,
 )
 import db
+import profiling
+from parsers.salary import parse_salary
 
 logging.basicConfig(format=LOG_FORMAT, level=LOG_LEVEL)
 logger = logging.getLogger(__name__)
@@ -282,6 +287,8 @@ class ExtractedJob:
     location: str | None = None
     salary_min: int | None = None
     salary_max: int | None = None
+    salary_currency: str | None = None
+    salary_interval: str | None = None
     remote_type: str | None = None
     easy_apply: bool = False
     category: str | None = None
@@ -341,7 +348,7 @@ def extract_jobs_from_linkedin_results(filepath: Path) -> list[ExtractedJob]:
             continue
 
         # Parse salary if present (e.g., "$120K - $180K")
-        salary_min, salary_max = parse_salary(r.get("salary", ""))
+        salary = parse_salary(r.get("salary"))
 
         remote_type = "unknown"
         location = r.get("location", "")
@@ -354,8 +361,10 @@ def extract_jobs_from_linkedin_results(filepath: Path) -> list[ExtractedJob]:
             ats_source="linkedin",
             company_name=r.get("company"),
             location=location,
-            salary_min=salary_min,
-            salary_max=salary_max,
+            salary_min=salary.min,
+            salary_max=salary.max,
+            salary_currency=salary.currency,
+            salary_interval=salary.interval,
             remote_type=remote_type,
             easy_apply=bool(r.get("easy_apply", False)),
             platform="linkedin",
@@ -364,34 +373,6 @@ def extract_jobs_from_linkedin_results(filepath: Path) -> list[ExtractedJob]:
     return jobs
 
 
-def parse_salary(salary_str: str | None) -> tuple[int | None, int | None]:
-    """
-    Parse salary strings like "$120K - $180K", "$100,000 - $150,000".
-    Returns (min, max) as integers or (None, None).
-    """
-    if not salary_str:
-        return None, None
-
-    # Find all dollar amounts
-    amounts = re.findall(r"\$[\d,]+\.?\d*[kK]?", salary_str)
-    if not amounts:
-        return None, None
-
-    parsed: list[int] = []
-    for amt in amounts:
-        amt = amt.replace("$", "").replace(",", "")
-        if amt.lower().endswith("k"):
-            parsed.append(int(float(amt[:-1]) * 1000))
-        else:
-            parsed.append(int(float(amt)))
-
-    if len(parsed) >= 2:
-        return min(parsed), max(parsed)
-    elif len(parsed) == 1:
-        return parsed[0], None
-    return None, None
-
-
 # ---------------------------------------------------------------------------
 # Deduplication and API URL generation
 # ---------------------------------------------------------------------------
@@ -480,6 +461,7 @@ def seed_companies(
         all_companies.extend(extract_from_linkedin_results(fp))
 
     logger.info("Total raw extractions: %d", len(all_companies))
+    profiling.mark("extract")
 
     # Deduplicate
     unique = deduplicate_companies(all_companies)
@@ -548,6 +530,7 @@ def seed_companies(
             linkedin_upserted += 1
 
     logger.info("Upserted %d LinkedIn company references", linkedin_upserted)
+    profiling.mark("upsert_companies")
 
     # -----------------------------------------------------------------------
     # Phase 3: Optionally seed jobs
@@ -573,6 +556,8 @@ def seed_companies(
                 location=job.location,
                 salary_min=job.salary_min,
                 salary_max=job.salary_max,
+                salary_currency=job.salary_currency,
+                salary_interval=job.salary_interval,
                 remote_type=job.remote_type,
                 easy_apply=job.easy_apply,
                 category=job.category,
@@ -646,6 +631,7 @@ def main() -> None:
         action="store_true",
         help="Also seed jobs from result files (not just companies)",
     )
+    profiling.add_profile_args(parser)
 
     args = parser.parse_args()
 
@@ -653,12 +639,13 @@ def main() -> None:
         logger.error("Data directory does not exist: %s", args.data_dir)
         sys.exit(1)
 
-    seed_companies(
-        data_dir=args.data_dir,
-        file_glob=args.glob,
-        dry_run=args.dry_run,
-        seed_jobs=args.seed_jobs,
-    )
+    with profiling.session("seed_from_results", args):
+        seed_companies(
+            data_dir=args.data_dir,
+            file_glob=args.glob,
+            dry_run=args.dry_run,
+            seed_jobs=args.seed_jobs,
+        )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,46 @@
+"""
+Jobsekr — Deterministic Scrape Sharding
+
+Splits companies across N parallel scraper processes with rendezvous
+(highest-random-weight) hashing on (ats, slug): every runner computes the
+same disjoint slice without coordinating, and changing N only moves about
+1/N of the companies to a different shard.
+
+Usage:
+    python ats_scraper.py --shard 0/4 --run-group "$GITHUB_RUN_ID"
+"""
+
+from __future__ import annotations
+
+import hashlib
+from typing import Any
+
+
+def parse_shard(value: str) -> tuple[int, int]:
+    """Parse "i/N" (0-based i) into (index, count)."""
+    try:
+        index_s, count_s = value.split("/", 1)
+        index, count = int(index_s), int(count_s)
+    except ValueError:
+        raise ValueError(f"shard must look like i/N, got {value!r}") from None
+    if count < 1 or not 0 <= index < count:
+        raise ValueError(f"shard index must be in [0, {count}), got {value!r}")
+    return index, count
+
+
+def shard_of(ats: str, slug: str, count: int) -> int:
+    """Shard owning (ats, slug) — the shard with the highest hash weight."""
+    if count == 1:
+        return 0
+    key = f"{ats}:{slug}".encode()
+
+    def weight(shard: int) -> int:
+        digest = hashlib.blake2b(key, digest_size=8, person=shard.to_bytes(16, "big")).digest()
+        return int.from_bytes(digest, "big")
+
+    return max(range(count), key=weight)
+
+
+def filter_shard(companies: list[dict[str, Any]], index: int, count: int) -> list[dict[str, Any]]:
+    """Companies belonging to shard `index` of `count`."""
+    return [c for c in companies if shard_of(c["ats"], c["slug"], count) == index]
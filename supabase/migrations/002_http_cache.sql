@@ -0,0 +1,12 @@
+-- ============================================================================
+-- SYKR — HTTP validator cache for ATS board fetches
+-- Stores the ETag / Last-Modified returned by each company's ATS API so the
+-- scraper can send conditional requests and skip unchanged boards (HTTP 304).
+-- ============================================================================
+
+ALTER TABLE companies ADD COLUMN IF NOT EXISTS http_etag TEXT;
+ALTER TABLE companies ADD COLUMN IF NOT EXISTS http_last_modified TEXT;
+
+-- Unchanged boards refresh last_seen for a company's active jobs in one update
+CREATE INDEX IF NOT EXISTS idx_jobs_company_active_last_seen
+    ON jobs(company_id, is_active, last_seen);
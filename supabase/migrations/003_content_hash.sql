@@ -0,0 +1,8 @@
+-- ============================================================================
+-- SYKR — Board content fingerprint
+-- SHA-256 of the raw ATS response body from the last successful scrape.
+-- Lets the scraper skip parsing/ingest for boards that send no validators
+-- (Lever, Ashby, Personio, ...) but return an identical payload.
+-- ============================================================================
+
+ALTER TABLE companies ADD COLUMN IF NOT EXISTS content_hash TEXT;
@@ -0,0 +1,8 @@
+-- ============================================================================
+-- SYKR — Change-rate-aware refresh scheduling
+-- post_rate: EWMA of (new + removed postings) per hour, updated every scrape.
+-- The scraper's --schedule mode uses it with last_scraped_at to decide which
+-- companies are due in a run.
+-- ============================================================================
+
+ALTER TABLE companies ADD COLUMN IF NOT EXISTS post_rate REAL;
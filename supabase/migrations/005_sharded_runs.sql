@@ -0,0 +1,33 @@
+-- ============================================================================
+-- SYKR — Sharded scrape runs
+-- Each shard of a parallel scrape (ats_scraper.py --shard i/N) writes its own
+-- scrape_runs row; run_group ties the shards of one invocation together and
+-- scrape_run_groups merges their totals.
+-- ============================================================================
+
+ALTER TABLE scrape_runs ADD COLUMN IF NOT EXISTS run_group TEXT;
+ALTER TABLE scrape_runs ADD COLUMN IF NOT EXISTS shard_index INTEGER;
+ALTER TABLE scrape_runs ADD COLUMN IF NOT EXISTS shard_count INTEGER;
+
+CREATE INDEX IF NOT EXISTS idx_scrape_runs_run_group ON scrape_runs(run_group);
+
+CREATE OR REPLACE VIEW scrape_run_groups AS
+SELECT
+    run_group,
+    source,
+    MAX(shard_count)                                  AS shard_count,
+    COUNT(*)                                          AS shards_started,
+    COUNT(*) FILTER (WHERE status <> 'running')       AS shards_finished,
+    SUM(total_found)                                  AS total_found,
+    SUM(new_found)                                    AS new_found,
+    SUM(errors)                                       AS errors,
+    MIN(started_at)                                   AS started_at,
+    MAX(finished_at)                                  AS finished_at,
+    CASE
+        WHEN COUNT(*) FILTER (WHERE status = 'running') > 0 THEN 'running'
+        WHEN COUNT(*) FILTER (WHERE status <> 'completed') > 0 THEN 'partial'
+        ELSE 'completed'
+    END                                               AS status
+FROM scrape_runs
+WHERE run_group IS NOT NULL
+GROUP BY run_group, source;
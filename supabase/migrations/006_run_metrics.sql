@@ -0,0 +1,12 @@
+-- ============================================================================
+-- SYKR — Per-stage scrape run metrics
+-- ats_scraper.py stores a JSON summary of each run on finish: summed seconds,
+-- calls, items and bytes per stage (fetch, decode, parse, transform,
+-- dedup_check, insert, touch, company_update), wall times and per-host
+-- request latency percentiles. See backend/metrics.py.
+--
+--   SELECT started_at, metrics->'stages'->'insert'->>'seconds' AS insert_s
+--   FROM scrape_runs WHERE source = 'ats_scraper' ORDER BY started_at DESC;
+-- ============================================================================
+
+ALTER TABLE scrape_runs ADD COLUMN IF NOT EXISTS metrics JSONB;
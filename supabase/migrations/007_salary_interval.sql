@@ -0,0 +1,24 @@
+-- ============================================================================
+-- SYKR — Annualized salaries
+-- The scrapers now store salary_min / salary_max as annual amounts in
+-- salary_currency, whatever interval the posting used (see
+-- backend/parsers/salary.py); salary_interval records that interval
+-- (hour, day, week, month, year) so "$50/hr" can still be shown as posted.
+--
+-- Rows written before this have a NULL salary_interval, which marks their
+-- amounts as not normalized (hourly and monthly figures were stored as-is).
+-- db.batch_insert_jobs rewrites the salary columns of every existing job that
+-- is scraped again with a salary. Boards skipped as unchanged (HTTP 304 or an
+-- identical content hash) are never re-parsed, so their stored validators and
+-- hashes are cleared below: every board is parsed once more on the next run
+-- and its active jobs catch up. Jobs that are no longer posted, or whose
+-- salary no longer parses, keep the old amounts. Filters that need comparable
+-- amounts can exclude salary_interval IS NULL.
+-- ============================================================================
+
+ALTER TABLE jobs ADD COLUMN IF NOT EXISTS salary_interval TEXT
+    CHECK (salary_interval IN ('hour', 'day', 'week', 'month', 'year'));
+
+UPDATE companies
+SET content_hash = NULL, http_etag = NULL, http_last_modified = NULL
+WHERE content_hash IS NOT NULL OR http_etag IS NOT NULL OR http_last_modified IS NOT NULL;